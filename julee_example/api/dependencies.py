@@ -52,6 +52,9 @@ from minio import Minio
 
 logger = logging.getLogger(__name__)
 
+# Marks a missing container entry, so a cached None is still a hit
+_MISSING = object()
+
 
 class DependencyContainer:
     """
@@ -59,14 +62,18 @@ class DependencyContainer:
     Always creates real clients; mocks are provided by test overrides.
     """
 
+    __slots__ = ("_instances",)
+
     def __init__(self) -> None:
         self._instances: Dict[str, Any] = {}
 
     async def get_or_create(self, key: str, factory: Any) -> Any:
         """Get or create a singleton instance."""
-        if key not in self._instances:
-            self._instances[key] = await factory()
-        return self._instances[key]
+        instance = self._instances.get(key, _MISSING)
+        if instance is _MISSING:
+            instance = await factory()
+            self._instances[key] = instance
+        return instance
 
     async def get_temporal_client(self) -> Client:
         """Get or create Temporal client."""
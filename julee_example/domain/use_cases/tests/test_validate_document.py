@@ -6,11 +6,16 @@ ensuring proper business logic execution and repository interaction patterns
 following the Clean Architecture principles.
 """
 
+import asyncio
+import functools
+import gc
 import io
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime, timezone
+from typing import List, Tuple
 from pydantic import ValidationError
+from temporalio import workflow
 
 from julee_example.domain.use_cases import ValidateDocumentUseCase
 
@@ -1287,3 +1292,476 @@ class TestValidateDocumentUseCase:
             await configured_use_case.validate_document(
                 document_id="doc-789", policy_id="policy-789"
             )
+
+    def test_extract_score_tolerates_surrounding_whitespace(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that score parsing accepts whitespace-padded integers."""
+        assert (
+            use_case._extract_score_from_result({"response": " 85\n"}) == 85
+        )
+
+    @pytest.mark.parametrize("response", ["85", "-5", " 85\n", "+7"])
+    def test_extract_score_parses_integer_responses(
+        self, use_case: ValidateDocumentUseCase, response: str
+    ) -> None:
+        """Test that plain, signed and padded integers are all parsed."""
+        assert use_case._extract_score_from_result(
+            {"response": response}
+        ) == int(response)
+
+    def test_extract_score_rejects_non_ascii_digits(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that digit-like characters int() can't parse are rejected."""
+        with pytest.raises(ValueError, match="Failed to parse numeric score"):
+            use_case._extract_score_from_result({"response": "8\u00b2"})
+
+    def test_extract_score_rejects_non_numeric_response(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that score parsing rejects non-integer responses."""
+        with pytest.raises(ValueError, match="Failed to parse numeric score"):
+            use_case._extract_score_from_result({"response": "85 points"})
+
+    def test_determine_validation_result_compares_scores_pairwise(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test pass/fail is decided query by query in policy order."""
+        required = [("q1", 70), ("q2", 80)]
+
+        assert use_case._determine_validation_result(
+            [("q1", 70), ("q2", 95)], required
+        )
+        assert not use_case._determine_validation_result(
+            [("q1", 90), ("q2", 79)], required
+        )
+
+    def test_determine_validation_result_rejects_misaligned_scores(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that scores out of policy order are reported as an error."""
+        with pytest.raises(ValueError, match="q2 found where q1"):
+            use_case._determine_validation_result(
+                [("q2", 90), ("q1", 90)], [("q1", 70), ("q2", 80)]
+            )
+
+    def test_max_concurrency_must_be_positive(
+        self,
+        document_repo: MemoryDocumentRepository,
+        knowledge_service_query_repo: MemoryKnowledgeServiceQueryRepository,
+        knowledge_service_config_repo: MemoryKnowledgeServiceConfigRepository,
+        policy_repo: MemoryPolicyRepository,
+        document_policy_validation_repo: (
+            MemoryDocumentPolicyValidationRepository
+        ),
+        knowledge_service: MemoryKnowledgeService,
+    ) -> None:
+        """Test that the use case rejects a non-positive concurrency cap."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            ValidateDocumentUseCase(
+                document_repo=document_repo,
+                knowledge_service_query_repo=knowledge_service_query_repo,
+                knowledge_service_config_repo=knowledge_service_config_repo,
+                policy_repo=policy_repo,
+                document_policy_validation_repo=(
+                    document_policy_validation_repo
+                ),
+                knowledge_service=knowledge_service,
+                now_fn=lambda: datetime.now(timezone.utc),
+                max_concurrency=0,
+            )
+
+    def test_service_concurrency_defaults_to_max_concurrency(
+        self,
+        document_repo: MemoryDocumentRepository,
+        knowledge_service_query_repo: MemoryKnowledgeServiceQueryRepository,
+        knowledge_service_config_repo: MemoryKnowledgeServiceConfigRepository,
+        policy_repo: MemoryPolicyRepository,
+        document_policy_validation_repo: (
+            MemoryDocumentPolicyValidationRepository
+        ),
+        knowledge_service: MemoryKnowledgeService,
+    ) -> None:
+        """Test that the per-service cap follows max_concurrency unless
+        set explicitly."""
+        use_case = ValidateDocumentUseCase(
+            document_repo=document_repo,
+            knowledge_service_query_repo=knowledge_service_query_repo,
+            knowledge_service_config_repo=knowledge_service_config_repo,
+            policy_repo=policy_repo,
+            document_policy_validation_repo=document_policy_validation_repo,
+            knowledge_service=knowledge_service,
+            now_fn=lambda: datetime.now(timezone.utc),
+            max_concurrency=3,
+        )
+
+        assert use_case.max_concurrency_per_service == 3
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_caps_in_flight_calls(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that concurrent calls never exceed max_concurrency."""
+        use_case.max_concurrency = 2
+        in_flight = 0
+        peak = 0
+
+        async def call(value: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return value
+
+        results = await use_case._gather_bounded(
+            functools.partial(call, i) for i in range(5)
+        )
+
+        assert results == [0, 1, 2, 3, 4]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_cancels_siblings_on_failure(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that one failing call cancels the calls still running and
+        never starts the ones still queued."""
+        use_case.max_concurrency = 2
+        started = []
+        cancelled = []
+
+        async def never_finishes(name: str) -> str:
+            started.append(name)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return name
+
+        async def fails() -> str:
+            await asyncio.sleep(0)
+            raise RuntimeError("Knowledge service unavailable")
+
+        with pytest.raises(RuntimeError, match="unavailable"):
+            await use_case._gather_bounded(
+                [
+                    functools.partial(never_finishes, "running"),
+                    fails,
+                    functools.partial(never_finishes, "queued-1"),
+                    functools.partial(never_finishes, "queued-2"),
+                ]
+            )
+
+        # The slot the failing call frees may let one queued call start
+        # before the rest are cancelled, but nothing is left running
+        assert sorted(cancelled) == sorted(started)
+        assert "running" in cancelled
+        assert "queued-2" not in started
+
+    def test_pending_state_persisted_by_default(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that the PENDING state is saved unless callers opt out."""
+        assert use_case.persist_pending
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "persist_pending,expected_statuses",
+        [
+            (
+                False,
+                [
+                    DocumentPolicyValidationStatus.IN_PROGRESS,
+                    DocumentPolicyValidationStatus.ERROR,
+                ],
+            ),
+            (
+                True,
+                [
+                    DocumentPolicyValidationStatus.PENDING,
+                    DocumentPolicyValidationStatus.IN_PROGRESS,
+                    DocumentPolicyValidationStatus.ERROR,
+                ],
+            ),
+        ],
+    )
+    async def test_initial_record_saved_once_unless_pending_persisted(
+        self,
+        document_repo: MemoryDocumentRepository,
+        knowledge_service_query_repo: MemoryKnowledgeServiceQueryRepository,
+        knowledge_service_config_repo: MemoryKnowledgeServiceConfigRepository,
+        policy_repo: MemoryPolicyRepository,
+        document_policy_validation_repo: (
+            MemoryDocumentPolicyValidationRepository
+        ),
+        knowledge_service: MemoryKnowledgeService,
+        persist_pending: bool,
+        expected_statuses: list,
+    ) -> None:
+        """Test that PENDING is only saved when persist_pending is set."""
+        content_bytes = b"Sample content"
+        await document_repo.save(
+            Document(
+                document_id="doc-pending",
+                original_filename="test.txt",
+                content_type="text/plain",
+                size_bytes=len(content_bytes),
+                content_multihash="test-hash",
+                status=DocumentStatus.CAPTURED,
+                content=ContentStream(io.BytesIO(content_bytes)),
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        # The query doesn't exist, so validation errors out right after
+        # the initial record is saved
+        await policy_repo.save(
+            Policy(
+                policy_id="policy-pending",
+                title="Test Policy",
+                description="Policy with non-existent query",
+                status=PolicyStatus.ACTIVE,
+                validation_scores=[("nonexistent-query", 80)],
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+
+        saved_statuses = []
+        original_save = document_policy_validation_repo.save
+
+        async def recording_save(
+            validation: DocumentPolicyValidation,
+        ) -> None:
+            saved_statuses.append(validation.status)
+            await original_save(validation)
+
+        document_policy_validation_repo.save = recording_save  # type: ignore[method-assign]
+
+        use_case = ValidateDocumentUseCase(
+            document_repo=document_repo,
+            knowledge_service_query_repo=knowledge_service_query_repo,
+            knowledge_service_config_repo=knowledge_service_config_repo,
+            policy_repo=policy_repo,
+            document_policy_validation_repo=document_policy_validation_repo,
+            knowledge_service=knowledge_service,
+            now_fn=lambda: datetime.now(timezone.utc),
+            persist_pending=persist_pending,
+        )
+
+        with pytest.raises(ValueError, match="Validation query not found"):
+            await use_case.validate_document(
+                document_id="doc-pending", policy_id="policy-pending"
+            )
+
+        assert saved_statuses == expected_statuses
+        stored = list(document_policy_validation_repo.storage_dict.values())
+        assert [v.status for v in stored] == [
+            DocumentPolicyValidationStatus.ERROR
+        ]
+        assert stored[0].error_message is not None
+
+    @pytest.mark.asyncio
+    async def test_queries_fetched_in_one_batch(
+        self,
+        use_case: ValidateDocumentUseCase,
+        knowledge_service_query_repo: MemoryKnowledgeServiceQueryRepository,
+    ) -> None:
+        """Test that all policy queries are fetched with one get_many."""
+        for query_id in ["query-1", "query-2"]:
+            await knowledge_service_query_repo.save(
+                KnowledgeServiceQuery(
+                    query_id=query_id,
+                    name=f"Query {query_id}",
+                    knowledge_service_id="test-ks",
+                    prompt="Rate this document",
+                )
+            )
+        policy = Policy(
+            policy_id="policy-batch",
+            title="Test Policy",
+            description="Policy with several queries",
+            status=PolicyStatus.ACTIVE,
+            validation_scores=[("query-1", 80), ("query-2", 70)],
+            transformation_queries=["query-1"],
+        )
+        knowledge_service_query_repo.get_many = AsyncMock(  # type: ignore[method-assign]
+            wraps=knowledge_service_query_repo.get_many
+        )
+
+        queries = await use_case._retrieve_all_queries(policy)
+
+        assert list(queries) == ["query-1", "query-2"]
+        knowledge_service_query_repo.get_many.assert_awaited_once_with(
+            ["query-1", "query-2"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_gather_until_failure_cancels_outstanding_queries(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that the first failing score cancels the other queries."""
+        cancelled = False
+
+        async def never_finishes() -> tuple:
+            nonlocal cancelled
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            return ("slow-query", 100)
+
+        async def fails() -> tuple:
+            return ("failing-query", 10)
+
+        scores = await use_case._gather_until_failure(
+            [never_finishes, fails], [50, 50]
+        )
+
+        assert scores == [("failing-query", 10)]
+        assert cancelled
+
+    @pytest.mark.asyncio
+    async def test_gather_until_failure_returns_all_passing_scores(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that passing scores are all returned in policy order."""
+
+        async def score(query_id: str, value: int) -> tuple:
+            await asyncio.sleep(0)
+            return (query_id, value)
+
+        scores = await use_case._gather_until_failure(
+            [
+                functools.partial(score, "q1", 90),
+                functools.partial(score, "q2", 80),
+            ],
+            [80, 80],
+        )
+
+        assert scores == [("q1", 90), ("q2", 80)]
+
+    @pytest.mark.asyncio
+    async def test_gather_until_failure_uses_injected_as_completed(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that results are taken through the injected as_completed,
+        so workflows can supply a deterministic one."""
+        as_completed = MagicMock(wraps=workflow.as_completed)
+        use_case.as_completed = as_completed
+
+        async def score(query_id: str, value: int) -> tuple:
+            await asyncio.sleep(0)
+            return (query_id, value)
+
+        scores = await use_case._gather_until_failure(
+            [
+                functools.partial(score, "q1", 90),
+                functools.partial(score, "q2", 10),
+            ],
+            [80, 80],
+        )
+
+        assert scores == [("q1", 90), ("q2", 10)]
+        as_completed.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.filterwarnings("error::RuntimeWarning")
+    @pytest.mark.filterwarnings(
+        "error::pytest.PytestUnraisableExceptionWarning"
+    )
+    async def test_gather_until_failure_leaves_no_unawaited_queries(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that queries still queued when the run stops early are
+        never started, rather than left as unawaited coroutines."""
+        use_case.max_concurrency = 1
+        started = []
+
+        async def fails() -> tuple:
+            started.append("q1")
+            return ("q1", 10)
+
+        async def never_finishes(query_id: str) -> tuple:
+            started.append(query_id)
+            await asyncio.Event().wait()
+            return (query_id, 100)
+
+        scores = await use_case._gather_until_failure(
+            [
+                fails,
+                functools.partial(never_finishes, "q2"),
+                functools.partial(never_finishes, "q3"),
+            ],
+            [80, 80, 80],
+        )
+        # Any coroutine created but never awaited warns when collected
+        gc.collect()
+
+        assert scores == [("q1", 10)]
+        assert "q3" not in started
+
+    def test_determine_validation_result_fails_cut_short_scores(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that fail_fast treats a short score list as a failure."""
+        use_case.fail_fast = True
+
+        assert not use_case._determine_validation_result(
+            [("q2", 10)], [("q1", 80), ("q2", 80)]
+        )
+
+    @pytest.mark.parametrize(
+        "actual, message",
+        [
+            ([("q3", 10), ("q1", 10)], "q1 is out of policy order"),
+            ([("q9", 10)], "q9 is out of policy order"),
+            ([("q1", 90)], "none of them failed"),
+        ],
+    )
+    def test_determine_validation_result_rejects_bad_cut_short_scores(
+        self,
+        use_case: ValidateDocumentUseCase,
+        actual: List[Tuple[str, int]],
+        message: str,
+    ) -> None:
+        """Test that fail_fast still checks a short score list against the
+        policy's queries."""
+        use_case.fail_fast = True
+
+        with pytest.raises(ValueError, match=message):
+            use_case._determine_validation_result(
+                actual, [("q1", 80), ("q2", 80), ("q3", 80)]
+            )
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_caps_calls_per_service(
+        self, use_case: ValidateDocumentUseCase
+    ) -> None:
+        """Test that each knowledge service gets its own concurrency cap."""
+        use_case.max_concurrency_per_service = 2
+        use_case.service_concurrency_limits = {"ks-slow": 1}
+        in_flight: dict = {}
+        peak: dict = {}
+
+        async def call(service_id: str) -> str:
+            in_flight[service_id] = in_flight.get(service_id, 0) + 1
+            peak[service_id] = max(
+                peak.get(service_id, 0), in_flight[service_id]
+            )
+            await asyncio.sleep(0)
+            in_flight[service_id] -= 1
+            return service_id
+
+        service_ids = ["ks-fast"] * 4 + ["ks-slow"] * 3
+        results = await use_case._gather_bounded(
+            (functools.partial(call, sid) for sid in service_ids),
+            service_ids,
+        )
+
+        assert results == service_ids
+        assert peak == {"ks-fast": 2, "ks-slow": 1}
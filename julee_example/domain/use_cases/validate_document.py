@@ -7,18 +7,32 @@ remaining framework-agnostic. Dependencies are injected via repository
 instances following the Clean Architecture principles.
 """
 
+import asyncio
+import functools
 import hashlib
 import io
-import json
 import logging
 import multihash
+import orjson
 from datetime import datetime
-from typing import Callable, Dict, List, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from julee_example.domain.models import (
     Document,
     DocumentStatus,
     ContentStream,
+    KnowledgeServiceConfig,
     KnowledgeServiceQuery,
     DocumentPolicyValidation,
     Policy,
@@ -39,6 +53,31 @@ from .decorators import try_use_case_step
 
 logger = logging.getLogger(__name__)
 
+# Default cap on concurrent calls to external knowledge services
+DEFAULT_MAX_CONCURRENCY = 8
+
+V = TypeVar("V")
+
+# Yields awaitables in the order their results become available, like
+# asyncio.as_completed
+AsCompletedFn = Callable[[Iterable[Awaitable[Any]]], Iterator[Awaitable[Any]]]
+
+
+def _set_scores(
+    validation: DocumentPolicyValidation,
+    field_name: str,
+    scores: List[Tuple[str, int]],
+) -> None:
+    """Set a score field on validation, running only that field's
+    validators.
+
+    Assignments to the record are otherwise not validated, so scores
+    returned by the knowledge services are checked here as they are set.
+    """
+    DocumentPolicyValidation.__pydantic_validator__.validate_assignment(
+        validation, field_name, scores
+    )
+
 
 class ValidateDocumentUseCase:
     """
@@ -74,6 +113,12 @@ class ValidateDocumentUseCase:
         document_policy_validation_repo: DocumentPolicyValidationRepository,
         knowledge_service: KnowledgeService,
         now_fn: Callable[[], datetime],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_concurrency_per_service: Optional[int] = None,
+        service_concurrency_limits: Optional[Dict[str, int]] = None,
+        persist_pending: bool = True,
+        fail_fast: bool = False,
+        as_completed: AsCompletedFn = asyncio.as_completed,
     ) -> None:
         """Initialize validate document use case.
 
@@ -90,6 +135,28 @@ class ValidateDocumentUseCase:
                 operations
             now_fn: Function to get current time (e.g., workflow.now for
                 Temporal workflows)
+            max_concurrency: Maximum number of knowledge service calls
+                allowed in flight at once
+            max_concurrency_per_service: Maximum number of calls allowed in
+                flight at once against any single knowledge service, so one
+                document can't flood a rate-limited service. Defaults to
+                max_concurrency.
+            service_concurrency_limits: Per knowledge_service_id overrides
+                of max_concurrency_per_service, for services that need a
+                tighter (or looser) cap
+            persist_pending: Save the validation record in PENDING state
+                before moving it to IN_PROGRESS, so anything watching the
+                validation sees every state. Pass False to create the record
+                directly IN_PROGRESS and save one write (an activity under
+                Temporal).
+            fail_fast: Stop executing validation queries as soon as one
+                scores below its required score. Outstanding queries are
+                cancelled and only the scores received so far are
+                recorded. Off by default, so every score is recorded.
+            as_completed: Function that yields query results as they
+                finish, used by fail_fast (e.g., workflow.as_completed for
+                Temporal workflows, where asyncio.as_completed is not
+                deterministic)
 
         Note:
             The repositories passed here may be concrete implementations
@@ -123,6 +190,29 @@ class ValidateDocumentUseCase:
             DocumentPolicyValidationRepository,  # type: ignore[type-abstract]
         )
         self.now_fn = now_fn
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        if max_concurrency_per_service is None:
+            max_concurrency_per_service = max_concurrency
+        if max_concurrency_per_service < 1:
+            raise ValueError("max_concurrency_per_service must be at least 1")
+        self.max_concurrency_per_service = max_concurrency_per_service
+        self.service_concurrency_limits = dict(
+            service_concurrency_limits or {}
+        )
+        for (
+            knowledge_service_id,
+            limit,
+        ) in self.service_concurrency_limits.items():
+            if limit < 1:
+                raise ValueError(
+                    f"Concurrency limit for {knowledge_service_id} must be "
+                    f"at least 1"
+                )
+        self.persist_pending = persist_pending
+        self.fail_fast = fail_fast
+        self.as_completed = as_completed
 
     async def validate_document(
         self, document_id: str, policy_id: str
@@ -164,16 +254,25 @@ class ValidateDocumentUseCase:
             await self.document_policy_validation_repo.generate_id()
         )
 
-        # Step 2: Retrieve document and policy (validate they exist)
-        document = await self._retrieve_document(document_id)
-        policy = await self._retrieve_policy(policy_id)
+        # Step 2: Retrieve document and policy (validate they exist). The
+        # lookups are independent, so run them concurrently.
+        document, policy = await asyncio.gather(
+            self._retrieve_document(document_id),
+            self._retrieve_policy(policy_id),
+        )
 
-        # Step 3: Create and store initial validation record
+        # Step 3: Create and store initial validation record. Unless the
+        # PENDING state is to be persisted, it starts out IN_PROGRESS so a
+        # single save covers both states.
         validation = DocumentPolicyValidation(
             validation_id=validation_id,
             input_document_id=document_id,
             policy_id=policy_id,
-            status=DocumentPolicyValidationStatus.PENDING,
+            status=(
+                DocumentPolicyValidationStatus.PENDING
+                if self.persist_pending
+                else DocumentPolicyValidationStatus.IN_PROGRESS
+            ),
             validation_scores=[],
             started_at=self.now_fn(),
         )
@@ -192,16 +291,23 @@ class ValidateDocumentUseCase:
 
         try:
             # Step 4: Update status to in progress
-            validation.status = DocumentPolicyValidationStatus.IN_PROGRESS
-            await self.document_policy_validation_repo.save(validation)
+            if validation.status == DocumentPolicyValidationStatus.PENDING:
+                validation.status = DocumentPolicyValidationStatus.IN_PROGRESS
+                await self.document_policy_validation_repo.save(validation)
 
-            # Step 5: Retrieve all queries needed for this policy
+            # Step 5: Retrieve all queries needed for this policy and the
+            # configs of the services they use, collected once for every
+            # phase below
             all_queries = await self._retrieve_all_queries(policy)
+            service_ids = self._collect_service_ids(all_queries)
+            service_configs = await self._retrieve_service_configs(
+                service_ids
+            )
 
             # Step 6: Register the document with knowledge services
             document_registrations = (
                 await self._register_document_with_services(
-                    document, all_queries
+                    document, service_configs
                 )
             )
 
@@ -211,18 +317,21 @@ class ValidateDocumentUseCase:
                 policy,
                 document_registrations,
                 all_queries,
+                service_configs,
             )
 
             # Step 9: Update validation with scores
-            validation.validation_scores = validation_scores
+            _set_scores(validation, "validation_scores", validation_scores)
             validation.status = (
                 DocumentPolicyValidationStatus.VALIDATION_COMPLETE
             )
             await self.document_policy_validation_repo.save(validation)
 
-            # Step 10: Check if transformations are needed
+            # Step 10: Check if transformations are needed. The required
+            # scores are also needed again after any transformation.
+            required_scores = policy.validation_scores
             initial_passed = self._determine_validation_result(
-                validation_scores, policy.validation_scores
+                validation_scores, required_scores
             )
 
             if initial_passed or not policy.has_transformations:
@@ -234,18 +343,13 @@ class ValidateDocumentUseCase:
                     else DocumentPolicyValidationStatus.FAILED
                 )
 
-                validation = DocumentPolicyValidation(
-                    validation_id=validation.validation_id,
-                    input_document_id=validation.input_document_id,
-                    policy_id=validation.policy_id,
-                    validation_scores=validation_scores,
-                    transformed_document_id=validation.transformed_document_id,
-                    post_transform_validation_scores=validation.post_transform_validation_scores,
-                    started_at=validation.started_at,
-                    completed_at=self.now_fn(),
-                    error_message=validation.error_message,
-                    status=final_status,
-                    passed=initial_passed,
+                completed_at = self.now_fn()
+                validation = validation.model_copy(
+                    update={
+                        "status": final_status,
+                        "passed": initial_passed,
+                        "completed_at": completed_at,
+                    }
                 )
 
                 await self.document_policy_validation_repo.save(validation)
@@ -258,6 +362,7 @@ class ValidateDocumentUseCase:
                         "policy_id": policy_id,
                         "passed": initial_passed,
                         "validation_scores": validation_scores,
+                        "completed_at": completed_at.isoformat(),
                     },
                 )
 
@@ -291,6 +396,7 @@ class ValidateDocumentUseCase:
                 policy,
                 all_queries,
                 document_registrations,
+                service_configs,
             )
 
             validation.transformed_document_id = (
@@ -304,7 +410,7 @@ class ValidateDocumentUseCase:
             # Step 13: Register transformed document with knowledge services
             transformed_document_registrations = (
                 await self._register_document_with_services(
-                    transformed_document, all_queries
+                    transformed_document, service_configs
                 )
             )
 
@@ -318,13 +424,14 @@ class ValidateDocumentUseCase:
                     policy,
                     transformed_document_registrations,
                     all_queries,
+                    service_configs,
                 )
             )
 
             # Step 15: Determine final result based on post-transformation
             # scores
             final_passed = self._determine_validation_result(
-                post_transform_validation_scores, policy.validation_scores
+                post_transform_validation_scores, required_scores
             )
 
             final_status = (
@@ -333,18 +440,18 @@ class ValidateDocumentUseCase:
                 else DocumentPolicyValidationStatus.FAILED
             )
 
-            validation = DocumentPolicyValidation(
-                validation_id=validation.validation_id,
-                input_document_id=validation.input_document_id,
-                policy_id=validation.policy_id,
-                validation_scores=validation_scores,
-                transformed_document_id=transformed_document.document_id,
-                post_transform_validation_scores=post_transform_validation_scores,
-                started_at=validation.started_at,
-                completed_at=self.now_fn(),
-                error_message=validation.error_message,
-                status=final_status,
-                passed=final_passed,
+            _set_scores(
+                validation,
+                "post_transform_validation_scores",
+                post_transform_validation_scores,
+            )
+            completed_at = self.now_fn()
+            validation = validation.model_copy(
+                update={
+                    "status": final_status,
+                    "passed": final_passed,
+                    "completed_at": completed_at,
+                }
             )
 
             await self.document_policy_validation_repo.save(validation)
@@ -361,6 +468,7 @@ class ValidateDocumentUseCase:
                     "transformed_document_id": (
                         transformed_document.document_id
                     ),
+                    "completed_at": completed_at.isoformat(),
                 },
             )
 
@@ -368,10 +476,15 @@ class ValidateDocumentUseCase:
 
         except Exception as e:
             # Mark validation as failed due to error
+            error_message = str(e)
+            completed_at = self.now_fn()
             validation.status = DocumentPolicyValidationStatus.ERROR
-            validation.error_message = str(e)
+            validation.error_message = error_message
             validation.passed = False
-            validation.completed_at = self.now_fn()
+            validation.completed_at = completed_at
+            # The failure may have struck before the in-memory validation
+            # was saved, so write the whole object rather than only the
+            # status fields over whatever was last stored
             await self.document_policy_validation_repo.save(validation)
 
             logger.error(
@@ -380,7 +493,8 @@ class ValidateDocumentUseCase:
                     "validation_id": validation_id,
                     "document_id": document_id,
                     "policy_id": policy_id,
-                    "error": str(e),
+                    "error": error_message,
+                    "completed_at": completed_at.isoformat(),
                 },
                 exc_info=True,
             )
@@ -407,33 +521,101 @@ class ValidateDocumentUseCase:
         self, policy: Policy
     ) -> Dict[str, KnowledgeServiceQuery]:
         """Retrieve all knowledge service queries needed for validation and
-        transformation."""
-        all_queries = {}
+        transformation.
 
-        # Get validation queries
-        for query_id, required_score in policy.validation_scores:
-            query = await self.knowledge_service_query_repo.get(query_id)
-            if not query:
+        The queries are fetched with a single batch lookup rather than one
+        round trip per query.
+        """
+        validation_query_ids = [
+            query_id for query_id, _ in policy.validation_scores
+        ]
+        transformation_query_ids = policy.transformation_queries or []
+
+        # De-duplicate while preserving policy order so a query used for
+        # both validation and transformation is only fetched once
+        query_ids = list(
+            dict.fromkeys(validation_query_ids + transformation_query_ids)
+        )
+        fetched = await self.knowledge_service_query_repo.get_many(query_ids)
+
+        all_queries = {}
+        for query_id in validation_query_ids:
+            query = fetched[query_id]
+            if query is None:
                 raise ValueError(f"Validation query not found: {query_id}")
             all_queries[query_id] = query
 
-        # Get transformation queries
-        if policy.transformation_queries:
-            for query_id in policy.transformation_queries:
-                query = await self.knowledge_service_query_repo.get(query_id)
-                if not query:
-                    raise ValueError(
-                        f"Transformation query not found: {query_id}"
-                    )
-                all_queries[query_id] = query
+        for query_id in transformation_query_ids:
+            query = fetched[query_id]
+            if query is None:
+                raise ValueError(
+                    f"Transformation query not found: {query_id}"
+                )
+            all_queries[query_id] = query
 
         return all_queries
 
+    def _collect_service_ids(
+        self, queries: Dict[str, KnowledgeServiceQuery]
+    ) -> List[str]:
+        """
+        List the knowledge services the queries run against.
+
+        The IDs are de-duplicated in query order rather than collected into
+        a set, so activities are always scheduled in the same order when a
+        workflow is replayed.
+
+        Args:
+            queries: Dict of query_id to KnowledgeServiceQuery objects
+
+        Returns:
+            Unique knowledge_service_ids in the order they first appear
+        """
+        return list(
+            dict.fromkeys(
+                query.knowledge_service_id for query in queries.values()
+            )
+        )
+
+    @try_use_case_step("service_config_retrieval")
+    async def _retrieve_service_configs(
+        self, service_ids: List[str]
+    ) -> Dict[str, KnowledgeServiceConfig]:
+        """
+        Retrieve the configuration of every knowledge service the policy
+        uses.
+
+        The configs are fetched once, in a single batch lookup, and shared
+        by every registration, validation and transformation step that
+        follows.
+
+        Args:
+            service_ids: Unique IDs of the knowledge services to look up
+
+        Returns:
+            Dict mapping knowledge_service_id to its KnowledgeServiceConfig
+        """
+        configs = await self.knowledge_service_config_repo.get_many(
+            service_ids
+        )
+
+        service_configs = {}
+        for knowledge_service_id in service_ids:
+            config = configs[knowledge_service_id]
+            if not config:
+                raise ValueError(
+                    f"Knowledge service config not found: "
+                    f"{knowledge_service_id}"
+                )
+            service_configs[knowledge_service_id] = config
+
+        return service_configs
+
     @try_use_case_step("document_registration")
     async def _register_document_with_services(
         self,
         document: Document,
-        queries: Dict[str, KnowledgeServiceQuery],
+        service_configs: Dict[str, KnowledgeServiceConfig],
     ) -> Dict[str, str]:
         """
         Register the document with all knowledge services needed for
@@ -441,35 +623,112 @@ class ValidateDocumentUseCase:
 
         Args:
             document: The document to register
-            queries: Dict of query_id to KnowledgeServiceQuery objects
+            service_configs: Mapping of knowledge_service_id to the config of
+                each service the document must be registered with
 
         Returns:
             Dict mapping knowledge_service_id to service_file_id
         """
-        registrations = {}
-        required_service_ids = {
-            query.knowledge_service_id for query in queries.values()
+        # Registrations with different services are independent
+        service_ids = list(service_configs)
+        results = await self._gather_bounded(
+            (
+                functools.partial(
+                    self.knowledge_service.register_file,
+                    service_configs[knowledge_service_id],
+                    document,
+                )
+                for knowledge_service_id in service_ids
+            ),
+            service_ids,
+        )
+
+        return {
+            knowledge_service_id: result.knowledge_service_file_id
+            for knowledge_service_id, result in zip(service_ids, results)
         }
 
-        for knowledge_service_id in required_service_ids:
-            # Get the config for this service
-            config = await self.knowledge_service_config_repo.get(
-                knowledge_service_id
-            )
-            if not config:
-                raise ValueError(
-                    f"Knowledge service config not found: "
-                    f"{knowledge_service_id}"
+    def _service_concurrency_limit(self, knowledge_service_id: str) -> int:
+        """Return how many calls may run at once against a service."""
+        return self.service_concurrency_limits.get(
+            knowledge_service_id, self.max_concurrency_per_service
+        )
+
+    def _concurrency_limiter(
+        self,
+    ) -> Callable[[Callable[[], Awaitable[V]], Optional[str]], Awaitable[V]]:
+        """
+        Create a function that runs calls under the concurrency caps.
+
+        At most max_concurrency calls run at once overall, and at most the
+        service's limit run at once per knowledge service. Each call is
+        only made once its slots are acquired, so a call cancelled while
+        still queued never creates a coroutine that goes unawaited. The
+        semaphores are created per call rather than kept on the instance,
+        since they belong to the event loop they are first used on.
+        """
+        overall = asyncio.Semaphore(self.max_concurrency)
+        per_service: Dict[str, asyncio.Semaphore] = {}
+
+        async def limited(
+            call: Callable[[], Awaitable[V]],
+            knowledge_service_id: Optional[str],
+        ) -> V:
+            if knowledge_service_id is None:
+                async with overall:
+                    return await call()
+
+            service_semaphore = per_service.get(knowledge_service_id)
+            if service_semaphore is None:
+                service_semaphore = asyncio.Semaphore(
+                    self._service_concurrency_limit(knowledge_service_id)
                 )
+                per_service[knowledge_service_id] = service_semaphore
 
-            registration_result = await self.knowledge_service.register_file(
-                config, document
-            )
-            registrations[knowledge_service_id] = (
-                registration_result.knowledge_service_file_id
-            )
+            # Wait for the service first, so calls queued behind a busy
+            # service don't hold overall slots other services could use
+            async with service_semaphore, overall:
+                return await call()
+
+        return limited
+
+    async def _gather_bounded(
+        self,
+        calls: Iterable[Callable[[], Awaitable[Any]]],
+        service_ids: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """
+        Make calls concurrently, within the concurrency caps.
 
-        return registrations
+        Args:
+            calls: Zero-argument callables returning the awaitables to run
+            service_ids: Knowledge service each call goes to, used to
+                apply per-service limits. If omitted, only max_concurrency
+                applies.
+
+        Returns:
+            Results in the order the calls were given, like asyncio.gather
+
+        Raises:
+            Exception: The first exception raised by a call. The calls still
+                running or queued are cancelled rather than left to run on
+                in the background.
+        """
+        limited = self._concurrency_limiter()
+        factories = list(calls)
+        ids: List[Optional[str]] = (
+            list(service_ids) if service_ids else [None] * len(factories)
+        )
+        tasks = [
+            asyncio.ensure_future(limited(call, sid))
+            for call, sid in zip(factories, ids)
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     @try_use_case_step("validation_execution")
     async def _execute_validation_queries(
@@ -478,6 +737,7 @@ class ValidateDocumentUseCase:
         policy: Policy,
         document_registrations: Dict[str, str],
         queries: Dict[str, KnowledgeServiceQuery],
+        service_configs: Dict[str, KnowledgeServiceConfig],
     ) -> List[Tuple[str, int]]:
         """
         Execute all validation queries and return the actual scores achieved.
@@ -487,28 +747,16 @@ class ValidateDocumentUseCase:
             policy: The policy being applied
             document_registrations: Mapping of service_id to service_file_id
             queries: Dict of query_id to KnowledgeServiceQuery objects
+            service_configs: Mapping of service_id to KnowledgeServiceConfig
 
         Returns:
             List of (query_id, actual_score) tuples
         """
-        validation_scores = []
-
-        # Execute each validation query defined in the policy
+        # Check every query has a registered file before calling out, so a
+        # misconfiguration fails fast instead of after other queries ran
+        pending = []
         for query_id, required_score in policy.validation_scores:
-            # Get the query configuration
             query = queries[query_id]
-
-            # Get the config for this service
-            config = await self.knowledge_service_config_repo.get(
-                query.knowledge_service_id
-            )
-            if not config:
-                raise ValueError(
-                    f"Knowledge service config not found: "
-                    f"{query.knowledge_service_id}"
-                )
-
-            # Get the service file ID from our registrations
             service_file_id = document_registrations.get(
                 query.knowledge_service_id
             )
@@ -517,22 +765,56 @@ class ValidateDocumentUseCase:
                     f"Document not registered with service "
                     f"{query.knowledge_service_id}"
                 )
-
-            # Execute the validation query
-            query_result = await self.knowledge_service.execute_query(
-                config,
-                query.prompt,
-                [service_file_id],
-                query.query_metadata,
-                query.assistant_prompt,
+            pending.append((query_id, required_score, query, service_file_id))
+
+        # The queries are independent, so execute them concurrently. Each
+        # run is passed as a factory so queries that never get to start
+        # don't leave coroutines behind.
+        runs = [
+            functools.partial(
+                self._run_validation_query,
+                query_id,
+                required_score,
+                query,
+                service_file_id,
+                service_configs[query.knowledge_service_id],
             )
-
-            # Extract the score from the query result
-            actual_score = self._extract_score_from_result(
-                query_result.result_data
+            for query_id, required_score, query, service_file_id in pending
+        ]
+        service_ids = [
+            query.knowledge_service_id for _, _, query, _ in pending
+        ]
+        if self.fail_fast:
+            required = [required_score for _, required_score, _, _ in pending]
+            return await self._gather_until_failure(
+                runs, required, service_ids
             )
-            validation_scores.append((query_id, actual_score))
 
+        # Results come back in policy order
+        return await self._gather_bounded(runs, service_ids)
+
+    async def _run_validation_query(
+        self,
+        query_id: str,
+        required_score: int,
+        query: KnowledgeServiceQuery,
+        service_file_id: str,
+        config: KnowledgeServiceConfig,
+    ) -> Tuple[str, int]:
+        """Execute one validation query and extract its score."""
+        query_result = await self.knowledge_service.execute_query(
+            config,
+            query.prompt,
+            [service_file_id],
+            query.query_metadata,
+            query.assistant_prompt,
+        )
+        actual_score = self._extract_score_from_result(
+            query_result.result_data
+        )
+
+        # Skip building the extra dict per query unless it will be used
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Validation query executed",
                 extra={
@@ -543,7 +825,74 @@ class ValidateDocumentUseCase:
                 },
             )
 
-        return validation_scores
+        return query_id, actual_score
+
+    async def _gather_until_failure(
+        self,
+        runs: Iterable[Callable[[], Awaitable[Tuple[str, int]]]],
+        required_scores: List[int],
+        service_ids: Optional[List[str]] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Run validation queries until one scores below its required score.
+
+        Scores are checked as they arrive. On the first failing score, or
+        on an error, the queries still outstanding are cancelled. The same
+        concurrency caps as _gather_bounded apply.
+
+        Args:
+            runs: Zero-argument callables returning each query's
+                (query_id, actual_score)
+            required_scores: Required score of each query, in the same
+                order as runs
+            service_ids: Knowledge service each query runs against
+
+        Returns:
+            The (query_id, actual_score) tuples received, in policy order.
+            Shorter than required_scores if the run was cut short.
+        """
+        limited = self._concurrency_limiter()
+
+        async def run(
+            index: int,
+            call: Callable[[], Awaitable[Tuple[str, int]]],
+            knowledge_service_id: Optional[str],
+        ) -> Tuple[int, Tuple[str, int]]:
+            return index, await limited(call, knowledge_service_id)
+
+        tasks = [
+            asyncio.ensure_future(
+                run(
+                    index,
+                    call,
+                    service_ids[index] if service_ids else None,
+                )
+            )
+            for index, call in enumerate(runs)
+        ]
+        scores: Dict[int, Tuple[str, int]] = {}
+        try:
+            for next_done in self.as_completed(tasks):
+                index, score = await next_done
+                scores[index] = score
+                query_id, actual_score = score
+                if actual_score < required_scores[index]:
+                    logger.info(
+                        "Validation query failed, skipping remaining queries",
+                        extra={
+                            "query_id": query_id,
+                            "required_score": required_scores[index],
+                            "actual_score": actual_score,
+                            "skipped": len(tasks) - len(scores),
+                        },
+                    )
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return [scores[index] for index in sorted(scores)]
 
     def _extract_score_from_result(self, result_data: Dict) -> int:
         """
@@ -557,10 +906,9 @@ class ValidateDocumentUseCase:
         if not response_text:
             raise ValueError("Empty response from knowledge service")
 
-        # Try to parse response as integer directly
+        # int() tolerates signs and surrounding whitespace on its own
         try:
-            score = int(response_text.strip())
-            return score
+            return int(response_text)
         except ValueError as e:
             raise ValueError(
                 f"Failed to parse numeric score from response: "
@@ -582,14 +930,33 @@ class ValidateDocumentUseCase:
 
         Returns:
             True if all required scores were met or exceeded, False otherwise
+
+        Raises:
+            ValueError: If the actual scores don't line up with the required
+                scores query for query
         """
-        # Convert to dictionaries for easier lookup
-        actual_scores_dict = dict(actual_scores)
-        required_scores_dict = dict(required_scores)
+        # Actual scores are produced by walking policy.validation_scores, so
+        # both lists share the same query order and can be compared pairwise
+        # without building lookup dicts.
+        if len(actual_scores) != len(required_scores):
+            # With fail_fast, a short list means a failing score cut the
+            # run short
+            if self.fail_fast and len(actual_scores) < len(required_scores):
+                return self._check_cut_short_scores(
+                    actual_scores, required_scores
+                )
+            raise ValueError(
+                f"Expected {len(required_scores)} validation scores, got "
+                f"{len(actual_scores)}"
+            )
 
-        # Check if all required scores were met
-        for query_id, required_score in required_scores_dict.items():
-            actual_score = actual_scores_dict.get(query_id, 0)
+        pairs = zip(required_scores, actual_scores)
+        for (query_id, required_score), (actual_id, actual_score) in pairs:
+            if actual_id != query_id:
+                raise ValueError(
+                    f"Validation score for {actual_id} found where "
+                    f"{query_id} was expected"
+                )
             if actual_score < required_score:
                 logger.debug(
                     "Validation failed for query",
@@ -603,6 +970,45 @@ class ValidateDocumentUseCase:
 
         return True
 
+    def _check_cut_short_scores(
+        self,
+        actual_scores: List[Tuple[str, int]],
+        required_scores: List[Tuple[str, int]],
+    ) -> bool:
+        """
+        Check the scores of a fail_fast run that was cut short.
+
+        The run keeps only the scores that arrived, still in policy order,
+        so each must belong to a later query than the one before, and one
+        of them must have failed for the run to have stopped.
+
+        Returns:
+            False, as a cut-short run did not meet every required score
+
+        Raises:
+            ValueError: If the scores are out of policy order, belong to
+                queries the policy does not require, or all passed
+        """
+        remaining = iter(required_scores)
+        failed = False
+        for actual_id, actual_score in actual_scores:
+            for query_id, required_score in remaining:
+                if query_id == actual_id:
+                    failed = failed or actual_score < required_score
+                    break
+            else:
+                raise ValueError(
+                    f"Validation score for {actual_id} is out of policy "
+                    "order or not required by the policy"
+                )
+
+        if not failed:
+            raise ValueError(
+                f"Expected {len(required_scores)} validation scores, got "
+                f"{len(actual_scores)} and none of them failed"
+            )
+        return False
+
     @try_use_case_step("document_transformation")
     async def _apply_transformations(
         self,
@@ -610,6 +1016,7 @@ class ValidateDocumentUseCase:
         policy: Policy,
         all_queries: Dict[str, KnowledgeServiceQuery],
         document_registrations: Dict[str, str],
+        service_configs: Dict[str, KnowledgeServiceConfig],
     ) -> Document:
         """
         Apply transformation queries to a document and return the
@@ -620,6 +1027,7 @@ class ValidateDocumentUseCase:
             policy: The policy containing transformation query IDs
             all_queries: Dict of all queries (validation and transformation)
             document_registrations: Mapping of service_id to service_file_id
+            service_configs: Mapping of service_id to KnowledgeServiceConfig
 
         Returns:
             New Document object with transformed content
@@ -652,15 +1060,7 @@ class ValidateDocumentUseCase:
         for query_id in policy.transformation_queries:
             query = all_queries[query_id]
 
-            # Get the config for this service
-            config = await self.knowledge_service_config_repo.get(
-                query.knowledge_service_id
-            )
-            if not config:
-                raise ValueError(
-                    f"Knowledge service config not found: "
-                    f"{query.knowledge_service_id}"
-                )
+            config = service_configs[query.knowledge_service_id]
 
             # Get the service file ID from our registrations
             service_file_id = document_registrations.get(
@@ -688,14 +1088,15 @@ class ValidateDocumentUseCase:
                 transformation_result.result_data
             )
 
-            logger.debug(
-                "Transformation query applied",
-                extra={
-                    "query_id": query_id,
-                    "original_length": document.size_bytes,
-                    "transformed_length": len(transformed_content),
-                },
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Transformation query applied",
+                    extra={
+                        "query_id": query_id,
+                        "original_length": document.size_bytes,
+                        "transformed_length": len(transformed_content),
+                    },
+                )
 
         # Create new document with transformed content
         transformed_document_id = await self.document_repo.generate_id()
@@ -704,13 +1105,15 @@ class ValidateDocumentUseCase:
         transformed_bytes = transformed_content.encode("utf-8")
         transformed_stream = io.BytesIO(transformed_bytes)
 
-        # Calculate multihash for transformed content
-        sha256_hasher = hashlib.sha256()
-        sha256_hasher.update(transformed_bytes)
-        sha256_hash = sha256_hasher.digest()
+        # Calculate multihash for transformed content. Hash the existing
+        # buffer in one call; hashlib releases the GIL for large inputs.
+        sha256_hash = hashlib.sha256(transformed_bytes).digest()
         mhash = multihash.encode(sha256_hash, multihash.SHA2_256)
         proper_multihash = str(mhash.hex())
 
+        # One timestamp for the new document so created_at and updated_at
+        # agree and the workflow clock is read once
+        created_at = self.now_fn()
         transformed_document = Document(
             document_id=transformed_document_id,
             original_filename=f"transformed_{document.original_filename}",
@@ -719,8 +1122,8 @@ class ValidateDocumentUseCase:
             content_multihash=proper_multihash,
             status=DocumentStatus.CAPTURED,
             content=ContentStream(transformed_stream),
-            created_at=self.now_fn(),
-            updated_at=self.now_fn(),
+            created_at=created_at,
+            updated_at=created_at,
         )
 
         # Save the transformed document
@@ -759,11 +1162,12 @@ class ValidateDocumentUseCase:
         # The response must be valid JSON
         stripped_response: str = response_text.strip()
         try:
-            # Parse to validate JSON structure
-            json.loads(stripped_response)
+            # Parse to validate JSON structure. orjson decodes large LLM
+            # payloads several times faster than the stdlib parser.
+            orjson.loads(stripped_response)
             # Return the original response text (preserving formatting)
             return stripped_response
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise ValueError(
                 f"Transformation result must be valid JSON, got: "
                 f"{response_text[:100]}... Parse error: {e}"
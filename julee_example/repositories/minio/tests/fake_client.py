@@ -7,6 +7,7 @@ state-based testing where you can verify actual storage state rather than
 just mocking method calls.
 """
 
+import hashlib
 from typing import Dict, Any, Optional, Callable, BinaryIO, Union, List
 from functools import wraps
 from unittest.mock import Mock
@@ -132,11 +133,14 @@ class FakeMinioClient(MinioClient):
                 data if isinstance(data, bytes) else str(data).encode("utf-8")
             )
 
+        # Like Minio, a single-part upload's ETag is the MD5 of its content
+        etag = hashlib.md5(content, usedforsecurity=False).hexdigest()
         self._objects[bucket_name][object_name] = {
             "data": content,
             "metadata": metadata or {},
             "content_type": content_type,
             "size": len(content),
+            "etag": etag,
         }
 
         # Return a proper ObjectWriteResult
@@ -144,7 +148,7 @@ class FakeMinioClient(MinioClient):
             bucket_name=bucket_name,
             object_name=object_name,
             version_id=None,
-            etag="fake-etag",
+            etag=etag,
             http_headers=HTTPHeaderDict(),
             last_modified=datetime.now(timezone.utc),
             location=f"/{bucket_name}/{object_name}",
@@ -174,14 +178,19 @@ class FakeMinioClient(MinioClient):
             bucket_name=bucket_name,
             object_name=object_name,
             last_modified=datetime.now(timezone.utc),
-            etag="fake-etag",
+            etag=obj_info["etag"],
             size=obj_info["size"],
             content_type=obj_info["content_type"],
             metadata=obj_info["metadata"],
         )
 
-    def list_objects(self, bucket_name: str, prefix: str = "") -> list:
-        """List objects in a bucket with optional prefix filter."""
+    def list_objects(
+        self, bucket_name: str, prefix: str = "", recursive: bool = False
+    ) -> list:
+        """List objects in a bucket with optional prefix filter.
+
+        The fake has no directories, so recursive is accepted and ignored.
+        """
         if bucket_name not in self._objects:
             return []
 
@@ -192,6 +201,7 @@ class FakeMinioClient(MinioClient):
                 obj = Mock()
                 obj.object_name = object_name
                 obj.size = obj_info["size"]
+                obj.etag = obj_info["etag"]
                 objects.append(obj)
 
         return objects
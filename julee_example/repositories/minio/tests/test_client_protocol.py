@@ -8,6 +8,8 @@ actual interface.
 
 from minio import Minio
 
+from util.repos.minio.http_client import create_minio_http_client
+
 from ..client import MinioClient
 
 
@@ -55,3 +57,16 @@ class TestMinioClientProtocol:
         # Verify the client was stored correctly
         assert repository.client is real_client
         assert isinstance(repository.client, MinioClient)
+
+
+class TestMinioHttpClient:
+    """Test the connection pool built for shared Minio clients."""
+
+    def test_pool_is_accepted_by_minio(self) -> None:
+        """Test that minio.Minio accepts the pool as its http_client."""
+        client = Minio(
+            "localhost:9000",
+            http_client=create_minio_http_client(max_concurrency=8),
+        )
+
+        assert isinstance(client, MinioClient)
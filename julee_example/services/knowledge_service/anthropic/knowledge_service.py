@@ -49,10 +49,12 @@ class AnthropicKnowledgeService(KnowledgeService):
         """Initialize Anthropic knowledge service without configuration.
 
         Configuration will be provided per method call to maintain
-        stateless operation compatible with Temporal workflows.
+        stateless operation compatible with Temporal workflows. The
+        AsyncAnthropic client is created on first use and kept by this
+        instance, so repeated calls reuse its keep-alive HTTP connections
+        until aclose() is called.
         """
-        # No initialization needed - everything happens per method call
-        pass
+        self._client: Optional[AsyncAnthropic] = None
 
     def _get_client(self, config: KnowledgeServiceConfig) -> AsyncAnthropic:
         """Get an initialized Anthropic client.
@@ -66,6 +68,9 @@ class AnthropicKnowledgeService(KnowledgeService):
         Raises:
             ValueError: If ANTHROPIC_API_KEY environment variable is not set
         """
+        if self._client is not None:
+            return self._client
+
         api_key = os.environ.get("ANTHROPIC_API_KEY")
         if not api_key:
             raise ValueError(
@@ -73,10 +78,17 @@ class AnthropicKnowledgeService(KnowledgeService):
                 "AnthropicKnowledgeService"
             )
 
-        return AsyncAnthropic(
+        self._client = AsyncAnthropic(
             api_key=api_key,
             default_headers={"anthropic-beta": "files-api-2025-04-14"},
         )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client and its connection pool, if one was created."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
 
     async def register_file(
         self, config: KnowledgeServiceConfig, document: Document
@@ -338,3 +338,38 @@ class TestAnthropicKnowledgeService:
                 == anthropic_ks_module.DEFAULT_MAX_TOKENS
             )
             assert "temperature" not in call_args[1]  # Not set by default
+
+    @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
+    async def test_client_is_reused_until_closed(
+        self,
+        knowledge_service_config: KnowledgeServiceConfig,
+        mock_anthropic_client: MagicMock,
+    ) -> None:
+        """Test that a service keeps one client until aclose is called."""
+        mock_anthropic_client.close = AsyncMock()
+        with patch(
+            "julee_example.services.knowledge_service.anthropic.knowledge_service.AsyncAnthropic"
+        ) as mock_anthropic:
+            mock_anthropic.return_value = mock_anthropic_client
+            service = anthropic_ks.AnthropicKnowledgeService()
+
+            await service.execute_query(
+                knowledge_service_config, "First query"
+            )
+            await service.execute_query(
+                knowledge_service_config, "Second query"
+            )
+
+            # One client constructed, two queries sent through it
+            mock_anthropic.assert_called_once()
+            assert mock_anthropic_client.messages.create.call_count == 2
+
+            await service.aclose()
+
+            mock_anthropic_client.close.assert_awaited_once()
+
+            # A later call builds a fresh client
+            await service.execute_query(
+                knowledge_service_config, "Third query"
+            )
+            assert mock_anthropic.call_count == 2
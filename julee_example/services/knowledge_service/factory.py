@@ -18,11 +18,14 @@ from julee_example.services.knowledge_service import (
     QueryResult,
     FileRegistrationResult,
 )
-from typing import Dict, Any, List, Optional
-
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# What a cached service was created from; a change invalidates it
+_ConfigVersion = Tuple[ServiceApi, Optional[datetime]]
+
 
 class ConfigurableKnowledgeService(KnowledgeService):
     """
@@ -33,14 +36,50 @@ class ConfigurableKnowledgeService(KnowledgeService):
     decorators while maintaining proper protocol compliance.
 
     No constructor configuration is required - the factory is called
-    within each method using the provided config parameter.
+    with the config passed to each method. The created service is kept
+    per knowledge_service_id and reused while the config is unchanged, so
+    its clients (and their pooled connections) survive across calls.
+    Call aclose() on shutdown to close them.
     """
 
+    def __init__(self) -> None:
+        self._services: Dict[str, Tuple[_ConfigVersion, KnowledgeService]] = (
+            {}
+        )
+
+    def _get_service(
+        self, config: KnowledgeServiceConfig
+    ) -> KnowledgeService:
+        """Return the service for config, creating it on first use.
+
+        A cached service is replaced when the config's service_api or
+        updated_at changes, so at most one instance is kept per
+        knowledge_service_id.
+        """
+        version = (config.service_api, config.updated_at)
+        cached = self._services.get(config.knowledge_service_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        service = knowledge_service_factory(config)
+        self._services[config.knowledge_service_id] = (version, service)
+        return service
+
+    async def aclose(self) -> None:
+        """Close the clients held by the cached services."""
+        services = [service for _, service in self._services.values()]
+        self._services.clear()
+        for service in services:
+            # Only services holding a client define aclose
+            aclose = getattr(service, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     async def register_file(
         self, config: KnowledgeServiceConfig, document: Document
     ) -> FileRegistrationResult:
         """Register a document with the knowledge service."""
-        service = knowledge_service_factory(config)
+        service = self._get_service(config)
         return await service.register_file(config, document)
 
     async def execute_query(
@@ -52,7 +91,7 @@ class ConfigurableKnowledgeService(KnowledgeService):
         assistant_prompt: Optional[str] = None,
     ) -> QueryResult:
         """Execute a query against the knowledge service."""
-        service = knowledge_service_factory(config)
+        service = self._get_service(config)
         return await service.execute_query(
             config=config,
             query_text=query_text,
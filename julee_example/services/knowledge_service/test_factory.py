@@ -6,6 +6,7 @@ KnowledgeService implementations based on configuration.
 """
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 
 from julee_example.domain.models.knowledge_service_config import (
     KnowledgeServiceConfig,
@@ -17,6 +18,7 @@ from julee_example.domain.models.custom_fields.content_stream import (
 )
 from julee_example.services.knowledge_service import ensure_knowledge_service
 from julee_example.services.knowledge_service.factory import (
+    ConfigurableKnowledgeService,
     knowledge_service_factory,
 )
 from julee_example.services.knowledge_service.anthropic import (
@@ -87,6 +89,80 @@ class TestKnowledgeServiceFactory:
             assert validated_service == service
 
 
+class TestConfigurableKnowledgeService:
+    """Test cases for ConfigurableKnowledgeService."""
+
+    def test_service_reused_while_config_unchanged(
+        self,
+        anthropic_config: KnowledgeServiceConfig,
+    ) -> None:
+        """Test that the same service is returned for an unchanged config."""
+        with pytest.MonkeyPatch.context() as m:
+            m.setenv("ANTHROPIC_API_KEY", "test-key")
+            configurable = ConfigurableKnowledgeService()
+
+            first = configurable._get_service(anthropic_config)
+            second = configurable._get_service(anthropic_config)
+
+            assert first is second
+
+    def test_service_recreated_when_config_updated(
+        self,
+        anthropic_config: KnowledgeServiceConfig,
+    ) -> None:
+        """Test that an updated config replaces the cached service."""
+        with pytest.MonkeyPatch.context() as m:
+            m.setenv("ANTHROPIC_API_KEY", "test-key")
+            configurable = ConfigurableKnowledgeService()
+            first = configurable._get_service(anthropic_config)
+
+            updated_config = anthropic_config.model_copy(
+                update={
+                    "updated_at": datetime(2030, 1, 1, tzinfo=timezone.utc)
+                }
+            )
+            second = configurable._get_service(updated_config)
+
+            assert first is not second
+            assert len(configurable._services) == 1
+
+    async def test_aclose_closes_cached_services(
+        self,
+        anthropic_config: KnowledgeServiceConfig,
+    ) -> None:
+        """Test that aclose closes and forgets the cached services."""
+        with pytest.MonkeyPatch.context() as m:
+            m.setenv("ANTHROPIC_API_KEY", "test-key")
+            configurable = ConfigurableKnowledgeService()
+            service = configurable._get_service(anthropic_config)
+            m.setattr(service, "aclose", AsyncMock())
+
+            await configurable.aclose()
+
+            service.aclose.assert_awaited_once()  # type: ignore[attr-defined]
+            assert configurable._services == {}
+
+    async def test_aclose_closes_any_service_defining_aclose(
+        self,
+        anthropic_config: KnowledgeServiceConfig,
+    ) -> None:
+        """Test that aclose closes cached services of any type, and skips
+        those without an aclose."""
+        version = (anthropic_config.service_api, anthropic_config.updated_at)
+        closable = MagicMock()
+        closable.aclose = AsyncMock()
+        configurable = ConfigurableKnowledgeService()
+        configurable._services = {
+            "ks-closable": (version, closable),
+            "ks-plain": (version, object()),  # type: ignore[dict-item]
+        }
+
+        await configurable.aclose()
+
+        closable.aclose.assert_awaited_once()
+        assert configurable._services == {}
+
+
 class TestEnsureKnowledgeService:
     """Test cases for ensure_knowledge_service function."""
 
@@ -0,0 +1,46 @@
+"""
+Tests for the julee_example worker's Temporal connection retries.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from julee_example.worker import get_temporal_client_with_retries
+
+
+@pytest.mark.asyncio
+async def test_connect_failure_is_retried() -> None:
+    """Test that the SDK's connect failure is retried until it succeeds"""
+    client = AsyncMock()
+    connect = AsyncMock(
+        side_effect=[RuntimeError("Failed client connect: refused"), client]
+    )
+
+    with patch("julee_example.worker.Client.connect", connect), patch(
+        "julee_example.worker.asyncio.sleep", AsyncMock()
+    ):
+        result = await get_temporal_client_with_retries(
+            "test-endpoint", attempts=3, connect_timeout=1.0
+        )
+
+    assert result is client
+    assert connect.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_other_runtime_error_is_not_retried() -> None:
+    """Test that a RuntimeError that is not a connect failure propagates
+    from the first attempt"""
+    connect = AsyncMock(side_effect=RuntimeError("Invalid namespace"))
+
+    with patch("julee_example.worker.Client.connect", connect), patch(
+        "julee_example.worker.asyncio.sleep", AsyncMock()
+    ) as sleep:
+        with pytest.raises(RuntimeError, match="Invalid namespace"):
+            await get_temporal_client_with_retries(
+                "test-endpoint", attempts=3, connect_timeout=1.0
+            )
+
+    assert connect.await_count == 1
+    sleep.assert_not_awaited()
@@ -8,6 +8,8 @@ assembly, and knowledge service operations within the julee_example domain.
 import asyncio
 import logging
 import os
+import random
+from typing import Optional
 from temporalio.client import Client
 from temporalio.service import RPCError
 from temporalio.worker import Worker
@@ -31,46 +33,107 @@ from julee_example.services.temporal.activities import (
 )
 from minio import Minio
 from julee_example.repositories.minio.client import MinioClient
+from util.repos.minio.http_client import create_minio_http_client
 from util.temporal.activities import collect_activities_from_instances
+from util.env import env_float, env_positive_int
+from util.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Reconnect backoff defaults, overridable via TEMPORAL_RECONNECT_BASE,
+# TEMPORAL_RECONNECT_MAX and TEMPORAL_RECONNECT_JITTER
+DEFAULT_RECONNECT_BASE = 1.0
+DEFAULT_RECONNECT_MAX = 30.0
+DEFAULT_RECONNECT_JITTER = 0.5
 
-def setup_logging() -> None:
-    """Configure logging based on environment variables"""
-    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    log_format = os.environ.get(
-        "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+# Upper bound on a single connection attempt, overridable via
+# TEMPORAL_CONNECT_TIMEOUT
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+# Errors treated as a failed attempt worth retrying
+_CONNECT_ERRORS = (RPCError, OSError, asyncio.TimeoutError)
+
+# The SDK reports an unreachable server as a RuntimeError with this
+# prefix rather than as RPCError. Other RuntimeErrors are not retried.
+_CONNECT_FAILED_PREFIX = "Failed client connect"
+
+# Activity concurrency, overridable via TEMPORAL_MAX_CONCURRENT_ACTIVITIES.
+# The shared Minio connection pool is sized from the same value.
+DEFAULT_MAX_CONCURRENT_ACTIVITIES = 64
+
+# Workflow task concurrency, overridable via TEMPORAL_MAX_CONCURRENT_WFS
+DEFAULT_MAX_CONCURRENT_WORKFLOW_TASKS = 32
 
-    # Validate log level
-    numeric_level = getattr(logging, log_level, None)
-    if not isinstance(numeric_level, int):
-        print(f"Invalid log level: {log_level}, defaulting to INFO")
-        numeric_level = logging.INFO
+# Workflows kept in the sticky cache so replays are avoided on later tasks
+DEFAULT_MAX_CACHED_WORKFLOWS = 1000
 
-    logging.basicConfig(
-        level=numeric_level,
-        format=log_format,
-        force=True,  # Override any existing configuration
+# Seeded from the OS rather than the clock so that replicas started at the
+# same moment do not retry in lockstep
+_reconnect_random = random.SystemRandom()
+
+
+def _is_connect_error(error: BaseException) -> bool:
+    """Whether error is a failed connection attempt worth retrying."""
+    if isinstance(error, _CONNECT_ERRORS):
+        return True
+    return isinstance(error, RuntimeError) and str(error).startswith(
+        _CONNECT_FAILED_PREFIX
     )
 
-    logger.info(
-        "Logging configured",
-        extra={"log_level": log_level, "numeric_level": numeric_level},
+
+def reconnect_delay(
+    attempt: int, base: float, max_delay: float, jitter_ratio: float
+) -> float:
+    """Compute the jittered exponential backoff before the next attempt.
+
+    The delay doubles with each attempt up to max_delay, then is spread
+    uniformly by +/- jitter_ratio of itself.
+    """
+    sleep_for = min(max_delay, base * (2**attempt))
+    spread = sleep_for * jitter_ratio
+    return max(
+        0.0, _reconnect_random.uniform(sleep_for - spread, sleep_for + spread)
     )
 
 
 async def get_temporal_client_with_retries(
-    endpoint: str, attempts: int = 10, delay: int = 5
+    endpoint: str,
+    attempts: int = 10,
+    base: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    jitter_ratio: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
 ) -> Client:
-    """Attempt to connect to Temporal with retries."""
+    """Attempt to connect to Temporal with jittered exponential backoff.
+
+    Each attempt is bounded by connect_timeout so a hanging handshake
+    counts as a failed attempt instead of stalling startup. Parameters
+    left as None are read from TEMPORAL_RECONNECT_BASE,
+    TEMPORAL_RECONNECT_MAX, TEMPORAL_RECONNECT_JITTER and
+    TEMPORAL_CONNECT_TIMEOUT.
+    """
+    if base is None:
+        base = env_float("TEMPORAL_RECONNECT_BASE", DEFAULT_RECONNECT_BASE)
+    if max_delay is None:
+        max_delay = env_float("TEMPORAL_RECONNECT_MAX", DEFAULT_RECONNECT_MAX)
+    if jitter_ratio is None:
+        jitter_ratio = env_float(
+            "TEMPORAL_RECONNECT_JITTER", DEFAULT_RECONNECT_JITTER
+        )
+    if connect_timeout is None:
+        connect_timeout = env_float(
+            "TEMPORAL_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT
+        )
+
     logger.debug(
         "Attempting to connect to Temporal",
         extra={
             "endpoint": endpoint,
             "max_attempts": attempts,
-            "delay_seconds": delay,
+            "backoff_base_seconds": base,
+            "backoff_max_seconds": max_delay,
+            "backoff_jitter_ratio": jitter_ratio,
+            "connect_timeout_seconds": connect_timeout,
         },
     )
 
@@ -78,10 +141,13 @@ async def get_temporal_client_with_retries(
         try:
             # Use the proper Pydantic v2 data converter and connect to the
             # 'default' namespace
-            client = await Client.connect(
-                endpoint,
-                data_converter=temporal_data_converter,
-                namespace="default",
+            client = await asyncio.wait_for(
+                Client.connect(
+                    endpoint,
+                    data_converter=temporal_data_converter,
+                    namespace="default",
+                ),
+                timeout=connect_timeout,
             )
             logger.info(
                 "Successfully connected to Temporal",
@@ -94,15 +160,21 @@ async def get_temporal_client_with_retries(
                 },
             )
             return client
-        except RPCError as e:
+        except Exception as e:
+            if not _is_connect_error(e):
+                raise
+            sleep_for = reconnect_delay(
+                attempt, base, max_delay, jitter_ratio
+            )
             logger.warning(
                 "Failed to connect to Temporal",
                 extra={
                     "endpoint": endpoint,
                     "attempt": attempt + 1,
                     "max_attempts": attempts,
+                    "error_type": type(e).__name__,
                     "error": str(e),
-                    "retry_in_seconds": delay,
+                    "sleep_for": sleep_for,
                 },
             )
             if attempt + 1 == attempts:
@@ -111,7 +183,7 @@ async def get_temporal_client_with_retries(
                     extra={"endpoint": endpoint, "total_attempts": attempts},
                 )
                 raise
-            await asyncio.sleep(delay)
+            await asyncio.sleep(sleep_for)
 
     # This should never be reached due to the raise in the loop, but mypy
     # needs it
@@ -136,13 +208,24 @@ async def run_worker() -> None:
     logger.debug("Preparing repository configurations")
     minio_endpoint = os.environ.get("MINIO_ENDPOINT", "localhost:9000")
 
-    # Create Minio client for repositories
+    max_concurrent_activities = env_positive_int(
+        "TEMPORAL_MAX_CONCURRENT_ACTIVITIES",
+        DEFAULT_MAX_CONCURRENT_ACTIVITIES,
+    )
+    max_concurrent_workflow_tasks = env_positive_int(
+        "TEMPORAL_MAX_CONCURRENT_WFS",
+        DEFAULT_MAX_CONCURRENT_WORKFLOW_TASKS,
+    )
+
+    # Create Minio client for repositories, with a connection pool sized
+    # for every activity that may be talking to Minio at once
     # minio.Minio implements the MinioClient protocol
     minio_client: MinioClient = Minio(  # type: ignore[assignment]
         endpoint=minio_endpoint,
         access_key="minioadmin",
         secret_key="minioadmin",
         secure=False,
+        http_client=create_minio_http_client(max_concurrent_activities),
     )
 
     # Instantiate temporal repository classes for activity registration
@@ -196,22 +279,45 @@ async def run_worker() -> None:
             "workflow_count": 2,
             "activity_count": len(activities),
             "data_converter_type": type(client.data_converter).__name__,
+            "max_concurrent_activities": max_concurrent_activities,
+            "max_concurrent_workflow_tasks": max_concurrent_workflow_tasks,
         },
     )
 
-    # Create worker with workflow retry policy
+    # Create worker with workflow retry policy. Activity concurrency
+    # matches the Minio connection pool so activities never queue for a
+    # connection. All activities are async, so no activity_executor is
+    # needed.
     worker = Worker(
         client,
         task_queue="julee-extract-assemble-queue",
         workflows=[ExtractAssembleWorkflow, ValidateDocumentWorkflow],
         activities=activities,  # type: ignore[arg-type]
+        max_concurrent_activities=max_concurrent_activities,
+        max_concurrent_workflow_tasks=max_concurrent_workflow_tasks,
+        max_cached_workflows=DEFAULT_MAX_CACHED_WORKFLOWS,
     )
 
     logger.info("Starting julee_example worker execution")
 
-    # Run the worker
-    await worker.run()
+    # Run the worker, closing the knowledge service clients on shutdown
+    try:
+        await worker.run()
+    finally:
+        await temporal_knowledge_service.aclose()
+
+
+def main() -> None:
+    """Run the worker on uvloop when available, else the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on every platform (e.g. Windows)
+        logger.debug("uvloop not installed, using the default event loop")
+        asyncio.run(run_worker())
+    else:
+        uvloop.run(run_worker())
 
 
 if __name__ == "__main__":
-    asyncio.run(run_worker())
+    main()
@@ -0,0 +1,41 @@
+"""
+Tests for the document validation workflow.
+
+These tests check how the workflow wires up ValidateDocumentUseCase, not
+the validation logic itself, which is covered by the use case tests.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from temporalio import workflow
+
+from julee_example.workflows.validate_document import (
+    ValidateDocumentWorkflow,
+)
+
+
+class TestValidateDocumentWorkflow:
+    """Tests for the ValidateDocumentWorkflow."""
+
+    async def test_use_case_takes_results_in_deterministic_order(
+        self,
+    ) -> None:
+        """Test that the use case is given workflow.as_completed, since
+        asyncio.as_completed is not deterministic under replay."""
+        use_case = MagicMock()
+        use_case.validate_document = AsyncMock(
+            return_value=MagicMock(validation_id="validation-1")
+        )
+
+        with patch("temporalio.workflow.info"), patch(
+            "temporalio.workflow.logger"
+        ), patch(
+            "julee_example.workflows.validate_document."
+            "ValidateDocumentUseCase",
+            return_value=use_case,
+        ) as mock_use_case_class:
+            await ValidateDocumentWorkflow().run("doc-1", "policy-1")
+
+        kwargs = mock_use_case_class.call_args.kwargs
+        assert kwargs["as_completed"] is workflow.as_completed
+        assert kwargs["now_fn"] is workflow.now
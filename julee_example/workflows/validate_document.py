@@ -140,6 +140,7 @@ class ValidateDocumentWorkflow:
                 document_policy_validation_repo=document_policy_validation_repo,
                 knowledge_service=knowledge_service,
                 now_fn=workflow.now,
+                as_completed=workflow.as_completed,
             )
 
             workflow.logger.debug(
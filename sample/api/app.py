@@ -2,11 +2,11 @@
 FastAPI application for order processing.
 """
 
+import hashlib
 import logging
-import os
 import uuid  # New import for file_id generation
-from typing import Optional, Any
-import json  # New import for JSON parsing
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Dict, Optional, Any, Union
 
 from fastapi import (
     FastAPI,
@@ -16,11 +16,20 @@ from fastapi import (
     UploadFile,
     File,
     Form,
+    Header,
 )  # Added Form, Body
-from fastapi.responses import RedirectResponse
+from fastapi.responses import (
+    RedirectResponse,
+    StreamingResponse,
+)
+from pydantic import BaseModel
+from pydantic_core import from_json
 from temporalio.client import Client
+from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
 
 from sample.domain import (
+    CancelOrderInput,
     CreateOrderRequest,
 )  # Updated import path for CreateOrderRequest
 from sample.api.responses import (
@@ -42,54 +51,144 @@ from sample.usecase import (
 from sample.api.requests import (
     CancelOrderRequest,
 )
-from util.repositories import FileStorageRepository
+from util.domain import FileMetadata, FileStreamUploadArgs, FileUploadArgs
+from util.repositories import (
+    FileStorageRepository,
+    StreamingFileStorageRepository,
+)
 from sample.api.dependencies import (
     get_minio_order_request_repository,
     get_get_order_use_case,
+    connect_temporal_client,
     get_temporal_client,
     get_minio_file_storage_repository,
 )
+from util.logging_config import setup_logging
 
+logger = logging.getLogger(__name__)
 
-def setup_logging() -> None:
-    """Configure logging based on environment variables"""
-    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    log_format = os.environ.get(
-        "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
 
-    # Validate log level
-    numeric_level = getattr(logging, log_level, None)
-    if not isinstance(numeric_level, int):
-        print(f"Invalid log level: {log_level}, defaulting to INFO")
-        numeric_level = logging.INFO
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Connect to Temporal once and share the client across requests."""
+    setup_logging()
 
-    logging.basicConfig(
-        level=numeric_level,
-        format=log_format,
-        force=True,  # Override any existing configuration
-    )
+    app.state.temporal_client = await connect_temporal_client()
+    logger.info("Temporal client connected for application lifetime")
+    yield
 
 
-# Setup logging when module is imported
-setup_logging()
-logger = logging.getLogger(__name__)
+app = FastAPI(
+    title="Order Fulfillment API",
+    lifespan=lifespan,
+)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a response model with pydantic-core in a single pass.
+
+    Returning a Response skips FastAPI's jsonable_encoder walk and
+    response_model re-validation; the route's response_model still
+    documents the schema.
+    """
+    return Response(
+        content=model.model_dump_json(), media_type="application/json"
+    )
 
-app = FastAPI(title="Order Fulfillment API")
+
+# The health payload never changes, so it is serialized once
+_HEALTH_BODY = HealthCheckResponse(
+    status="ok", version="1.0.0"
+).model_dump_json()
 
 
 @app.get("/health", response_model=HealthCheckResponse)
-async def health_check() -> HealthCheckResponse:
+async def health_check() -> Response:
     """Health check endpoint"""
     logger.debug("Health check requested")
-    return HealthCheckResponse(status="ok", version="1.0.0")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Workflow start options for idempotent submissions. A repeated start
+# while the first run is still going fails under the default conflict
+# policy, and REJECT_DUPLICATE makes one after it has finished fail too,
+# so every duplicate surfaces as WorkflowAlreadyStartedError
+_IDEMPOTENT_START_OPTIONS: Dict[str, Any] = {
+    "id_reuse_policy": WorkflowIDReusePolicy.REJECT_DUPLICATE,
+}
+
+# Idempotency keys end up in workflow IDs and Minio object names, so only
+# a conservative character set is accepted
+_IDEMPOTENCY_KEY_PATTERN = r"^[A-Za-z0-9_-]{1,128}$"
+
+
+def _idempotency_digest(scope: str, idempotency_key: str) -> str:
+    """Digest of an Idempotency-Key within the scope it applies to.
+
+    Hashing keeps the scope and the client's key out of workflow IDs and
+    object names, and bounds their length.
+    """
+    return hashlib.sha256(
+        f"{scope}\0{idempotency_key}".encode("utf-8")
+    ).hexdigest()[:32]
+
+
+def _idempotent_request_id(customer_id: str, idempotency_key: str) -> str:
+    """Request ID for an order submitted with an Idempotency-Key.
+
+    The key is scoped to the customer, so two customers sending the same
+    key get separate requests.
+    """
+    return f"req-{_idempotency_digest(customer_id, idempotency_key)}"
+
+
+def _idempotent_cancel_request_id(order_id: str, idempotency_key: str) -> str:
+    """Workflow ID for a cancellation submitted with an Idempotency-Key.
+
+    The key is scoped to the order being cancelled.
+    """
+    return f"cancel-req-{_idempotency_digest(order_id, idempotency_key)}"
+
+
+# Memo key holding the fingerprint of the input an idempotent workflow
+# was started for
+_REQUEST_HASH_MEMO_KEY = "request_hash"
+
+
+def _request_hash(request: BaseModel) -> str:
+    """Fingerprint of a workflow input, to tell a retry from a key reused
+    for a different request."""
+    return hashlib.sha256(
+        request.model_dump_json().encode("utf-8")
+    ).hexdigest()
+
+
+async def _started_with_same_request(
+    client: Client, request_id: str, request_hash: str
+) -> bool:
+    """Whether the existing workflow for request_id was started for an
+    input with the given fingerprint."""
+    description = await client.get_workflow_handle(request_id).describe()
+    stored_hash = await description.memo_value(_REQUEST_HASH_MEMO_KEY, None)
+    return bool(stored_hash == request_hash)
 
 
 @app.post("/orders", response_model=OrderRequestResponse)
-async def create_order(request: CreateOrderRequest) -> OrderRequestResponse:
+async def create_order(
+    request: CreateOrderRequest,
+    client: Client = Depends(get_temporal_client),
+    idempotency_key: Optional[str] = Header(
+        default=None, pattern=_IDEMPOTENCY_KEY_PATTERN
+    ),
+) -> Response:
     """
     Create a new order request and start the fulfillment workflow
     asynchronously. Returns immediately with a request_id for tracking.
+
+    When an Idempotency-Key header is given, the request_id is derived
+    from it and the customer_id, so a retried submission returns the
+    original request_id without starting a second workflow. Reusing the
+    key for a different order is rejected with 422.
     """
     logger.info(
         "Order creation requested",
@@ -101,12 +200,20 @@ async def create_order(request: CreateOrderRequest) -> OrderRequestResponse:
     )
 
     try:
-        # Connect to Temporal server
-        client = await get_temporal_client()
-
         # Generate request ID
-        request_id = f"req-{hash(str(request))}"
-        logger.debug("Generated request ID", extra={"request_id": request_id})
+        start_options: Dict[str, Any]
+        if idempotency_key is not None:
+            request_id = _idempotent_request_id(
+                request.customer_id, idempotency_key
+            )
+            request_hash = _request_hash(request)
+            start_options = {
+                **_IDEMPOTENT_START_OPTIONS,
+                "memo": {_REQUEST_HASH_MEMO_KEY: request_hash},
+            }
+        else:
+            request_id = f"req-{uuid.uuid4().hex}"
+            start_options = {}
 
         # Start the workflow asynchronously, don't wait for result
         logger.debug(
@@ -118,24 +225,54 @@ async def create_order(request: CreateOrderRequest) -> OrderRequestResponse:
             },
         )
 
-        await client.start_workflow(
-            OrderFulfillmentWorkflow.run,
-            request.model_dump(mode="json"),
-            id=request_id,
-            task_queue="order-fulfillment-queue",
-        )
-
-        logger.info(
-            "Order workflow started",
-            extra={
-                "request_id": request_id,
-                "customer_id": request.customer_id,
-            },
-        )
+        try:
+            await client.start_workflow(
+                OrderFulfillmentWorkflow.run,
+                request,
+                id=request_id,
+                task_queue="order-fulfillment-queue",
+                **start_options,
+            )
+        except WorkflowAlreadyStartedError:
+            # Only raised for idempotent submissions
+            if not await _started_with_same_request(
+                client, request_id, request_hash
+            ):
+                logger.warning(
+                    "Idempotency-Key reused for a different order",
+                    extra={
+                        "request_id": request_id,
+                        "customer_id": request.customer_id,
+                    },
+                )
+                raise HTTPException(
+                    status_code=422,
+                    detail="Idempotency-Key was already used for a "
+                    "different order.",
+                )
+            logger.info(
+                "Duplicate order submission, returning existing request",
+                extra={
+                    "request_id": request_id,
+                    "customer_id": request.customer_id,
+                },
+            )
+        else:
+            logger.info(
+                "Order workflow started",
+                extra={
+                    "request_id": request_id,
+                    "customer_id": request.customer_id,
+                },
+            )
 
         # Return immediately with request ID
-        return OrderRequestResponse(request_id=request_id, status="SUBMITTED")
+        return _json_response(
+            OrderRequestResponse(request_id=request_id, status="SUBMITTED")
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to create order",
@@ -153,17 +290,29 @@ async def create_order(request: CreateOrderRequest) -> OrderRequestResponse:
         )
 
 
-@app.get("/order-requests/{request_id}", response_model=None)
+@app.get(
+    "/order-requests/{request_id}",
+    response_model=Union[OrderStatusResponse, OrderRequestStatusResponse],
+    responses={
+        302: {
+            "description": "Redirect to the order status endpoint, for "
+            "clients that accept text/html once the order exists",
+        },
+    },
+)
 async def get_request_status(
     request_id: str,
     request_repo: Any = Depends(
         get_minio_order_request_repository
     ),  # Changed to use direct Minio repo
-) -> Any:
+    use_case: GetOrderUseCase = Depends(get_get_order_use_case),
+    accept: Optional[str] = Header(default=None),
+) -> Response:
     """
     Get the status of an order request.
-    If the request has progressed to order creation, redirect to the order
-    endpoint.
+    If the request has progressed to order creation, return the order
+    status inline so API clients need a single round-trip. Browsers
+    (Accept: text/html) are redirected to the order endpoint instead.
     """
     logger.debug("Request status check", extra={"request_id": request_id})
 
@@ -172,21 +321,30 @@ async def get_request_status(
         order_id = await request_repo.get_order_id_for_request(request_id)
 
         if order_id:
+            if accept is not None and "text/html" in accept:
+                logger.info(
+                    "Request has progressed to order, redirecting",
+                    extra={"request_id": request_id, "order_id": order_id},
+                )
+                return RedirectResponse(
+                    url=f"/orders/{order_id}", status_code=302
+                )
+
             logger.info(
-                "Request has progressed to order, redirecting",
+                "Request has progressed to order, returning its status",
                 extra={"request_id": request_id, "order_id": order_id},
             )
-            # We have an order ID, redirect to order endpoint
-            return RedirectResponse(
-                url=f"/orders/{order_id}", status_code=302
-            )
+            result = await use_case.get_order_status(order_id)
+            return _json_response(result)
         else:
             logger.debug(
                 "Request still processing", extra={"request_id": request_id}
             )
             # No mapping found, request is still being processed
-            return OrderRequestStatusResponse(
-                request_id=request_id, status="SUBMITTED"
+            return _json_response(
+                OrderRequestStatusResponse(
+                    request_id=request_id, status="SUBMITTED"
+                )
             )
 
     except Exception as e:
@@ -211,7 +369,7 @@ async def get_request_status(
 async def get_order_status(
     order_id: str,
     use_case: GetOrderUseCase = Depends(get_get_order_use_case),
-) -> OrderStatusResponse:
+) -> Response:
     """
     Get the status of an order by querying the use case directly.
     """
@@ -226,9 +384,8 @@ async def get_order_status(
             extra={"order_id": order_id, "status": result.status},
         )
 
-        # The use case returns OrderStatusResponse directly - FastAPI will
-        # serialize it
-        return result
+        # The use case returns OrderStatusResponse directly
+        return _json_response(result)
 
     except Exception as e:
         logger.error(
@@ -262,7 +419,7 @@ async def upload_order_attachment(
     file_storage_repo: FileStorageRepository = Depends(
         get_minio_file_storage_repository
     ),
-) -> FileUploadResponse:
+) -> Response:
     """
     Uploads an attachment for a specific order.
     The file content is passed directly, and additional metadata can be
@@ -281,10 +438,9 @@ async def upload_order_attachment(
     )
 
     try:
-        file_content = await file.read()
-
-        # Validate file is not empty
-        if not file_content:
+        # Validate file is not empty. The spooled upload knows its size, so
+        # this doesn't need to read the content.
+        if file.size == 0:
             raise HTTPException(
                 status_code=400, detail="File cannot be empty"
             )
@@ -293,8 +449,21 @@ async def upload_order_attachment(
             uuid.uuid4()
         )  # Generate a unique ID for the file in storage
 
-        # Parse the metadata string from the form into a dictionary
-        parsed_metadata = json.loads(metadata_json_str)
+        # Parse the metadata string from the form into a dictionary.
+        # pydantic_core raises ValueError, which the security validation
+        # errors below also use, so report bad JSON here.
+        try:
+            parsed_metadata = from_json(metadata_json_str)
+        except ValueError as e:
+            logger.error(
+                "Invalid JSON in metadata form field",
+                extra={"order_id": order_id, "error": str(e)},
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid JSON in metadata field: {e}",
+            )
 
         # Get content type, defaulting to octet-stream if not provided
         content_type = (
@@ -324,17 +493,40 @@ async def upload_order_attachment(
 
         # Upload via repository (security validation happens in repository
         # layer)
-        from util.domain import FileUploadArgs
+        if (
+            isinstance(file_storage_repo, StreamingFileStorageRepository)
+            and file.size is not None
+        ):
+            # Stream from the spooled upload so the attachment is never
+            # held in memory as a whole
+            stream_args = FileStreamUploadArgs(
+                file_id=file_id,
+                size_bytes=file.size,
+                metadata=combined_metadata,
+                content_type=content_type,
+                filename=filename,
+            )
+            file_metadata = await file_storage_repo.upload_file_stream(
+                stream_args, file.file
+            )
+        else:
+            file_content = await file.read()
 
-        upload_args = FileUploadArgs(
-            file_id=file_id,
-            data=file_content,
-            metadata=combined_metadata,
-            content_type=content_type,
-            filename=filename,
-        )
+            # Size unknown up front, so check the content read instead
+            if not file_content:
+                raise HTTPException(
+                    status_code=400, detail="File cannot be empty"
+                )
+
+            upload_args = FileUploadArgs(
+                file_id=file_id,
+                data=file_content,
+                metadata=combined_metadata,
+                content_type=content_type,
+                filename=filename,
+            )
 
-        file_metadata = await file_storage_repo.upload_file(upload_args)
+            file_metadata = await file_storage_repo.upload_file(upload_args)
 
         logger.info(
             "Attachment uploaded successfully",
@@ -345,23 +537,18 @@ async def upload_order_attachment(
             },
         )
 
-        return FileUploadResponse(
-            file_id=file_metadata.file_id,
-            message="File uploaded successfully",
-            filename=file_metadata.filename,
-            content_type=file_metadata.content_type,
-            size_bytes=file_metadata.size_bytes,
-            metadata=file_metadata.metadata,
-        )
-    except json.JSONDecodeError as e:
-        logger.error(
-            "Invalid JSON in metadata form field",
-            extra={"order_id": order_id, "error": str(e)},
-            exc_info=True,
-        )
-        raise HTTPException(
-            status_code=422, detail=f"Invalid JSON in metadata field: {e}"
+        return _json_response(
+            FileUploadResponse(
+                file_id=file_metadata.file_id,
+                message="File uploaded successfully",
+                filename=file_metadata.filename,
+                content_type=file_metadata.content_type,
+                size_bytes=file_metadata.size_bytes,
+                metadata=file_metadata.metadata,
+            )
         )
+    except HTTPException:
+        raise  # Re-raise HTTPExceptions (e.g., 400, 422)
     except ValueError as e:
         # Security validation errors from domain model or repository
         raise HTTPException(status_code=400, detail=str(e))
@@ -391,6 +578,17 @@ async def upload_order_attachment(
         )
 
 
+def _attachment_headers(
+    file_metadata: FileMetadata, file_id: str
+) -> Dict[str, str]:
+    """Response headers for serving a stored file as an attachment."""
+    return {
+        "Content-Disposition": (
+            f'attachment; filename="{file_metadata.filename or file_id}"'
+        )
+    }
+
+
 @app.get("/orders/{order_id}/attachments/{file_id}")
 async def download_order_attachment(
     order_id: str,
@@ -409,9 +607,44 @@ async def download_order_attachment(
     )
 
     try:
-        # First, get metadata to verify ownership and content type
-        file_metadata = await file_storage_repo.get_file_metadata(file_id)
-        if not file_metadata:
+        if isinstance(file_storage_repo, StreamingFileStorageRepository):
+            # Metadata and content come back from a single storage request
+            # and the body is streamed out without buffering it whole
+            opened = await file_storage_repo.download_file_stream(file_id)
+            if opened is None:
+                logger.warning(
+                    "Attachment not found or not associated with order",
+                    extra={"order_id": order_id, "file_id": file_id},
+                )
+                raise HTTPException(
+                    status_code=404,
+                    detail="Attachment not found or not associated with "
+                    "this order.",
+                )
+
+            stream_metadata, file_chunks = opened
+            headers = _attachment_headers(stream_metadata, file_id)
+            if stream_metadata.size_bytes is not None:
+                headers["Content-Length"] = str(stream_metadata.size_bytes)
+            logger.info(
+                "Attachment download streaming",
+                extra={
+                    "order_id": order_id,
+                    "file_id": file_id,
+                    "size_bytes": stream_metadata.size_bytes,
+                },
+            )
+            return StreamingResponse(
+                file_chunks,
+                media_type=stream_metadata.content_type
+                or "application/octet-stream",
+                headers=headers,
+            )
+
+        # Fetch the content first so a missing file is answered with a
+        # single storage request; metadata is only needed for the headers
+        file_content = await file_storage_repo.download_file(file_id)
+        if file_content is None:
             logger.warning(
                 "Attachment not found or not associated with order",
                 extra={"order_id": order_id, "file_id": file_id},
@@ -422,15 +655,14 @@ async def download_order_attachment(
                 "order.",
             )
 
-        file_content = await file_storage_repo.download_file(file_id)
-
-        if file_content is None:
+        file_metadata = await file_storage_repo.get_file_metadata(file_id)
+        if file_metadata is None:
             logger.error(
-                "Failed to retrieve file content despite metadata existing",
+                "Failed to retrieve file metadata despite content existing",
                 extra={"order_id": order_id, "file_id": file_id},
             )
             raise HTTPException(
-                status_code=500, detail="Failed to retrieve file content."
+                status_code=500, detail="Failed to retrieve file metadata."
             )
 
         logger.info(
@@ -446,12 +678,7 @@ async def download_order_attachment(
             content=file_content,
             media_type=file_metadata.content_type
             or "application/octet-stream",
-            headers={
-                "Content-Disposition": (
-                    "attachment; "
-                    f'filename="{file_metadata.filename or file_id}"'
-                )
-            },
+            headers=_attachment_headers(file_metadata, file_id),
         )
     except RuntimeError as e:
         logger.error(
@@ -494,7 +721,7 @@ async def get_order_attachment_metadata(
     file_storage_repo: FileStorageRepository = Depends(
         get_minio_file_storage_repository
     ),
-) -> FileDownloadResponse:
+) -> Response:
     """
     Retrieves metadata for an attachment for a specific order.
     Does not return the file content.
@@ -524,13 +751,15 @@ async def get_order_attachment_metadata(
             "Attachment metadata retrieved successfully",
             extra={"order_id": order_id, "file_id": file_id},
         )
-        return FileDownloadResponse(
-            file_id=file_metadata.file_id,
-            filename=file_metadata.filename,
-            content_type=file_metadata.content_type,
-            size_bytes=file_metadata.size_bytes,
-            uploaded_at=file_metadata.uploaded_at,
-            metadata=file_metadata.metadata,
+        return _json_response(
+            FileDownloadResponse(
+                file_id=file_metadata.file_id,
+                filename=file_metadata.filename,
+                content_type=file_metadata.content_type,
+                size_bytes=file_metadata.size_bytes,
+                uploaded_at=file_metadata.uploaded_at,
+                metadata=file_metadata.metadata,
+            )
         )
     except RuntimeError as e:
         logger.error(
@@ -568,10 +797,17 @@ async def cancel_order(
     order_id: str,
     request: CancelOrderRequest,
     client: Client = Depends(get_temporal_client),
-) -> CancelOrderResponse:
+    idempotency_key: Optional[str] = Header(
+        default=None, pattern=_IDEMPOTENCY_KEY_PATTERN
+    ),
+) -> Response:
     """
     Initiate the cancellation of an order by starting the CancelOrderWorkflow
     asynchronously. Returns immediately with a request_id for tracking.
+
+    Honours an Idempotency-Key header like create_order; here the key is
+    scoped to the order being cancelled. Reusing the key with a different
+    reason is rejected with 422.
     """
     logger.info(
         "Order cancellation requested via API",
@@ -582,8 +818,24 @@ async def cancel_order(
     )
 
     try:
+        cancel_input = CancelOrderInput(
+            order_id=order_id, reason=request.reason
+        )
+
         # Generate a unique workflow ID for the cancellation request
-        cancel_request_id = f"cancel-req-{order_id}-{uuid.uuid4()}"
+        start_options: Dict[str, Any]
+        if idempotency_key is not None:
+            cancel_request_id = _idempotent_cancel_request_id(
+                order_id, idempotency_key
+            )
+            request_hash = _request_hash(cancel_input)
+            start_options = {
+                **_IDEMPOTENT_START_OPTIONS,
+                "memo": {_REQUEST_HASH_MEMO_KEY: request_hash},
+            }
+        else:
+            cancel_request_id = f"cancel-req-{order_id}-{uuid.uuid4()}"
+            start_options = {}
 
         logger.debug(
             "Starting CancelOrderWorkflow",
@@ -597,29 +849,59 @@ async def cancel_order(
 
         # Start the cancellation workflow asynchronously, don't wait for
         # result
-        await client.start_workflow(
-            CancelOrderWorkflow.run,
-            {"order_id": order_id, "reason": request.reason},
-            id=cancel_request_id,
-            task_queue="order-fulfillment-queue",
-        )
-
-        logger.info(
-            "Order cancellation workflow started",
-            extra={
-                "order_id": order_id,
-                "cancel_request_id": cancel_request_id,
-            },
-        )
+        try:
+            await client.start_workflow(
+                CancelOrderWorkflow.run,
+                cancel_input,
+                id=cancel_request_id,
+                task_queue="order-fulfillment-queue",
+                **start_options,
+            )
+        except WorkflowAlreadyStartedError:
+            # Only raised for idempotent submissions
+            if not await _started_with_same_request(
+                client, cancel_request_id, request_hash
+            ):
+                logger.warning(
+                    "Idempotency-Key reused for a different cancellation",
+                    extra={
+                        "order_id": order_id,
+                        "cancel_request_id": cancel_request_id,
+                    },
+                )
+                raise HTTPException(
+                    status_code=422,
+                    detail="Idempotency-Key was already used for a "
+                    "different cancellation.",
+                )
+            logger.info(
+                "Duplicate cancellation request, returning existing request",
+                extra={
+                    "order_id": order_id,
+                    "cancel_request_id": cancel_request_id,
+                },
+            )
+        else:
+            logger.info(
+                "Order cancellation workflow started",
+                extra={
+                    "order_id": order_id,
+                    "cancel_request_id": cancel_request_id,
+                },
+            )
 
         # Return immediately with request ID
-        return CancelOrderResponse(
-            order_id=order_id,
-            status="CANCELLATION_INITIATED",
-            reason="Cancellation workflow started",
-            request_id=cancel_request_id,
+        return _json_response(
+            CancelOrderResponse(
+                order_id=order_id,
+                status="CANCELLATION_INITIATED",
+                reason="Cancellation workflow started",
+                request_id=cancel_request_id,
+            )
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Failed to initiate order cancellation",
@@ -2,11 +2,12 @@
 Dependency injection for FastAPI endpoints.
 """
 
+import inspect
 import os
 import logging
 from typing import Any, Dict
 
-from fastapi import Depends
+from fastapi import Request
 from temporalio.client import Client
 from temporalio.contrib.pydantic import pydantic_data_converter
 
@@ -14,6 +15,10 @@ from sample.repositories import (
     OrderRequestRepository,
 )
 from util.repositories import FileStorageRepository  # Updated import path
+from util.repos.minio.file_storage import MinioFileStorageRepository
+from util.repos.temporal.minio_file_storage import (
+    TemporalMinioFileStorageRepository,
+)
 
 from sample.repos.minio.order_request import MinioOrderRequestRepository
 from sample.repos.minio.order import MinioOrderRepository
@@ -28,6 +33,9 @@ from sample.validation import (
 
 logger = logging.getLogger(__name__)
 
+# Marks a missing container entry, so a cached None is still a hit
+_MISSING = object()
+
 
 class DependencyContainer:
     """
@@ -35,14 +43,23 @@ class DependencyContainer:
     Always creates real clients; mocks are provided by test overrides.
     """
 
+    __slots__ = ("_instances",)
+
     def __init__(self) -> None:
         self._instances: Dict[str, Any] = {}
 
     async def get_or_create(self, key: str, factory: Any) -> Any:
-        """Get or create a singleton instance."""
-        if key not in self._instances:
-            self._instances[key] = await factory()
-        return self._instances[key]
+        """Get or create a singleton instance.
+
+        The factory may be a plain callable or a coroutine function.
+        """
+        instance = self._instances.get(key, _MISSING)
+        if instance is _MISSING:
+            instance = factory()
+            if inspect.isawaitable(instance):
+                instance = await instance
+            self._instances[key] = instance
+        return instance
 
     async def get_temporal_client(self) -> Client:
         """Get or create Temporal client."""
@@ -81,23 +98,44 @@ class DependencyContainer:
 _container = DependencyContainer()
 
 
-async def get_temporal_client() -> Client:
-    """FastAPI dependency for Temporal client."""
+async def connect_temporal_client() -> Client:
+    """Connect to Temporal, reusing the container's singleton client."""
     return await _container.get_temporal_client()
 
 
+async def get_temporal_client(request: Request) -> Client:
+    """FastAPI dependency for Temporal client.
+
+    Returns the client stored on app.state by the application lifespan.
+    Falls back to connecting on first use when the lifespan has not run
+    (e.g. a TestClient used without a context manager).
+
+    Kept async on purpose: FastAPI runs plain def dependencies in its
+    threadpool, so a sync version would add a thread hop per request,
+    while an async one returning the cached client runs inline.
+    """
+    client = getattr(request.app.state, "temporal_client", None)
+    if client is None:
+        client = await connect_temporal_client()
+        request.app.state.temporal_client = client
+    return client  # type: ignore[no-any-return]
+
+
 async def get_minio_order_request_repository() -> OrderRequestRepository:
     """FastAPI dependency for direct Minio OrderRequestRepository."""
-    return MinioOrderRequestRepository()
+    repo = await _container.get_or_create(
+        "minio_order_request_repository", MinioOrderRequestRepository
+    )
+    return repo  # type: ignore[no-any-return]
 
 
 async def get_temporal_file_storage_repository() -> FileStorageRepository:
     """FastAPI dependency for FileStorageRepository."""
-    from util.repos.temporal.minio_file_storage import (
+    repo = await _container.get_or_create(
+        "temporal_file_storage_repository",
         TemporalMinioFileStorageRepository,
     )
-
-    return TemporalMinioFileStorageRepository()
+    return repo  # type: ignore[no-any-return]
 
 
 def _get_minio_endpoint() -> str:
@@ -108,33 +146,52 @@ def _get_minio_endpoint() -> str:
 async def get_minio_order_repository() -> MinioOrderRepository:
     """FastAPI dependency for direct Minio OrderRepository."""
     # Instantiated directly, bypassing Temporal proxies
-    return MinioOrderRepository(endpoint=_get_minio_endpoint())
+    repo = await _container.get_or_create(
+        "minio_order_repository",
+        lambda: MinioOrderRepository(endpoint=_get_minio_endpoint()),
+    )
+    return repo  # type: ignore[no-any-return]
 
 
 async def get_minio_payment_repository() -> MinioPaymentRepository:
     """FastAPI dependency for direct Minio PaymentRepository."""
     # Instantiated directly, bypassing Temporal proxies
-    return MinioPaymentRepository(endpoint=_get_minio_endpoint())
-
-
-async def get_get_order_use_case(
-    order_repo: MinioOrderRepository = Depends(get_minio_order_repository),
-    payment_repo: MinioPaymentRepository = Depends(
-        get_minio_payment_repository
-    ),
-) -> GetOrderUseCase:
-    """FastAPI dependency for GetOrderUseCase."""
-    return GetOrderUseCase(
-        order_repo=ensure_order_repository(order_repo),
-        payment_repo=ensure_payment_repository(payment_repo),
+    repo = await _container.get_or_create(
+        "minio_payment_repository",
+        lambda: MinioPaymentRepository(endpoint=_get_minio_endpoint()),
     )
+    return repo  # type: ignore[no-any-return]
+
+
+async def get_get_order_use_case() -> GetOrderUseCase:
+    """FastAPI dependency for GetOrderUseCase.
+
+    Built once from the shared repositories, so the protocol validation
+    below does not run on every request.
+    """
+
+    async def create_use_case() -> GetOrderUseCase:
+        return GetOrderUseCase(
+            order_repo=ensure_order_repository(
+                await get_minio_order_repository()
+            ),
+            payment_repo=ensure_payment_repository(
+                await get_minio_payment_repository()
+            ),
+        )
+
+    use_case = await _container.get_or_create(
+        "get_order_use_case", create_use_case
+    )
+    return use_case  # type: ignore[no-any-return]
 
 
 async def get_minio_file_storage_repository() -> FileStorageRepository:
     """FastAPI dependency for direct Minio FileStorageRepository."""
-    from util.repos.minio.file_storage import MinioFileStorageRepository
-
-    return MinioFileStorageRepository()
+    repo = await _container.get_or_create(
+        "minio_file_storage_repository", MinioFileStorageRepository
+    )
+    return repo  # type: ignore[no-any-return]
 
 
 # Note: OrderFulfillmentUseCase and CancelOrderUseCase are used within
@@ -5,15 +5,18 @@ These are pure data structures with validation.
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     field_validator,
 )
 from typing import Optional, List, Literal, Any
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class OrderItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     product_id: str
     quantity: int
     price: Decimal
@@ -33,39 +36,20 @@ class OrderItem(BaseModel):
         return v
 
 
-class OrderItemRequest(BaseModel):
-    """Request model for order items in API requests."""
-
-    product_id: str
-    quantity: int
-    price: Decimal
-
-    @field_validator("quantity")
-    @classmethod
-    def quantity_must_be_positive(cls, v: int) -> int:
-        if v <= 0:
-            raise ValueError("Quantity must be positive")
-        return v
-
-    @field_validator("price")
-    @classmethod
-    def price_must_be_positive(cls, v: Decimal) -> Decimal:
-        if v <= 0:
-            raise ValueError("Price must be positive")
-        return v
+# API order lines use the domain item directly: it is frozen, so the items
+# of a request can be handed to the Order without validating them again
+OrderItemRequest = OrderItem
 
 
 class CreateOrderRequest(BaseModel):
     """Request model for creating an order."""
 
     customer_id: str
-    items: List[OrderItemRequest]
+    items: List[OrderItem]
 
     @field_validator("items")
     @classmethod
-    def items_must_not_be_empty(
-        cls, v: List[OrderItemRequest]
-    ) -> List[OrderItemRequest]:
+    def items_must_not_be_empty(cls, v: List[OrderItem]) -> List[OrderItem]:
         if not v:
             raise ValueError("Order must contain at least one item")
         return v
@@ -74,8 +58,17 @@ class CreateOrderRequest(BaseModel):
     def total_amount(self) -> Decimal:
         """Calculate total amount from items."""
         return sum(
-            item.price * item.quantity for item in self.items
-        ) or Decimal("0")
+            (item.price * item.quantity for item in self.items), Decimal(0)
+        )
+
+
+class CancelOrderInput(BaseModel):
+    """Input for the order cancellation workflow."""
+
+    model_config = ConfigDict(frozen=True)
+
+    order_id: str
+    reason: Optional[str] = None
 
 
 class Order(BaseModel):
@@ -114,6 +107,8 @@ class Order(BaseModel):
 
 
 class Payment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     payment_id: str
     order_id: str
     amount: Decimal
@@ -131,6 +126,8 @@ class Payment(BaseModel):
 class PaymentOutcome(BaseModel):
     """Result of a payment processing attempt."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: Literal["completed", "failed", "refunded"]
     payment: Optional[Payment] = None
     reason: Optional[str] = None
@@ -150,6 +147,8 @@ class PaymentOutcome(BaseModel):
 class RefundPaymentArgs(BaseModel):
     """Arguments for refunding a payment."""
 
+    model_config = ConfigDict(frozen=True)
+
     payment_id: str
     order_id: str
     amount: Decimal
@@ -166,6 +165,8 @@ class RefundPaymentArgs(BaseModel):
 class RefundPaymentOutcome(BaseModel):
     """Result of a payment refund attempt."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: Literal["refunded", "failed"]
     refund_id: Optional[str] = None
     reason: Optional[str] = None
@@ -183,6 +184,8 @@ class RefundPaymentOutcome(BaseModel):
 
 
 class InventoryItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     product_id: str
     quantity: int
     reserved: int = 0
@@ -205,6 +208,8 @@ class InventoryItem(BaseModel):
 class InventoryReservationOutcome(BaseModel):
     """Result of an inventory reservation attempt."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: Literal["reserved", "failed"]
     reserved_items: Optional[List[InventoryItem]] = None
     reason: Optional[str] = None
@@ -227,5 +232,5 @@ class RequestOrderMapping(BaseModel):
     request_id: str
     order_id: str
     created_at: str = Field(
-        default_factory=lambda: datetime.utcnow().isoformat()
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
@@ -0,0 +1,29 @@
+"""
+Shared HTTP connection pool for the sample Minio repositories.
+
+Each Minio() client otherwise creates its own urllib3 pool of 10
+connections, so the order, payment, inventory and request-mapping
+repositories would each keep (and re-open) their own connections to the
+same endpoint. Building every client on the pool returned here lets them
+share keep-alive connections within the process.
+"""
+
+import functools
+
+import urllib3
+
+from util.repos.minio.http_client import create_minio_http_client
+
+# Most threads expected to call Minio at once (e.g. inventory items
+# persisted via asyncio.to_thread while other activities run)
+MAX_CONCURRENT_MINIO_CALLS = 32
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_http_client() -> urllib3.PoolManager:
+    """Return the process-wide urllib3 pool for Minio clients.
+
+    Returns:
+        PoolManager to pass as Minio(..., http_client=...)
+    """
+    return create_minio_http_client(MAX_CONCURRENT_MINIO_CALLS)
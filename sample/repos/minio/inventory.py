@@ -2,17 +2,25 @@
 Minio implementation of InventoryRepository.
 """
 
+import asyncio
+import hashlib
 import io
 import logging
-from typing import List
+from typing import Dict, List, Optional
 from minio import Minio  # type: ignore[import-untyped]
 from minio.error import S3Error  # type: ignore[import-untyped]
 
 from sample.domain import Order, InventoryItem, InventoryReservationOutcome
 from sample.repositories import InventoryRepository
+from sample.repos.minio.client import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
+# Most inventory item writes of one reserve or release in flight at once,
+# so a large order neither floods Minio nor takes every default-executor
+# thread
+DEFAULT_MAX_CONCURRENT_WRITES = 16
+
 
 class MinioInventoryRepository(InventoryRepository):
     """
@@ -20,7 +28,14 @@ class MinioInventoryRepository(InventoryRepository):
     persistence.
     """
 
-    def __init__(self, endpoint: str):
+    def __init__(
+        self,
+        endpoint: str,
+        max_concurrent_writes: int = DEFAULT_MAX_CONCURRENT_WRITES,
+    ):
+        if max_concurrent_writes < 1:
+            raise ValueError("max_concurrent_writes must be at least 1")
+
         minio_endpoint = endpoint
         logger.debug(
             "Initializing MinioInventoryRepository",
@@ -32,8 +47,10 @@ class MinioInventoryRepository(InventoryRepository):
             access_key="minioadmin",
             secret_key="minioadmin",
             secure=False,
+            http_client=get_shared_http_client(),
         )
         self.bucket_name = "inventory"
+        self.max_concurrent_writes = max_concurrent_writes
         self._ensure_bucket_exists()
 
     def _ensure_bucket_exists(self) -> None:
@@ -57,6 +74,137 @@ class MinioInventoryRepository(InventoryRepository):
             )
             raise
 
+    def _existing_item_etags(self, order_id: str) -> Dict[str, str]:
+        """ETags of the order's stored inventory items, keyed by object.
+
+        One LIST over the order's prefix replaces a HEAD per item.
+        """
+        return {
+            obj.object_name: obj.etag
+            for obj in self.client.list_objects(
+                self.bucket_name, prefix=f"{order_id}_", recursive=True
+            )
+        }
+
+    def _persist_item(
+        self,
+        order: Order,
+        item: InventoryItem,
+        existing_etag: Optional[str],
+        action: str,
+        log_prefix: str,
+    ) -> None:
+        """Write one inventory item to Minio unless it is already current."""
+        object_name = f"{order.order_id}_{item.product_id}"
+        item_json = item.model_dump_json().encode("utf-8")
+        data_stream = io.BytesIO(item_json)
+
+        # This runs once per order item, so its debug lines are guarded:
+        # the formatted message and extra dict would otherwise be built
+        # for every item even with DEBUG off
+
+        try:
+            # Skip the write if the content is already stored
+            # (idempotency): for a single-part put the ETag is the MD5 of
+            # the content
+            if existing_etag is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"{log_prefix} - Item object not found, creating new",
+                        extra={
+                            "order_id": order.order_id,
+                            "product_id": item.product_id,
+                            "object_name": object_name,
+                        },
+                    )
+            elif (
+                existing_etag
+                == hashlib.md5(item_json, usedforsecurity=False).hexdigest()
+            ):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"{log_prefix} - Item already in correct state",
+                        extra={
+                            "order_id": order.order_id,
+                            "product_id": item.product_id,
+                            "object_name": object_name,
+                        },
+                    )
+                return  # Skip put_object if state is correct
+            else:
+                logger.warning(
+                    f"{log_prefix} - Item exists with different "
+                    "content, overwriting",
+                    extra={
+                        "order_id": order.order_id,
+                        "product_id": item.product_id,
+                        "object_name": object_name,
+                    },
+                )
+
+            # Perform put_object
+            self.client.put_object(
+                bucket_name=self.bucket_name,
+                object_name=object_name,
+                data=data_stream,
+                length=len(item_json),
+                metadata={"order_id": order.order_id, "action": action},
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"{log_prefix} - Item persisted to Minio",
+                    extra={
+                        "order_id": order.order_id,
+                        "product_id": item.product_id,
+                        "object_name": object_name,
+                        "action": action,
+                    },
+                )
+        except S3Error as e:
+            logger.error(
+                f"{log_prefix} - Failed to persist inventory item to "
+                "Minio",
+                extra={
+                    "order_id": order.order_id,
+                    "product_id": item.product_id,
+                    "object_name": object_name,
+                    "error": str(e),
+                },
+            )
+            raise
+        except Exception:
+            logger.error(
+                f"{log_prefix} - Unexpected error during inventory item "
+                "persistence",
+                extra={
+                    "order_id": order.order_id,
+                    "product_id": item.product_id,
+                    "object_name": object_name,
+                },
+                exc_info=True,
+            )
+            raise
+
+    async def _persist_item_bounded(
+        self,
+        write_slots: asyncio.Semaphore,
+        order: Order,
+        item: InventoryItem,
+        existing_etag: Optional[str],
+        action: str,
+        log_prefix: str,
+    ) -> None:
+        """Run _persist_item in a thread once a write slot is free."""
+        async with write_slots:
+            await asyncio.to_thread(
+                self._persist_item,
+                order,
+                item,
+                existing_etag,
+                action,
+                log_prefix,
+            )
+
     async def _persist_inventory_state(
         self, order: Order, reserved: bool
     ) -> List[InventoryItem]:
@@ -72,110 +220,45 @@ class MinioInventoryRepository(InventoryRepository):
             },
         )
 
-        items_to_return = []
-        for order_item in order.items:
-            item = InventoryItem(
+        items_to_return = [
+            InventoryItem(
                 product_id=order_item.product_id,
                 quantity=order_item.quantity,
                 # If reserved, all quantity is reserved. If releasing,
                 # reserved=0
                 reserved=order_item.quantity if reserved else 0,
             )
-            items_to_return.append(item)
+            for order_item in order.items
+        ]
 
-            object_name = f"{order.order_id}_{item.product_id}"
-            item_json = item.model_dump_json().encode("utf-8")
-            data_stream = io.BytesIO(item_json)
+        # Each product is stored as one object per order. Lines for the
+        # same product would race for that object once written
+        # concurrently, so only the last one is written, as it was the
+        # one that ended up stored when the lines were written in turn
+        items_to_write = {item.product_id: item for item in items_to_return}
 
-            try:
-                # Check if object exists and if content is same (idempotency)
-                try:
-                    existing_response = self.client.get_object(
-                        bucket_name=self.bucket_name, object_name=object_name
-                    )
-                    existing_data = existing_response.read()
-                    existing_response.close()
-                    existing_response.release_conn()
-
-                    if existing_data == item_json:
-                        logger.debug(
-                            f"{log_prefix} - Item already in correct state",
-                            extra={
-                                "order_id": order.order_id,
-                                "product_id": item.product_id,
-                                "object_name": object_name,
-                            },
-                        )
-                        continue  # Skip put_object if state is correct
-                    else:
-                        logger.warning(
-                            f"{log_prefix} - Item exists with different "
-                            "content, overwriting",
-                            extra={
-                                "order_id": order.order_id,
-                                "product_id": item.product_id,
-                                "object_name": object_name,
-                            },
-                        )
-
-                except S3Error as e:
-                    if getattr(e, "code", None) == "NoSuchKey":
-                        logger.debug(
-                            f"{log_prefix} - Item object not found, "
-                            "creating new",
-                            extra={
-                                "order_id": order.order_id,
-                                "product_id": item.product_id,
-                                "object_name": object_name,
-                            },
-                        )
-                    else:
-                        raise  # Re-raise if it's another S3 error
-
-                # Perform put_object
-                self.client.put_object(
-                    bucket_name=self.bucket_name,
-                    object_name=object_name,
-                    data=data_stream,
-                    length=len(item_json),
-                    metadata={"order_id": order.order_id, "action": action},
-                )
-                logger.debug(
-                    f"{log_prefix} - Item persisted to Minio",
-                    extra={
-                        "order_id": order.order_id,
-                        "product_id": item.product_id,
-                        "object_name": object_name,
-                        "action": action,
-                    },
-                )
-            except S3Error as e:
-                logger.error(
-                    f"{log_prefix} - Failed to persist inventory item to "
-                    "Minio",
-                    extra={
-                        "order_id": order.order_id,
-                        "product_id": item.product_id,
-                        "object_name": object_name,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                    },
-                )
-                raise
-            except Exception as e:
-                logger.error(
-                    f"{log_prefix} - Unexpected error during inventory item "
-                    "persistence",
-                    extra={
-                        "order_id": order.order_id,
-                        "product_id": item.product_id,
-                        "object_name": object_name,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                    },
-                    exc_info=True,
+        # The Minio client is blocking and each item is an independent
+        # object, so the per-item round trips run concurrently in threads
+        # (bounded by max_concurrent_writes) rather than one after another.
+        # The semaphore is created per call rather than kept on the
+        # instance, since it belongs to the event loop it is first used on
+        existing_etags = await asyncio.to_thread(
+            self._existing_item_etags, order.order_id
+        )
+        write_slots = asyncio.Semaphore(self.max_concurrent_writes)
+        await asyncio.gather(
+            *(
+                self._persist_item_bounded(
+                    write_slots,
+                    order,
+                    item,
+                    existing_etags.get(f"{order.order_id}_{item.product_id}"),
+                    action,
+                    log_prefix,
                 )
-                raise
+                for item in items_to_write.values()
+            )
+        )
 
         logger.info(
             f"MinioInventoryRepository: {action.capitalize()} completed "
@@ -2,16 +2,18 @@
 Minio implementation of OrderRepository.
 """
 
+import asyncio
+import hashlib
 import io
 import uuid
 import logging
-from datetime import datetime
 from typing import Optional
 from minio import Minio  # type: ignore[import-untyped]
 from minio.error import S3Error  # type: ignore[import-untyped]
 
 from sample.domain import Order
 from sample.repositories import OrderRepository
+from sample.repos.minio.client import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,7 @@ class MinioOrderRepository(OrderRepository):
             access_key="minioadmin",
             secret_key="minioadmin",
             secure=False,
+            http_client=get_shared_http_client(),
         )
         self.bucket_name = "orders"
         self._ensure_bucket_exists()
@@ -58,6 +61,17 @@ class MinioOrderRepository(OrderRepository):
             )
             raise
 
+    def _read_object(self, object_name: str) -> bytes:
+        """Download an object's content (blocking; run off the loop)."""
+        response = self.client.get_object(
+            bucket_name=self.bucket_name, object_name=object_name
+        )
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
     async def generate_order_id(self) -> str:
         """Generate a unique order ID using uuid4"""
         order_id = str(uuid.uuid4())
@@ -71,12 +85,22 @@ class MinioOrderRepository(OrderRepository):
 
     async def save_order(self, order: Order) -> None:
         """Persist the state of an order to Minio."""
+        await self._save_order(order, check_existing=True)
+
+    async def _save_order(self, order: Order, check_existing: bool) -> None:
+        """Write an order, optionally skipping it if already stored.
+
+        check_existing may only be False when the caller knows the stored
+        object differs (or is absent), e.g. right after changing a field
+        of an order it has just read.
+        """
         object_name = order.order_id
         order_json = order.model_dump_json().encode("utf-8")
         data_stream = io.BytesIO(order_json)
 
         logger.debug(
-            "MinioOrderRepository: Attempting to save order state to Minio",
+            "MinioOrderRepository: Attempting to save order state to "
+            "Minio",
             extra={
                 "order_id": order.order_id,
                 "status": order.status,
@@ -88,50 +112,13 @@ class MinioOrderRepository(OrderRepository):
             },
         )
         try:
-            # Check if object exists and if content is same (idempotency)
-            try:
-                existing_response = self.client.get_object(
-                    bucket_name=self.bucket_name, object_name=object_name
-                )
-                existing_data = existing_response.read()
-                existing_response.close()
-                existing_response.release_conn()
-
-                if existing_data == order_json:
-                    logger.info(
-                        "MinioOrderRepository: Order state already matches, "
-                        "skipping save (idempotent)",
-                        extra={
-                            "order_id": order.order_id,
-                            "status": order.status,
-                        },
-                    )
-                    return  # No need to save if already identical
-                else:
-                    logger.warning(
-                        "MinioOrderRepository: Order object exists with "
-                        "different content, overwriting",
-                        extra={
-                            "order_id": order.order_id,
-                            "status": order.status,
-                            "object_name": object_name,
-                        },
-                    )
+            if check_existing and await self._is_stored(
+                order, object_name, order_json
+            ):
+                return  # No need to save if already identical
 
-            except S3Error as e:
-                if getattr(e, "code", None) == "NoSuchKey":
-                    logger.debug(
-                        "MinioOrderRepository: Order object not found, "
-                        "creating new",
-                        extra={
-                            "order_id": order.order_id,
-                            "object_name": object_name,
-                        },
-                    )
-                else:
-                    raise  # Re-raise if it's another S3 error
-
-            self.client.put_object(
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 data=data_stream,
@@ -139,7 +126,6 @@ class MinioOrderRepository(OrderRepository):
                 metadata={
                     "customer_id": order.customer_id,
                     "status": order.status,
-                    "saved_at": datetime.utcnow().isoformat(),
                 },
             )
             logger.info(
@@ -152,48 +138,92 @@ class MinioOrderRepository(OrderRepository):
                     "object_name": object_name,
                 },
             )
-        except S3Error as e:
+        except S3Error:
             logger.error(
                 "MinioOrderRepository: Failed to persist order state to "
                 "Minio",
                 extra={
                     "order_id": order.order_id,
                     "status": order.status,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
                 },
                 exc_info=True,
             )
             raise
-        except Exception as e:
+        except Exception:
             logger.error(
                 "MinioOrderRepository: Unexpected error during order save",
                 extra={
                     "order_id": order.order_id,
                     "status": order.status,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
                 },
                 exc_info=True,
             )
             raise
 
+    async def _is_stored(
+        self, order: Order, object_name: str, order_json: bytes
+    ) -> bool:
+        """Check whether the stored object already holds order_json."""
+        try:
+            # A HEAD is enough: for a single-part put the ETag is the MD5
+            # of the content, so the existing body need not be downloaded
+            existing = await asyncio.to_thread(
+                self.client.stat_object,
+                bucket_name=self.bucket_name,
+                object_name=object_name,
+            )
+            payload_md5 = hashlib.md5(
+                order_json, usedforsecurity=False
+            ).hexdigest()
+
+            if existing.etag == payload_md5:
+                logger.info(
+                    "MinioOrderRepository: Order state already matches, "
+                    "skipping save (idempotent)",
+                    extra={
+                        "order_id": order.order_id,
+                        "status": order.status,
+                    },
+                )
+                return True
+            logger.warning(
+                "MinioOrderRepository: Order object exists with "
+                "different content, overwriting",
+                extra={
+                    "order_id": order.order_id,
+                    "status": order.status,
+                    "object_name": object_name,
+                },
+            )
+
+        except S3Error as e:
+            if getattr(e, "code", None) == "NoSuchKey":
+                logger.debug(
+                    "MinioOrderRepository: Order object not found, "
+                    "creating new",
+                    extra={
+                        "order_id": order.order_id,
+                        "object_name": object_name,
+                    },
+                )
+            else:
+                raise  # Re-raise if it's another S3 error
+        return False
+
     async def get_order(self, order_id: str) -> Optional[Order]:
         """Retrieve an order by its ID from Minio."""
         logger.debug(
-            "MinioOrderRepository: Attempting to retrieve order from Minio",
-            extra={"order_id": order_id, "source_bucket": self.bucket_name},
+            "MinioOrderRepository: Attempting to retrieve order from "
+            "Minio",
+            extra={
+                "order_id": order_id,
+                "source_bucket": self.bucket_name,
+            },
         )
         try:
-            response = self.client.get_object(
-                bucket_name=self.bucket_name, object_name=order_id
-            )
-            data = response.read()
-            response.close()
-            response.release_conn()
+            data = await asyncio.to_thread(self._read_object, order_id)
 
-            order_json = data.decode("utf-8")
-            order = Order.model_validate_json(order_json)
+            order = Order.model_validate_json(data)
 
             logger.info(
                 "MinioOrderRepository: Order retrieved successfully from "
@@ -203,7 +233,6 @@ class MinioOrderRepository(OrderRepository):
                     "status": order.status,
                     "refund_id": order.refund_id,
                     "refund_status": order.refund_status,
-                    "retrieved_at": datetime.utcnow().isoformat(),
                     "payload_size_bytes": len(data),
                 },
             )
@@ -211,9 +240,12 @@ class MinioOrderRepository(OrderRepository):
         except S3Error as e:
             if getattr(e, "code", None) == "NoSuchKey":
                 logger.debug(
-                    "MinioOrderRepository: Order not found in Minio storage "
-                    "(NoSuchKey)",
-                    extra={"order_id": order_id, "error_code": "NoSuchKey"},
+                    "MinioOrderRepository: Order not found in Minio "
+                    "storage (NoSuchKey)",
+                    extra={
+                        "order_id": order_id,
+                        "error_code": "NoSuchKey",
+                    },
                 )
             else:
                 logger.error(
@@ -221,20 +253,16 @@ class MinioOrderRepository(OrderRepository):
                     " Minio",
                     extra={
                         "order_id": order_id,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
                     },
                     exc_info=True,
                 )
             return None
-        except Exception as e:
+        except Exception:
             logger.error(
                 "MinioOrderRepository: Unexpected error during order "
                 "retrieval",
                 extra={
                     "order_id": order_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
                 },
                 exc_info=True,
             )
@@ -270,7 +298,8 @@ class MinioOrderRepository(OrderRepository):
         order.status = "CANCELLED"
         order.reason = reason if reason else "Cancelled by user request"
 
-        await self.save_order(order)  # Persist the updated order
+        # The status just changed, so the stored copy cannot match
+        await self._save_order(order, check_existing=False)
         logger.info(
             "MinioOrderRepository: Order successfully cancelled and persisted"
             " to Minio",
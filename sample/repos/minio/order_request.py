@@ -2,18 +2,27 @@
 Minio implementation of OrderRequestRepository.
 """
 
+import asyncio
 import os
 import io
 import logging
+from collections import OrderedDict
 from typing import Optional
 from minio import Minio  # type: ignore[import-untyped]
 from minio.error import S3Error  # type: ignore[import-untyped]
 
 from sample.domain import RequestOrderMapping
 from sample.repositories import OrderRequestRepository
+from sample.repos.minio.client import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
+# Most mapping objects kept in memory. Mappings are written once per
+# request, so found mappings are cached without expiry; a mapping rewritten
+# through the repository replaces its cached copy. Misses are not cached,
+# as the mapping may be stored later.
+MAPPING_CACHE_SIZE = 10_000
+
 
 class MinioOrderRequestRepository(OrderRequestRepository):
     """
@@ -33,8 +42,12 @@ class MinioOrderRequestRepository(OrderRequestRepository):
             access_key="minioadmin",
             secret_key="minioadmin",
             secure=False,
+            http_client=get_shared_http_client(),
         )
         self.bucket_name = "request-mappings"
+        self._mapping_cache: "OrderedDict[str, RequestOrderMapping]" = (
+            OrderedDict()
+        )
         self._ensure_bucket_exists()
 
     def _ensure_bucket_exists(self) -> None:
@@ -57,6 +70,17 @@ class MinioOrderRequestRepository(OrderRequestRepository):
             )
             raise
 
+    def _read_object(self, object_name: str) -> bytes:
+        """Download an object's content (blocking; run off the loop)."""
+        response = self.client.get_object(
+            bucket_name=self.bucket_name, object_name=object_name
+        )
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
     async def store_bidirectional_mapping(
         self, request_id: str, order_id: str
     ) -> None:
@@ -77,82 +101,61 @@ class MinioOrderRequestRepository(OrderRequestRepository):
         request_object_name = f"request-{request_id}.json"
         order_object_name = f"order-{order_id}.json"
 
-        # Store both objects idempotently
-        success_count = 0
-        errors = []
+        # Store both objects idempotently. They are independent, so both
+        # writes are issued at once; each failure is collected separately
+        indices = (
+            ("request", request_object_name, {"request_id": request_id}),
+            ("order", order_object_name, {"order_id": order_id}),
+        )
+        results = await asyncio.gather(
+            *(
+                self._store_mapping_object(
+                    object_name,
+                    mapping_json,
+                    {
+                        "request_id": request_id,
+                        "order_id": order_id,
+                        "index_type": index_type,
+                    },
+                )
+                for index_type, object_name, _ in indices
+            ),
+            return_exceptions=True,
+        )
 
-        # Store request index
-        try:
-            await self._store_mapping_object(
-                request_object_name,
-                mapping_json,
-                {
-                    "request_id": request_id,
-                    "order_id": order_id,
-                    "index_type": "request",
-                },
-            )
-            success_count += 1
-            logger.debug(
-                "MinioOrderRequestRepository: Request index storage attempt "
-                "completed",
-                extra={
-                    "request_id": request_id,
-                    "object_name": request_object_name,
-                    "status": "success",
-                },
-            )
-        except Exception as e:
-            error_msg = f"Failed to store request index: {str(e)}"
-            errors.append(error_msg)
-            logger.error(
-                "MinioOrderRequestRepository: Request index storage failed",
-                extra={
-                    "request_id": request_id,
-                    "object_name": request_object_name,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
+        # A rewrite may point either index somewhere new, so the cached
+        # copies are dropped; the mapping is cached again once both indices
+        # hold it
+        self._evict_mapping(request_object_name, order_object_name)
 
-        # Store order index
-        try:
-            await self._store_mapping_object(
-                order_object_name,
-                mapping_json,
-                {
-                    "request_id": request_id,
-                    "order_id": order_id,
-                    "index_type": "order",
-                },
-            )
-            success_count += 1
-            logger.debug(
-                "MinioOrderRequestRepository: Order index storage attempt "
-                "completed",
-                extra={
-                    "order_id": order_id,
-                    "object_name": order_object_name,
-                    "status": "success",
-                },
-            )
-        except Exception as e:
-            error_msg = f"Failed to store order index: {str(e)}"
-            errors.append(error_msg)
-            logger.error(
-                "MinioOrderRequestRepository: Order index storage failed",
-                extra={
-                    "order_id": order_id,
-                    "object_name": order_object_name,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True,
-            )
+        success_count = 0
+        errors = []
+        for (index_type, object_name, ids), result in zip(indices, results):
+            if isinstance(result, Exception):
+                errors.append(f"Failed to store {index_type} index: {result}")
+                logger.error(
+                    f"MinioOrderRequestRepository: {index_type.capitalize()} "
+                    "index storage failed",
+                    extra={**ids, "object_name": object_name},
+                    exc_info=result,
+                )
+            elif isinstance(result, BaseException):
+                raise result  # e.g. cancellation of one of the writes
+            else:
+                success_count += 1
+                logger.debug(
+                    f"MinioOrderRequestRepository: {index_type.capitalize()} "
+                    "index storage attempt completed",
+                    extra={
+                        **ids,
+                        "object_name": object_name,
+                        "status": "success",
+                    },
+                )
 
         # Evaluate results
         if success_count == 2:
+            self._cache_mapping(mapping)
             logger.info(
                 "MinioOrderRequestRepository: Bidirectional mapping stored "
                 "successfully",
@@ -192,58 +195,17 @@ class MinioOrderRequestRepository(OrderRequestRepository):
     async def _store_mapping_object(
         self, object_name: str, mapping_json: bytes, metadata: dict
     ) -> None:
-        """Store a single mapping object idempotently."""
-        logger.debug(
-            "MinioOrderRequestRepository: _store_mapping_object - checking "
-            "existence",
-            extra={"object_name": object_name},
-        )
-        try:
-            # Check if object already exists with correct content
-            try:
-                existing_response = self.client.get_object(
-                    bucket_name=self.bucket_name, object_name=object_name
-                )
-                existing_data = existing_response.read()
-                existing_response.close()
-                existing_response.release_conn()
-
-                if existing_data == mapping_json:
-                    logger.debug(
-                        "MinioOrderRequestRepository: Mapping object already "
-                        "exists with correct content, skipping put",
-                        extra={"object_name": object_name},
-                    )
-                    return
-                else:
-                    logger.warning(
-                        "MinioOrderRequestRepository: Mapping object exists "
-                        "with different content, overwriting",
-                        extra={"object_name": object_name},
-                    )
-
-            except S3Error as e:
-                if getattr(e, "code", None) == "NoSuchKey":
-                    logger.debug(
-                        "MinioOrderRequestRepository: Mapping object doesn't "
-                        "exist (NoSuchKey), creating new",
-                        extra={"object_name": object_name},
-                    )
-                else:
-                    logger.error(
-                        "MinioOrderRequestRepository: S3Error checking "
-                        "existence of mapping object",
-                        extra={
-                            "object_name": object_name,
-                            "error": str(e),
-                            "error_code": getattr(e, "code", "N/A"),
-                        },
-                        exc_info=True,
-                    )
-                    raise  # Re-raise if it's another S3 error
+        """Store a single mapping object idempotently.
 
+        The PUT is unconditional: rewriting the same mapping is harmless,
+        and each call's mapping carries a fresh created_at, so checking the
+        stored copy first would cost a round trip without ever skipping a
+        write.
+        """
+        try:
             data_stream = io.BytesIO(mapping_json)
-            self.client.put_object(
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 data=data_stream,
@@ -263,11 +225,7 @@ class MinioOrderRequestRepository(OrderRequestRepository):
             logger.error(
                 "MinioOrderRequestRepository: S3 error storing mapping "
                 "object",
-                extra={
-                    "object_name": object_name,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+                extra={"object_name": object_name},
                 exc_info=True,
             )
             raise Exception(f"S3 error storing {object_name}: {str(e)}")
@@ -275,11 +233,7 @@ class MinioOrderRequestRepository(OrderRequestRepository):
             logger.error(
                 "MinioOrderRequestRepository: Unexpected error storing "
                 "mapping object",
-                extra={
-                    "object_name": object_name,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+                extra={"object_name": object_name},
                 exc_info=True,
             )
             raise Exception(
@@ -340,10 +294,30 @@ class MinioOrderRequestRepository(OrderRequestRepository):
         )
         return None
 
+    def _cache_mapping(self, mapping: RequestOrderMapping) -> None:
+        """Cache a mapping under both of its object names."""
+        for object_name in (
+            f"request-{mapping.request_id}.json",
+            f"order-{mapping.order_id}.json",
+        ):
+            self._mapping_cache[object_name] = mapping
+            self._mapping_cache.move_to_end(object_name)
+        while len(self._mapping_cache) > MAPPING_CACHE_SIZE:
+            self._mapping_cache.popitem(last=False)
+
+    def _evict_mapping(self, *object_names: str) -> None:
+        """Drop the cached mappings stored under the given object names."""
+        for object_name in object_names:
+            self._mapping_cache.pop(object_name, None)
+
     async def _get_mapping_from_object(
         self, object_name: str
     ) -> Optional[RequestOrderMapping]:
         """Helper to get mapping from a specific S3 object."""
+        cached = self._mapping_cache.get(object_name)
+        if cached is not None:
+            self._mapping_cache.move_to_end(object_name)
+            return cached
 
         logger.debug(
             "MinioOrderRequestRepository: _get_mapping_from_object - "
@@ -352,15 +326,9 @@ class MinioOrderRequestRepository(OrderRequestRepository):
         )
 
         try:
-            response = self.client.get_object(
-                bucket_name=self.bucket_name, object_name=object_name
-            )
-            data = response.read()
-            response.close()
-            response.release_conn()
+            data = await asyncio.to_thread(self._read_object, object_name)
 
-            mapping_json = data.decode("utf-8")
-            mapping = RequestOrderMapping.model_validate_json(mapping_json)
+            mapping = RequestOrderMapping.model_validate_json(data)
 
             logger.debug(
                 "MinioOrderRequestRepository: Mapping retrieved successfully",
@@ -372,6 +340,7 @@ class MinioOrderRequestRepository(OrderRequestRepository):
                 },
             )
 
+            self._cache_mapping(mapping)
             return mapping
 
         except S3Error as e:
@@ -388,23 +357,15 @@ class MinioOrderRequestRepository(OrderRequestRepository):
                 logger.error(
                     "MinioOrderRequestRepository: Error retrieving mapping "
                     "object from Minio",
-                    extra={
-                        "object_name": object_name,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                    },
+                    extra={"object_name": object_name},
                     exc_info=True,
                 )
             return None
-        except Exception as e:
+        except Exception:
             logger.error(
                 "MinioOrderRequestRepository: Unexpected error during mapping"
                 " retrieval",
-                extra={
-                    "object_name": object_name,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
+                extra={"object_name": object_name},
                 exc_info=True,
             )
             return None
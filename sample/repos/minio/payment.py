@@ -2,6 +2,7 @@
 Minio implementation of PaymentRepository.
 """
 
+import asyncio
 import io
 import logging
 from datetime import datetime
@@ -18,6 +19,7 @@ from sample.domain import (
     RefundPaymentOutcome,
 )  # Added RefundPaymentArgs, RefundPaymentOutcome
 from sample.repositories import PaymentRepository
+from sample.repos.minio.client import get_shared_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,7 @@ class MinioPaymentRepository(PaymentRepository):
             access_key="minioadmin",
             secret_key="minioadmin",
             secure=False,
+            http_client=get_shared_http_client(),
         )
         self.bucket_name = "payments"
         self._ensure_bucket_exists()
@@ -63,6 +66,17 @@ class MinioPaymentRepository(PaymentRepository):
             )
             raise
 
+    def _read_object(self, object_name: str) -> bytes:
+        """Download an object's content (blocking; run off the loop)."""
+        response = self.client.get_object(
+            bucket_name=self.bucket_name, object_name=object_name
+        )
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
     async def process_payment(self, order: Order) -> PaymentOutcome:
         """Process payment and persist the result to Minio."""
         logger.info(
@@ -103,7 +117,8 @@ class MinioPaymentRepository(PaymentRepository):
         try:
             payment_json = payment.model_dump_json().encode("utf-8")
             data_stream = io.BytesIO(payment_json)
-            self.client.put_object(
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=payment.payment_id,
                 data=data_stream,
@@ -160,12 +175,9 @@ class MinioPaymentRepository(PaymentRepository):
         try:
             # Check if object exists and if content is same (idempotency)
             try:
-                existing_response = self.client.get_object(
-                    bucket_name=self.bucket_name, object_name=object_name
+                existing_data = await asyncio.to_thread(
+                    self._read_object, object_name
                 )
-                existing_data = existing_response.read()
-                existing_response.close()
-                existing_response.release_conn()
 
                 if existing_data == payment_json:
                     logger.debug(
@@ -207,7 +219,8 @@ class MinioPaymentRepository(PaymentRepository):
                 else:
                     raise  # Re-raise if it's another S3 error
 
-            self.client.put_object(
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 data=data_stream,
@@ -285,15 +298,9 @@ class MinioPaymentRepository(PaymentRepository):
             },
         )
         try:
-            response = self.client.get_object(
-                bucket_name=self.bucket_name, object_name=payment_id
-            )
-            data = response.read()
-            response.close()
-            response.release_conn()
+            data = await asyncio.to_thread(self._read_object, payment_id)
 
-            payment_json = data.decode("utf-8")
-            payment = Payment.model_validate_json(payment_json)
+            payment = Payment.model_validate_json(data)
 
             logger.info(
                 "MinioPaymentRepository: Payment retrieved successfully from "
@@ -412,15 +419,18 @@ class MinioPaymentRepository(PaymentRepository):
         refund_id = f"ref_{args.payment_id}"
         original_payment_status = existing_payment.status
 
-        # Update the existing payment object's status to "refunded"
-        existing_payment.status = "refunded"
+        # Payment is immutable, so persist a refunded copy of it
+        existing_payment = existing_payment.model_copy(
+            update={"status": "refunded"}
+        )
 
         # Persist the updated payment object
         object_name = existing_payment.payment_id
         payment_json = existing_payment.model_dump_json().encode("utf-8")
         data_stream = io.BytesIO(payment_json)
         try:
-            self.client.put_object(
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name=self.bucket_name,
                 object_name=object_name,
                 data=data_stream,
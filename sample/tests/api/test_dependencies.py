@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from sample.api import dependencies
+from sample.api.dependencies import DependencyContainer
+
+
+@pytest.mark.asyncio
+async def test_container_accepts_sync_and_async_factories() -> None:
+    """Test that get_or_create builds each key once from either factory."""
+    container = DependencyContainer()
+    sync_factory = MagicMock(return_value="sync-instance")
+
+    async def async_factory() -> str:
+        return "async-instance"
+
+    assert await container.get_or_create("a", sync_factory) == "sync-instance"
+    assert await container.get_or_create("a", sync_factory) == "sync-instance"
+    assert await container.get_or_create("b", async_factory) == (
+        "async-instance"
+    )
+    sync_factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_repositories_and_use_case_are_shared() -> None:
+    """Test that dependencies return the same instances across requests."""
+    with patch.object(
+        dependencies, "_container", DependencyContainer()
+    ), patch.object(
+        dependencies, "MinioOrderRepository"
+    ) as order_repo_cls, patch.object(
+        dependencies, "MinioPaymentRepository"
+    ) as payment_repo_cls, patch.object(
+        dependencies, "ensure_order_repository", side_effect=lambda r: r
+    ), patch.object(
+        dependencies, "ensure_payment_repository", side_effect=lambda r: r
+    ):
+        first = await dependencies.get_get_order_use_case()
+        second = await dependencies.get_get_order_use_case()
+
+        assert first is second
+        assert await dependencies.get_minio_order_repository() is (
+            await dependencies.get_minio_order_repository()
+        )
+        order_repo_cls.assert_called_once()
+        payment_repo_cls.assert_called_once()
@@ -1,7 +1,8 @@
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from fastapi.testclient import TestClient
 import io
+from typing import Any, BinaryIO, Dict
 import json
 
 from sample.api.app import app
@@ -12,8 +13,38 @@ from sample.api.dependencies import (
 )
 from sample.api.responses import OrderStatusResponse
 from sample.usecase import GetOrderUseCase
-from util.repositories import FileStorageRepository
-from util.domain import FileMetadata, FileUploadArgs
+from util.repositories import (
+    FileStorageRepository,
+    StreamingFileStorageRepository,
+)
+from pydantic import ValidationError
+from util.domain import (
+    MAX_FILE_SIZE,
+    FileMetadata,
+    FileStreamUploadArgs,
+    FileUploadArgs,
+)
+from sample.domain import CancelOrderInput, CreateOrderRequest
+from temporalio.common import WorkflowIDReusePolicy
+from temporalio.exceptions import WorkflowAlreadyStartedError
+
+
+def test_health_check_endpoint() -> None:
+    """Test the pre-serialized health response and its documented schema"""
+    client = TestClient(app)
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "ok", "version": "1.0.0"}
+
+    # Routes returning pre-serialized JSON still document their models
+    schema = client.get("/openapi.json").json()
+    health_schema = schema["paths"]["/health"]["get"]["responses"]["200"]
+    assert health_schema["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/HealthCheckResponse"
+    }
 
 
 def test_create_order_endpoint() -> None:
@@ -40,8 +71,249 @@ def test_create_order_endpoint() -> None:
         assert "request_id" in response.json()
         assert response.json()["status"] == "SUBMITTED"
 
-        # Verify Temporal client was called
+        # Verify Temporal client was called with the request model itself
         mock_client.start_workflow.assert_called_once()
+        workflow_input = mock_client.start_workflow.call_args.args[1]
+        assert isinstance(workflow_input, CreateOrderRequest)
+        assert workflow_input.customer_id == "cust123"
+
+
+def test_create_order_uses_injected_temporal_client() -> None:
+    """Test that create_order reuses the injected Temporal client"""
+    mock_client = AsyncMock()
+    mock_client.start_workflow = AsyncMock()
+
+    from sample.api.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_client
+
+    request_ids = []
+    with patch("temporalio.client.Client.connect") as mock_connect:
+        client = TestClient(app)
+        for _ in range(2):
+            response = client.post(
+                "/orders",
+                json={
+                    "customer_id": "cust123",
+                    "items": [
+                        {
+                            "product_id": "prod1",
+                            "quantity": 1,
+                            "price": "10.00",
+                        }
+                    ],
+                },
+            )
+            assert response.status_code == 200
+            request_ids.append(response.json()["request_id"])
+
+        mock_connect.assert_not_called()
+
+    assert mock_client.start_workflow.await_count == 2
+    # Identical payloads still get distinct request IDs
+    assert request_ids[0] != request_ids[1]
+    assert all(rid.startswith("req-") for rid in request_ids)
+
+    # Clean up
+    app.dependency_overrides = {}
+
+
+def _idempotent_temporal_client() -> AsyncMock:
+    """Mock Temporal client that starts each workflow ID once, keeping
+    the memo it was started with like the server does."""
+    memos: Dict[str, Dict[str, Any]] = {}
+
+    async def start_workflow(*args: Any, **kwargs: Any) -> None:
+        if kwargs["id"] in memos:
+            raise WorkflowAlreadyStartedError(
+                kwargs["id"], "OrderFulfillmentWorkflow"
+            )
+        memos[kwargs["id"]] = kwargs.get("memo", {})
+
+    def get_workflow_handle(workflow_id: str) -> MagicMock:
+        memo = memos[workflow_id]
+        description = MagicMock()
+        description.memo_value = AsyncMock(
+            side_effect=lambda key, default=None: memo.get(key, default)
+        )
+        handle = MagicMock()
+        handle.describe = AsyncMock(return_value=description)
+        return handle
+
+    mock_client = AsyncMock()
+    mock_client.start_workflow = AsyncMock(side_effect=start_workflow)
+    mock_client.get_workflow_handle = MagicMock(
+        side_effect=get_workflow_handle
+    )
+    return mock_client
+
+
+def test_create_order_with_idempotency_key_is_not_started_twice() -> None:
+    """Test that a retried submission with the same Idempotency-Key
+    returns the original request_id instead of starting a new workflow
+    """
+    mock_client = _idempotent_temporal_client()
+
+    from sample.api.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_client
+
+    client = TestClient(app)
+    body = {
+        "customer_id": "cust123",
+        "items": [{"product_id": "prod1", "quantity": 1, "price": "10.00"}],
+    }
+    responses = [
+        client.post(
+            "/orders", json=body, headers={"Idempotency-Key": "key-1"}
+        )
+        for _ in range(2)
+    ]
+
+    assert [r.status_code for r in responses] == [200, 200]
+    request_ids = [r.json()["request_id"] for r in responses]
+    assert request_ids[0] == request_ids[1]
+    assert "key-1" not in request_ids[0]
+    call_kwargs = mock_client.start_workflow.call_args.kwargs
+    assert call_kwargs["id"] == request_ids[0]
+    assert (
+        call_kwargs["id_reuse_policy"]
+        == WorkflowIDReusePolicy.REJECT_DUPLICATE
+    )
+    assert "id_conflict_policy" not in call_kwargs
+
+    # Clean up
+    app.dependency_overrides = {}
+
+
+def test_create_order_rejects_idempotency_key_reused_for_other_order() -> (
+    None
+):
+    """Test that reusing an Idempotency-Key with a different body is
+    rejected rather than answered with the original request_id
+    """
+    mock_client = _idempotent_temporal_client()
+
+    from sample.api.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_client
+
+    client = TestClient(app)
+    responses = [
+        client.post(
+            "/orders",
+            json={
+                "customer_id": "cust123",
+                "items": [
+                    {"product_id": product_id, "quantity": 1, "price": "10"}
+                ],
+            },
+            headers={"Idempotency-Key": "key-1"},
+        )
+        for product_id in ("prod1", "prod2")
+    ]
+
+    assert [r.status_code for r in responses] == [200, 422]
+    assert "Idempotency-Key" in responses[1].json()["detail"]
+
+    # Clean up
+    app.dependency_overrides = {}
+
+
+def test_cancel_order_rejects_idempotency_key_reused_for_other_reason() -> (
+    None
+):
+    """Test that reusing a cancellation Idempotency-Key with a different
+    reason is rejected, while an identical retry gets the original
+    request_id
+    """
+    mock_client = _idempotent_temporal_client()
+
+    from sample.api.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_client
+
+    client = TestClient(app)
+    responses = [
+        client.post(
+            "/orders/order-1/cancel",
+            json={"reason": reason},
+            headers={"Idempotency-Key": "key-1"},
+        )
+        for reason in ("Changed my mind", "Changed my mind", "Too slow")
+    ]
+
+    assert [r.status_code for r in responses] == [200, 200, 422]
+    request_id = responses[0].json()["request_id"]
+    assert request_id == responses[1].json()["request_id"]
+    assert request_id.startswith("cancel-req-")
+    assert "order-1" not in request_id
+    assert "key-1" not in request_id
+    assert "Idempotency-Key" in responses[2].json()["detail"]
+
+    # Clean up
+    app.dependency_overrides = {}
+
+
+def test_create_order_idempotency_key_is_scoped_to_customer() -> None:
+    """Test that the same Idempotency-Key from two customers yields two
+    separate requests
+    """
+    mock_client = AsyncMock()
+    mock_client.start_workflow = AsyncMock()
+
+    from sample.api.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_client
+
+    client = TestClient(app)
+    request_ids = [
+        client.post(
+            "/orders",
+            json={
+                "customer_id": customer_id,
+                "items": [
+                    {"product_id": "prod1", "quantity": 1, "price": "10.00"}
+                ],
+            },
+            headers={"Idempotency-Key": "shared-key"},
+        ).json()["request_id"]
+        for customer_id in ("cust1", "cust2")
+    ]
+
+    assert request_ids[0] != request_ids[1]
+    assert mock_client.start_workflow.await_count == 2
+
+    # Clean up
+    app.dependency_overrides = {}
+
+
+@pytest.mark.parametrize("key", ["a/b", "key with spaces", "k" * 129])
+def test_create_order_rejects_invalid_idempotency_key(key: str) -> None:
+    """Test that keys outside [A-Za-z0-9_-]{1,128} are rejected"""
+    mock_client = AsyncMock()
+
+    from sample.api.dependencies import get_temporal_client
+
+    app.dependency_overrides[get_temporal_client] = lambda: mock_client
+
+    client = TestClient(app)
+    response = client.post(
+        "/orders",
+        json={
+            "customer_id": "cust123",
+            "items": [
+                {"product_id": "prod1", "quantity": 1, "price": "10.00"}
+            ],
+        },
+        headers={"Idempotency-Key": key},
+    )
+
+    assert response.status_code == 422
+    mock_client.start_workflow.assert_not_called()
+
+    # Clean up
+    app.dependency_overrides = {}
 
 
 def test_get_request_status_no_mapping() -> None:
@@ -54,6 +326,9 @@ def test_get_request_status_no_mapping() -> None:
     app.dependency_overrides[get_minio_order_request_repository] = (
         lambda: mock_repo
     )
+    app.dependency_overrides[get_get_order_use_case] = lambda: AsyncMock(
+        spec=GetOrderUseCase
+    )
 
     client = TestClient(app)
     response = client.get("/order-requests/req-123")
@@ -67,26 +342,87 @@ def test_get_request_status_no_mapping() -> None:
 
 
 def test_get_request_status_with_redirect() -> None:
-    """Test request status when order mapping exists - should redirect"""
+    """Test request status when order mapping exists - browsers are
+    redirected
+    """
     # Mock the request repository
     mock_repo = AsyncMock()
     mock_repo.get_order_id_for_request = AsyncMock(return_value="order-456")
+    mock_use_case = AsyncMock(spec=GetOrderUseCase)
 
     # Use dependency override for get_minio_order_request_repository
     app.dependency_overrides[get_minio_order_request_repository] = (
         lambda: mock_repo
     )
+    app.dependency_overrides[get_get_order_use_case] = lambda: mock_use_case
 
     client = TestClient(app)
-    response = client.get("/order-requests/req-123", follow_redirects=False)
+    response = client.get(
+        "/order-requests/req-123",
+        headers={"Accept": "text/html,application/xhtml+xml"},
+        follow_redirects=False,
+    )
 
     assert response.status_code == 302
     assert response.headers["location"] == "/orders/order-456"
+    mock_use_case.get_order_status.assert_not_awaited()
 
     # Clean up dependency override
     app.dependency_overrides = {}
 
 
+def test_get_request_status_returns_order_status_inline() -> None:
+    """Test request status when order mapping exists - API clients get the
+    order status without a redirect
+    """
+    mock_repo = AsyncMock()
+    mock_repo.get_order_id_for_request = AsyncMock(return_value="order-456")
+    mock_use_case = AsyncMock(spec=GetOrderUseCase)
+    mock_use_case.get_order_status = AsyncMock(
+        return_value=OrderStatusResponse(
+            order_id="order-456", status="COMPLETED"
+        )
+    )
+
+    app.dependency_overrides[get_minio_order_request_repository] = (
+        lambda: mock_repo
+    )
+    app.dependency_overrides[get_get_order_use_case] = lambda: mock_use_case
+
+    client = TestClient(app)
+    response = client.get(
+        "/order-requests/req-123",
+        headers={"Accept": "application/json"},
+        follow_redirects=False,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["order_id"] == "order-456"
+    assert response.json()["status"] == "COMPLETED"
+    mock_use_case.get_order_status.assert_awaited_once_with("order-456")
+
+    # Clean up dependency override
+    app.dependency_overrides = {}
+
+
+def test_get_request_status_documents_both_payloads() -> None:
+    """Test that the request status schema lists both inline payloads and
+    the browser redirect"""
+    client = TestClient(app)
+
+    schema = client.get("/openapi.json").json()
+    responses = schema["paths"]["/order-requests/{request_id}"]["get"][
+        "responses"
+    ]
+
+    payload = responses["200"]["content"]["application/json"]["schema"]
+    assert {ref["$ref"] for ref in payload["anyOf"]} == {
+        "#/components/schemas/OrderStatusResponse",
+        "#/components/schemas/OrderRequestStatusResponse",
+    }
+    assert "302" in responses
+
+
 def test_get_order_status_endpoint() -> None:
     """Test that the get_order_status endpoint correctly handles valid
     requests by mocking the use case.
@@ -215,6 +551,116 @@ async def test_upload_order_attachment_endpoint() -> None:
     app.dependency_overrides = {}
 
 
+def test_upload_order_attachment_rejects_invalid_metadata_json() -> None:
+    """Test that malformed metadata JSON is reported as a 422."""
+    mock_file_storage_repo = AsyncMock(spec=FileStorageRepository)
+    app.dependency_overrides[get_minio_file_storage_repository] = (
+        lambda: mock_file_storage_repo
+    )
+
+    client = TestClient(app)
+    response = client.post(
+        "/orders/order-bad-meta/attachments",
+        files={"file": ("notes.txt", io.BytesIO(b"content"), "text/plain")},
+        data={"metadata_json_str": "{not json"},
+    )
+
+    assert response.status_code == 422
+    assert "Invalid JSON in metadata field" in response.json()["detail"]
+    mock_file_storage_repo.upload_file.assert_not_called()
+
+    app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_upload_order_attachment_streams_when_supported() -> None:
+    """Test that uploads are streamed to repositories that support it."""
+    mock_file_storage_repo = AsyncMock(spec=StreamingFileStorageRepository)
+    test_file_content = b"Streamed attachment content."
+    streamed = {}
+
+    async def mock_upload_file_stream(
+        upload_args: FileStreamUploadArgs, stream: BinaryIO
+    ) -> FileMetadata:
+        streamed["data"] = stream.read()
+        return FileMetadata(
+            file_id=upload_args.file_id,
+            filename=upload_args.filename,
+            content_type=upload_args.content_type,
+            size_bytes=upload_args.size_bytes,
+            metadata=upload_args.metadata,
+        )
+
+    mock_file_storage_repo.upload_file_stream = AsyncMock(
+        side_effect=mock_upload_file_stream
+    )
+
+    app.dependency_overrides[get_minio_file_storage_repository] = (
+        lambda: mock_file_storage_repo
+    )
+
+    client = TestClient(app)
+    response = client.post(
+        "/orders/order-stream-1/attachments",
+        files={
+            "file": (
+                "streamed.txt",
+                io.BytesIO(test_file_content),
+                "text/plain",
+            )
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["size_bytes"] == len(test_file_content)
+    assert streamed["data"] == test_file_content
+    mock_file_storage_repo.upload_file.assert_not_called()
+
+    app.dependency_overrides = {}
+
+
+def test_upload_empty_attachment_is_rejected_before_streaming() -> None:
+    """Test that an empty upload gets the usual 400, even when streaming."""
+    mock_file_storage_repo = AsyncMock(spec=StreamingFileStorageRepository)
+
+    app.dependency_overrides[get_minio_file_storage_repository] = (
+        lambda: mock_file_storage_repo
+    )
+
+    client = TestClient(app)
+    response = client.post(
+        "/orders/order-empty/attachments",
+        files={"file": ("empty.txt", io.BytesIO(b""), "text/plain")},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "File cannot be empty"}
+    mock_file_storage_repo.upload_file_stream.assert_not_called()
+
+    app.dependency_overrides = {}
+
+
+@pytest.mark.parametrize(
+    "size_bytes, message",
+    [
+        (-1, "File size cannot be negative"),
+        (0, "File cannot be empty"),
+        (MAX_FILE_SIZE + 1, "exceeds maximum allowed size"),
+    ],
+)
+def test_file_stream_upload_args_rejects_invalid_size(
+    size_bytes: int, message: str
+) -> None:
+    """Test that streamed uploads must declare a size within the cap."""
+    with pytest.raises(ValidationError, match=message):
+        FileStreamUploadArgs(
+            file_id="file-1",
+            filename="streamed.txt",
+            size_bytes=size_bytes,
+            content_type="text/plain",
+        )
+
+
 @pytest.mark.asyncio
 async def test_download_order_attachment_endpoint() -> None:
     """Test the /orders/{order_id}/attachments/{file_id} endpoint for file
@@ -271,6 +717,86 @@ async def test_download_order_attachment_endpoint() -> None:
     app.dependency_overrides = {}
 
 
+def test_download_order_attachment_not_found_skips_metadata() -> None:
+    """Test that a missing file is reported without a metadata lookup."""
+    mock_file_storage_repo = AsyncMock(spec=FileStorageRepository)
+    mock_file_storage_repo.download_file = AsyncMock(return_value=None)
+
+    app.dependency_overrides[get_minio_file_storage_repository] = (
+        lambda: mock_file_storage_repo
+    )
+
+    client = TestClient(app)
+    response = client.get("/orders/order-1/attachments/missing-file")
+
+    assert response.status_code == 404
+    mock_file_storage_repo.download_file.assert_awaited_once_with(
+        "missing-file"
+    )
+    mock_file_storage_repo.get_file_metadata.assert_not_called()
+
+    app.dependency_overrides = {}
+
+
+def test_download_order_attachment_streams_when_supported() -> None:
+    """Test that downloads stream from a single repository request."""
+    mock_file_storage_repo = AsyncMock(spec=StreamingFileStorageRepository)
+    test_file_id = "streamed-file-id"
+    chunks = [b"first chunk, ", b"second chunk"]
+
+    mock_file_storage_repo.download_file_stream = AsyncMock(
+        return_value=(
+            FileMetadata(
+                file_id=test_file_id,
+                filename="report.pdf",
+                content_type="application/pdf",
+                size_bytes=sum(len(chunk) for chunk in chunks),
+            ),
+            iter(chunks),
+        )
+    )
+
+    app.dependency_overrides[get_minio_file_storage_repository] = (
+        lambda: mock_file_storage_repo
+    )
+
+    client = TestClient(app)
+    response = client.get(f"/orders/order-1/attachments/{test_file_id}")
+
+    assert response.status_code == 200
+    assert response.content == b"".join(chunks)
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-length"] == str(len(b"".join(chunks)))
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="report.pdf"'
+    )
+    mock_file_storage_repo.download_file_stream.assert_awaited_once_with(
+        test_file_id
+    )
+    mock_file_storage_repo.get_file_metadata.assert_not_called()
+    mock_file_storage_repo.download_file.assert_not_called()
+
+    app.dependency_overrides = {}
+
+
+def test_download_order_attachment_stream_not_found() -> None:
+    """Test that a missing streamed download returns 404."""
+    mock_file_storage_repo = AsyncMock(spec=StreamingFileStorageRepository)
+    mock_file_storage_repo.download_file_stream = AsyncMock(return_value=None)
+
+    app.dependency_overrides[get_minio_file_storage_repository] = (
+        lambda: mock_file_storage_repo
+    )
+
+    client = TestClient(app)
+    response = client.get("/orders/order-1/attachments/missing-file")
+
+    assert response.status_code == 404
+
+    app.dependency_overrides = {}
+
+
 @pytest.mark.asyncio
 async def test_get_order_attachment_metadata_endpoint() -> None:
     """Test the /orders/{order_id}/attachments/{file_id}/metadata endpoint."""
@@ -357,7 +883,9 @@ def test_cancel_order_endpoint() -> None:
     # Positional arguments: workflow_run, *args
     # Keyword arguments: id, task_queue, etc.
     assert call_args.args[0].__name__ == "run"
-    assert call_args.args[1] == {"order_id": order_id, "reason": reason}
+    assert call_args.args[1] == CancelOrderInput(
+        order_id=order_id, reason=reason
+    )
     assert call_args.kwargs["id"].startswith(f"cancel-req-{order_id}-")
     assert call_args.kwargs["task_queue"] == "order-fulfillment-queue"
 
@@ -403,7 +931,9 @@ def test_cancel_order_endpoint_already_running() -> None:
     mock_client.start_workflow.assert_called_once()
     call_args = mock_client.start_workflow.call_args
     assert call_args.args[0].__name__ == "run"
-    assert call_args.args[1] == {"order_id": order_id, "reason": reason}
+    assert call_args.args[1] == CancelOrderInput(
+        order_id=order_id, reason=reason
+    )
     assert call_args.kwargs["id"].startswith(f"cancel-req-{order_id}-")
     assert call_args.kwargs["task_queue"] == "order-fulfillment-queue"
 
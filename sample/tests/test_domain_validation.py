@@ -3,6 +3,7 @@ from decimal import Decimal
 from pydantic import ValidationError
 
 from sample.domain import (
+    CreateOrderRequest,
     Order,
     OrderItem,
     Payment,
@@ -42,6 +43,39 @@ def test_order_requires_items() -> None:
         )
 
 
+def test_create_order_request_total_amount_is_exact_and_not_dumped() -> None:
+    """The derived total keeps full Decimal precision and is not part of
+    the serialized request
+    """
+    request = CreateOrderRequest.model_validate(
+        {
+            "customer_id": "cust123",
+            "items": [
+                {"product_id": "prod1", "quantity": 3, "price": "0.105"},
+                {"product_id": "prod2", "quantity": 1, "price": "10.00"},
+            ],
+        }
+    )
+
+    assert request.total_amount == Decimal("10.315")
+    assert "total_amount" not in request.model_dump()
+
+
+def test_create_order_request_total_amount_follows_item_changes() -> None:
+    """The derived total is recomputed after the items change"""
+    request = CreateOrderRequest(
+        customer_id="cust123",
+        items=[OrderItem(product_id="prod1", quantity=1, price=Decimal("5"))],
+    )
+    assert request.total_amount == Decimal("5")
+
+    request.items.append(
+        OrderItem(product_id="prod2", quantity=2, price=Decimal("1.50"))
+    )
+
+    assert request.total_amount == Decimal("8.00")
+
+
 def test_payment_amount_must_be_positive() -> None:
     """Business rule: Payment amounts must be positive"""
     with pytest.raises(ValidationError, match="Amount must be positive"):
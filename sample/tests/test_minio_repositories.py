@@ -0,0 +1,282 @@
+"""
+State-based tests for the sample Minio repositories, run against the fake
+in-memory Minio client.
+"""
+
+import json
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Generator
+from unittest.mock import patch
+
+import pytest
+
+from julee_example.repositories.minio.tests.fake_client import (
+    FakeMinioClient,
+)
+from sample.domain import Order, OrderItem
+from sample.repos.minio.inventory import MinioInventoryRepository
+from sample.repos.minio.order import MinioOrderRepository
+from sample.repos.minio.order_request import MinioOrderRequestRepository
+
+
+@pytest.fixture
+def fake_client() -> FakeMinioClient:
+    """Create a fresh fake Minio client."""
+    return FakeMinioClient()
+
+
+@pytest.fixture
+def inventory_repo(
+    fake_client: FakeMinioClient,
+) -> Generator[MinioInventoryRepository, None, None]:
+    """Create a MinioInventoryRepository backed by the fake client."""
+    with patch(
+        "sample.repos.minio.inventory.Minio", return_value=fake_client
+    ):
+        yield MinioInventoryRepository("test-endpoint")
+
+
+@pytest.fixture
+def order_repo(
+    fake_client: FakeMinioClient,
+) -> Generator[MinioOrderRepository, None, None]:
+    """Create a MinioOrderRepository backed by the fake client."""
+    with patch("sample.repos.minio.order.Minio", return_value=fake_client):
+        yield MinioOrderRepository("test-endpoint")
+
+
+@pytest.fixture
+def order_request_repo(
+    fake_client: FakeMinioClient,
+) -> Generator[MinioOrderRequestRepository, None, None]:
+    """Create a MinioOrderRequestRepository backed by the fake client."""
+    with patch(
+        "sample.repos.minio.order_request.Minio", return_value=fake_client
+    ):
+        yield MinioOrderRequestRepository()
+
+
+def _order(*items: OrderItem) -> Order:
+    return Order(
+        order_id="order-1",
+        customer_id="cust123",
+        items=list(items),
+        total_amount=sum(
+            (item.price * item.quantity for item in items), Decimal(0)
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_reserve_items_writes_last_line_for_the_same_product(
+    inventory_repo: MinioInventoryRepository, fake_client: FakeMinioClient
+) -> None:
+    """Test that order lines for one product are returned line by line
+    while only the last one is stored, rather than racing to write the
+    same object"""
+    order = _order(
+        OrderItem(product_id="prod1", quantity=2, price=Decimal("10")),
+        OrderItem(product_id="prod2", quantity=1, price=Decimal("5")),
+        OrderItem(product_id="prod1", quantity=3, price=Decimal("10")),
+    )
+
+    with patch.object(
+        fake_client, "put_object", wraps=fake_client.put_object
+    ) as put_object:
+        outcome = await inventory_repo.reserve_items(order)
+
+    assert outcome.reserved_items is not None
+    assert [
+        (item.product_id, item.quantity, item.reserved)
+        for item in outcome.reserved_items
+    ] == [("prod1", 2, 2), ("prod2", 1, 1), ("prod1", 3, 3)]
+    assert put_object.call_count == 2
+    stored = fake_client.get_stored_objects("inventory")
+    assert sorted(stored) == ["order-1_prod1", "order-1_prod2"]
+    assert json.loads(stored["order-1_prod1"]["data"])["quantity"] == 3
+
+
+@pytest.mark.asyncio
+async def test_persist_skips_inventory_items_already_stored(
+    inventory_repo: MinioInventoryRepository, fake_client: FakeMinioClient
+) -> None:
+    """Test that an item whose stored ETag matches is not written again"""
+    order = _order(
+        OrderItem(product_id="prod1", quantity=2, price=Decimal("10"))
+    )
+    await inventory_repo.reserve_items(order)
+
+    with patch.object(
+        fake_client, "put_object", wraps=fake_client.put_object
+    ) as put_object:
+        await inventory_repo.reserve_items(order)
+
+    put_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_persist_rewrites_changed_inventory_items(
+    inventory_repo: MinioInventoryRepository, fake_client: FakeMinioClient
+) -> None:
+    """Test that an item whose stored content differs is overwritten"""
+    order = _order(
+        OrderItem(product_id="prod1", quantity=2, price=Decimal("10"))
+    )
+    await inventory_repo.reserve_items(order)
+
+    with patch.object(
+        fake_client, "put_object", wraps=fake_client.put_object
+    ) as put_object:
+        await inventory_repo.release_items(order)
+
+    put_object.assert_called_once()
+    stored = fake_client.get_stored_objects("inventory")["order-1_prod1"]
+    assert json.loads(stored["data"])["reserved"] == 0
+
+
+@pytest.mark.asyncio
+async def test_persist_caps_concurrent_inventory_writes(
+    fake_client: FakeMinioClient,
+) -> None:
+    """Test that no more than max_concurrent_writes items are written at
+    once"""
+    with patch(
+        "sample.repos.minio.inventory.Minio", return_value=fake_client
+    ):
+        repo = MinioInventoryRepository(
+            "test-endpoint", max_concurrent_writes=2
+        )
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    put_object = fake_client.put_object
+
+    def slow_put_object(*args: Any, **kwargs: Any) -> Any:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return put_object(*args, **kwargs)
+
+    order = _order(
+        *(
+            OrderItem(product_id=f"prod{i}", quantity=1, price=Decimal("1"))
+            for i in range(6)
+        )
+    )
+    with patch.object(fake_client, "put_object", slow_put_object):
+        await repo.reserve_items(order)
+
+    assert peak == 2
+    assert fake_client.get_object_count("inventory") == 6
+
+
+@pytest.mark.asyncio
+async def test_save_order_skips_unchanged_order(
+    order_repo: MinioOrderRepository, fake_client: FakeMinioClient
+) -> None:
+    """Test that saving an order identical to the stored one skips the
+    PUT"""
+    order = _order(
+        OrderItem(product_id="prod1", quantity=2, price=Decimal("10"))
+    )
+    await order_repo.save_order(order)
+
+    with patch.object(
+        fake_client, "put_object", wraps=fake_client.put_object
+    ) as put_object:
+        await order_repo.save_order(order)
+
+    put_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_save_order_rewrites_changed_order(
+    order_repo: MinioOrderRepository, fake_client: FakeMinioClient
+) -> None:
+    """Test that an order differing from the stored one is written"""
+    order = _order(
+        OrderItem(product_id="prod1", quantity=2, price=Decimal("10"))
+    )
+    await order_repo.save_order(order)
+
+    with patch.object(
+        fake_client, "put_object", wraps=fake_client.put_object
+    ) as put_object:
+        await order_repo.save_order(
+            order.model_copy(update={"status": "completed"})
+        )
+
+    put_object.assert_called_once()
+    stored = await order_repo.get_order("order-1")
+    assert stored is not None
+    assert stored.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_mapping_lookup_is_served_from_cache(
+    order_request_repo: MinioOrderRequestRepository,
+    fake_client: FakeMinioClient,
+) -> None:
+    """Test that a mapping found once is not fetched from Minio again, in
+    either direction"""
+    await order_request_repo.store_bidirectional_mapping("req-1", "order-1")
+    # As if the mapping had been stored by another process
+    order_request_repo._mapping_cache.clear()
+
+    with patch.object(
+        fake_client, "get_object", wraps=fake_client.get_object
+    ) as get_object:
+        first = await order_request_repo.get_order_id_for_request("req-1")
+        second = await order_request_repo.get_order_id_for_request("req-1")
+        reverse = await order_request_repo.get_request_id_for_order("order-1")
+
+    assert (first, second, reverse) == ("order-1", "order-1", "req-1")
+    get_object.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stored_mapping_replaces_cached_mapping(
+    order_request_repo: MinioOrderRequestRepository,
+    fake_client: FakeMinioClient,
+) -> None:
+    """Test that rewriting a request's mapping to another order is seen
+    by later lookups, without fetching it from Minio"""
+    await order_request_repo.store_bidirectional_mapping("req-1", "order-1")
+    assert (
+        await order_request_repo.get_order_id_for_request("req-1")
+        == "order-1"
+    )
+
+    await order_request_repo.store_bidirectional_mapping("req-1", "order-2")
+
+    with patch.object(
+        fake_client, "get_object", wraps=fake_client.get_object
+    ) as get_object:
+        order_id = await order_request_repo.get_order_id_for_request("req-1")
+        request_id = await order_request_repo.get_request_id_for_order(
+            "order-2"
+        )
+
+    assert (order_id, request_id) == ("order-2", "req-1")
+    get_object.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_mapping_misses_are_not_cached(
+    order_request_repo: MinioOrderRequestRepository,
+) -> None:
+    """Test that a mapping stored after a failed lookup is then found"""
+    assert await order_request_repo.get_order_id_for_request("req-1") is None
+
+    await order_request_repo.store_bidirectional_mapping("req-1", "order-1")
+
+    assert (
+        await order_request_repo.get_order_id_for_request("req-1")
+        == "order-1"
+    )
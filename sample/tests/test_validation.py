@@ -15,6 +15,7 @@ from sample.validation import (
     RepositoryValidationError,
     DomainValidationError,
     ensure_payment_repository,
+    ensure_repository_protocol,
 )
 from sample.repositories import PaymentRepository, InventoryRepository
 from sample.repos.minio.inventory import MinioInventoryRepository
@@ -163,6 +164,25 @@ def test_ensure_payment_repository_failure() -> None:
         ensure_payment_repository(invalid_repo)
 
 
+def test_ensure_repository_protocol_checks_each_type_once() -> None:
+    """Test that a repository type is only validated the first time"""
+
+    # A fresh subclass, so no earlier test has validated this type yet
+    class FreshMinioPaymentRepository(MinioPaymentRepository):
+        pass
+
+    with patch("sample.repos.minio.payment.Minio"), patch(
+        "sample.validation.validate_repository_protocol"
+    ) as mock_validate:
+        first = FreshMinioPaymentRepository("test-endpoint")
+        second = FreshMinioPaymentRepository("test-endpoint")
+
+        ensure_repository_protocol(first, PaymentRepository)  # type: ignore[type-abstract]
+        ensure_repository_protocol(second, PaymentRepository)  # type: ignore[type-abstract]
+
+        mock_validate.assert_called_once_with(first, PaymentRepository)
+
+
 def test_inventory_repository_validation() -> None:
     """Test that inventory repository validation works"""
 
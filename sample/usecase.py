@@ -10,7 +10,6 @@ from pydantic import ValidationError
 from sample.api.responses import OrderStatusResponse
 from sample.domain import (
     Order,
-    OrderItem,
     CreateOrderRequest,
     RefundPaymentArgs,
 )
@@ -203,14 +202,8 @@ class OrderFulfillmentUseCase:
             order = Order(
                 order_id=order_id,
                 customer_id=request.customer_id,
-                items=[
-                    OrderItem(
-                        product_id=item.product_id,
-                        quantity=item.quantity,
-                        price=item.price,
-                    )
-                    for item in request.items
-                ],
+                # Request items are already validated, frozen OrderItems
+                items=list(request.items),
                 total_amount=request.total_amount,
                 status="pending",  # Initial status
             )
@@ -14,7 +14,7 @@ comprehensive data validation. The goal is to catch configuration and
 data errors early at critical application boundaries.
 """
 
-from typing import Type, TypeVar, Callable, Any
+from typing import Type, TypeVar, Callable, Any, Set, Tuple
 from pydantic import BaseModel, ValidationError
 import logging
 
@@ -22,6 +22,10 @@ logger = logging.getLogger(__name__)
 
 P = TypeVar("P")
 
+# (implementation type, protocol) pairs that have already passed
+# validation. Failures are never recorded, so they keep raising.
+_validated_protocol_pairs: Set[Tuple[type, type]] = set()
+
 
 class RepositoryValidationError(Exception):
     """Raised when repository contract validation fails"""
@@ -96,6 +100,10 @@ def ensure_repository_protocol(repository: object, protocol: Type[P]) -> P:
 
     This provides both runtime validation and static type checking benefits.
 
+    Use cases are constructed per request (and per workflow run), so the
+    result is remembered per repository type: once a type has passed for a
+    protocol, later instances of it are returned without re-checking.
+
     Args:
         repository: The repository implementation to validate
         protocol: The protocol class to validate against
@@ -117,7 +125,10 @@ def ensure_repository_protocol(repository: object, protocol: Type[P]) -> P:
         >>> # Type checker now knows validated_repo satisfies
         >>> # PaymentRepository
     """
-    validate_repository_protocol(repository, protocol)
+    key = (type(repository), protocol)
+    if key not in _validated_protocol_pairs:
+        validate_repository_protocol(repository, protocol)
+        _validated_protocol_pairs.add(key)
     return repository  # type: ignore[return-value]
 
 
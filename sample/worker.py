@@ -14,6 +14,7 @@ from sample.workflow import (
     OrderFulfillmentWorkflow,
     CancelOrderWorkflow,
 )  # Added CancelOrderWorkflow
+from sample.repos.minio.inventory import DEFAULT_MAX_CONCURRENT_WRITES
 from sample.repos.temporal.activities import (
     TemporalMinioOrderRepository,
     TemporalMinioPaymentRepository,
@@ -23,35 +24,13 @@ from sample.repos.temporal.activities import (
 from util.repos.temporal.minio_file_storage import (
     TemporalMinioFileStorageRepository,
 )
+from util.env import env_positive_int
+from util.temporal.activities import collect_activities_from_instances
+from util.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
 
-def setup_logging() -> None:
-    """Configure logging based on environment variables"""
-    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    log_format = os.environ.get(
-        "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-
-    # Validate log level
-    numeric_level = getattr(logging, log_level, None)
-    if not isinstance(numeric_level, int):
-        print(f"Invalid log level: {log_level}, defaulting to INFO")
-        numeric_level = logging.INFO
-
-    logging.basicConfig(
-        level=numeric_level,
-        format=log_format,
-        force=True,  # Override any existing configuration
-    )
-
-    logger.info(
-        "Logging configured",
-        extra={"log_level": log_level, "numeric_level": numeric_level},
-    )
-
-
 async def get_temporal_client_with_retries(
     endpoint: str, attempts: int = 10, delay: int = 5
 ) -> Client:
@@ -136,7 +115,11 @@ async def run_worker() -> None:
         endpoint=minio_endpoint
     )
     temporal_inventory_repo = TemporalMinioInventoryRepository(
-        endpoint=minio_endpoint
+        endpoint=minio_endpoint,
+        max_concurrent_writes=env_positive_int(
+            "MINIO_INVENTORY_MAX_CONCURRENT_WRITES",
+            DEFAULT_MAX_CONCURRENT_WRITES,
+        ),
     )
     temporal_order_request_repo = TemporalMinioOrderRequestRepository()
     temporal_file_storage_repo = (
@@ -145,23 +128,13 @@ async def run_worker() -> None:
 
     # Create a worker that hosts workflow and activities
     # The worker automatically uses the data converter from the client.
-    activities = [
-        temporal_order_repo.generate_order_id,
-        temporal_order_repo.save_order,
-        temporal_order_repo.get_order,
-        temporal_order_repo.cancel_order,  # New activity
-        temporal_payment_repo.process_payment,
-        temporal_payment_repo.get_payment,
-        temporal_payment_repo.refund_payment,  # New activity
-        temporal_inventory_repo.reserve_items,
-        temporal_inventory_repo.release_items,
-        temporal_order_request_repo.store_bidirectional_mapping,
-        temporal_order_request_repo.get_order_id_for_request,
-        temporal_order_request_repo.get_request_id_for_order,
-        temporal_file_storage_repo.upload_file,  # New activity
-        temporal_file_storage_repo.download_file,  # New activity
-        temporal_file_storage_repo.get_file_metadata,  # New activity
-    ]
+    activities = collect_activities_from_instances(
+        temporal_order_repo,
+        temporal_payment_repo,
+        temporal_inventory_repo,
+        temporal_order_request_repo,
+        temporal_file_storage_repo,
+    )
 
     logger.info(
         "Creating Temporal worker",
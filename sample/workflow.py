@@ -7,6 +7,7 @@ so we need to use the temporal repositories.
 from temporalio import workflow
 
 from sample.domain import (
+    CancelOrderInput,
     CreateOrderRequest,
 )
 from sample.api.responses import (
@@ -38,17 +39,18 @@ class OrderFulfillmentWorkflow:
         return str(self.current_step)
 
     @workflow.run
-    async def run(self, request_dict: dict) -> OrderStatusResponse:
+    async def run(self, request: CreateOrderRequest) -> OrderStatusResponse:
         """
         Run the order fulfillment workflow.
         This is just a thin wrapper around the use case.
 
-        The workflow accepts a dict containing request data.
-        All conversion between Pydantic and domain models happens in the
-        use case. The workflow returns the Pydantic response object
-        directly - let the data converter handle serialization.
+        The workflow accepts the CreateOrderRequest model; the Pydantic
+        data converter decodes the payload straight into it. The workflow
+        returns the Pydantic response object directly - let the data
+        converter handle serialization.
         """
-        # Extract request_id from workflow ID (format: "req-{hash}")
+        # Extract request_id from workflow ID: "req-" followed by a uuid4
+        # hex, or by the Idempotency-Key digest for idempotent submissions
         request_id = workflow.info().workflow_id
 
         workflow.logger.debug(
@@ -64,51 +66,13 @@ class OrderFulfillmentWorkflow:
             "Workflow input received",
             extra={
                 "request_id": request_id,
-                "request_dict_keys": (
-                    list(request_dict.keys())
-                    if isinstance(request_dict, dict)
-                    else []
-                ),
-                "customer_id": (
-                    request_dict.get("customer_id")
-                    if isinstance(request_dict, dict)
-                    else None
-                ),
-                "debug_step": "before_pydantic_model_creation",
+                "customer_id": request.customer_id,
+                "item_count": len(request.items),
+                "total_amount": str(request.total_amount),
+                "debug_step": "workflow_input_received",
             },
         )
 
-        try:
-            # Recreate the Pydantic model from the request dict
-            request = CreateOrderRequest(**request_dict)
-            workflow.logger.debug(
-                "Pydantic request model created successfully",
-                extra={
-                    "request_id": request_id,
-                    "customer_id": request.customer_id,
-                    "item_count": len(request.items),
-                    "total_amount": str(request.total_amount),
-                    "debug_step": "pydantic_model_created",
-                },
-            )
-            workflow.logger.debug(
-                "Successfully created Pydantic request model",
-                extra={
-                    "request_id": request_id,
-                    "debug_step": "pydantic_model_created",
-                },
-            )
-        except Exception as e:
-            workflow.logger.error(
-                "Failed to create Pydantic request model",
-                extra={
-                    "request_id": request_id,
-                    "error": str(e),
-                    "debug_step": "pydantic_model_failed",
-                },
-            )
-            raise
-
         try:
             # Create repository stubs
             # These stubs delegate to Temporal activities, ensuring
@@ -280,13 +244,13 @@ class CancelOrderWorkflow:
         return str(self.current_step)
 
     @workflow.run
-    async def run(self, args_dict: dict) -> OrderStatusResponse:
+    async def run(self, args: CancelOrderInput) -> OrderStatusResponse:
         """
         Run the order cancellation workflow.
         This is a thin wrapper around the CancelOrderUseCase.
         """
-        order_id = args_dict["order_id"]
-        reason = args_dict.get("reason")
+        order_id = args.order_id
+        reason = args.reason
 
         workflow.logger.info(
             "Starting order cancellation workflow",
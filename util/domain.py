@@ -20,6 +20,95 @@ class FileMetadata(BaseModel):
     metadata: Dict[str, str] = Field(default_factory=dict)
 
 
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB limit
+
+ALLOWED_CONTENT_TYPES = frozenset(
+    {
+        "text/plain",
+        "text/csv",
+        "application/json",
+        "application/pdf",
+        "image/jpeg",
+        "image/png",
+        "image/gif",
+        "application/zip",
+        "application/octet-stream",
+    }
+)
+
+_DANGEROUS_FILENAME_PATTERNS = [
+    "..",
+    "~",
+    "$",
+    "`",
+    "|",
+    "&",
+    ";",
+    "(",
+    ")",
+    "{",
+    "}",
+    "[",
+    "]",
+]
+
+
+def _validate_filename(v: str) -> str:
+    """Validate and sanitize filename to prevent path traversal attacks."""
+    import os
+
+    if not v or not v.strip():
+        raise ValueError("Filename cannot be empty")
+
+    # Remove any path components to prevent directory traversal
+    sanitized = os.path.basename(v.strip())
+
+    # Check for dangerous patterns
+    for pattern in _DANGEROUS_FILENAME_PATTERNS:
+        if pattern in sanitized:
+            raise ValueError(
+                f"Filename contains dangerous pattern: {pattern}"
+            )
+
+    # Ensure filename has reasonable length
+    if len(sanitized) > 255:
+        raise ValueError("Filename too long (max 255 characters)")
+
+    # Ensure filename is not empty after sanitization
+    if not sanitized:
+        raise ValueError("Filename is empty after sanitization")
+
+    return sanitized
+
+
+def _validate_file_size(size: int) -> None:
+    """Validate file size to prevent resource exhaustion."""
+    # A negative size would make a streamed upload read until EOF,
+    # bypassing the cap below
+    if size < 0:
+        raise ValueError("File size cannot be negative")
+
+    if size > MAX_FILE_SIZE:
+        raise ValueError(
+            f"File size {size} bytes exceeds maximum allowed size of "
+            f"{MAX_FILE_SIZE} bytes"
+        )
+
+    if size == 0:
+        raise ValueError("File cannot be empty")
+
+
+def _validate_content_type(v: str) -> str:
+    """Validate content type against allowed types."""
+    if v not in ALLOWED_CONTENT_TYPES:
+        raise ValueError(
+            f"Content type '{v}' not allowed. Allowed types: "
+            f"{', '.join(sorted(ALLOWED_CONTENT_TYPES))}"
+        )
+
+    return v
+
+
 class FileUploadArgs(BaseModel):
     """
     Arguments for file upload with security validation.
@@ -40,82 +129,53 @@ class FileUploadArgs(BaseModel):
     def validate_filename(cls, v: str) -> str:
         """Validate and sanitize filename to prevent path traversal
         attacks."""
-        import os
-
-        if not v or not v.strip():
-            raise ValueError("Filename cannot be empty")
-
-        # Remove any path components to prevent directory traversal
-        sanitized = os.path.basename(v.strip())
-
-        # Check for dangerous patterns
-        dangerous_patterns = [
-            "..",
-            "~",
-            "$",
-            "`",
-            "|",
-            "&",
-            ";",
-            "(",
-            ")",
-            "{",
-            "}",
-            "[",
-            "]",
-        ]
-        for pattern in dangerous_patterns:
-            if pattern in sanitized:
-                raise ValueError(
-                    f"Filename contains dangerous pattern: {pattern}"
-                )
-
-        # Ensure filename has reasonable length
-        if len(sanitized) > 255:
-            raise ValueError("Filename too long (max 255 characters)")
-
-        # Ensure filename is not empty after sanitization
-        if not sanitized:
-            raise ValueError("Filename is empty after sanitization")
-
-        return sanitized
+        return _validate_filename(v)
 
     @field_validator("data")
     @classmethod
     def validate_file_size(cls, v: bytes) -> bytes:
         """Validate file size to prevent resource exhaustion."""
-        max_size = 50 * 1024 * 1024  # 50MB limit
-        if len(v) > max_size:
-            raise ValueError(
-                f"File size {len(v)} bytes exceeds maximum allowed size of "
-                f"{max_size} bytes"
-            )
-
-        if len(v) == 0:
-            raise ValueError("File cannot be empty")
-
+        _validate_file_size(len(v))
         return v
 
     @field_validator("content_type")
     @classmethod
     def validate_content_type(cls, v: str) -> str:
         """Validate content type against allowed types."""
-        allowed_types = {
-            "text/plain",
-            "text/csv",
-            "application/json",
-            "application/pdf",
-            "image/jpeg",
-            "image/png",
-            "image/gif",
-            "application/zip",
-            "application/octet-stream",
-        }
-
-        if v not in allowed_types:
-            raise ValueError(
-                f"Content type '{v}' not allowed. Allowed types: "
-                f"{', '.join(sorted(allowed_types))}"
-            )
+        return _validate_content_type(v)
+
 
+class FileStreamUploadArgs(BaseModel):
+    """
+    Arguments for a streamed file upload with security validation.
+
+    Carries the same checks as FileUploadArgs, but declares the size up
+    front instead of holding the content, so the data can be streamed to
+    storage without being buffered in memory.
+    """
+
+    file_id: str
+    filename: str
+    size_bytes: int
+    content_type: str
+    metadata: dict = Field(default_factory=dict)
+
+    @field_validator("filename")
+    @classmethod
+    def validate_filename(cls, v: str) -> str:
+        """Validate and sanitize filename to prevent path traversal
+        attacks."""
+        return _validate_filename(v)
+
+    @field_validator("size_bytes")
+    @classmethod
+    def validate_file_size(cls, v: int) -> int:
+        """Validate file size to prevent resource exhaustion."""
+        _validate_file_size(v)
         return v
+
+    @field_validator("content_type")
+    @classmethod
+    def validate_content_type(cls, v: str) -> str:
+        """Validate content type against allowed types."""
+        return _validate_content_type(v)
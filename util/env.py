@@ -0,0 +1,45 @@
+"""
+Numeric settings read from the environment by the workers.
+
+A malformed value is not fatal: it is logged with the variable name and
+the default is used instead, so a typo in a deployment shows up clearly
+in the logs rather than as a bare ValueError at startup.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(
+            "Invalid float in environment, using default",
+            extra={"variable": name, "value": value, "default": default},
+        )
+        return default
+
+
+def env_positive_int(name: str, default: int) -> int:
+    """Read a positive int from the environment, falling back to default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        logger.warning(
+            "Invalid positive integer in environment, using default",
+            extra={"variable": name, "value": value, "default": default},
+        )
+        return default
+    return parsed
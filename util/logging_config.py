@@ -0,0 +1,50 @@
+"""
+Process-wide logging configuration shared by the APIs and workers.
+
+setup_logging() reads LOG_LEVEL and LOG_FORMAT from the environment and
+installs the root handler. It only does so once per process: importing or
+starting several components must not tear down and rebuild the handlers
+each time.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_configured = False
+
+
+def setup_logging() -> None:
+    """Configure logging based on environment variables"""
+    global _configured
+    if _configured:
+        return
+
+    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    log_format = os.environ.get("LOG_FORMAT", DEFAULT_LOG_FORMAT)
+
+    # Validate log level
+    numeric_level = getattr(logging, log_level, None)
+    level_is_valid = isinstance(numeric_level, int)
+    if not level_is_valid:
+        numeric_level = logging.INFO
+
+    logging.basicConfig(
+        level=numeric_level,
+        format=log_format,
+        force=True,  # Override any existing configuration
+    )
+    _configured = True
+
+    if not level_is_valid:
+        logger.warning(
+            "Invalid log level, defaulting to INFO",
+            extra={"log_level": log_level},
+        )
+    logger.info(
+        "Logging configured",
+        extra={"log_level": log_level, "numeric_level": numeric_level},
+    )
@@ -1,16 +1,99 @@
+import asyncio
 import io
 import logging
 import os
-from typing import Optional
+from datetime import datetime
+from typing import Any, BinaryIO, Iterator, Mapping, Optional, Tuple
 
 from minio import Minio  # type: ignore[import-untyped]
 from minio.error import S3Error  # type: ignore[import-untyped]
+from minio.time import from_http_header  # type: ignore[import-untyped]
 
-from util.domain import FileMetadata, FileUploadArgs
+from util.domain import FileMetadata, FileStreamUploadArgs, FileUploadArgs
 from util.repositories import FileStorageRepository
 
 logger = logging.getLogger(__name__)
 
+# Streamed uploads are sent as multipart uploads of this size, which bounds
+# the memory a single upload holds at once
+UPLOAD_PART_SIZE = 10 * 1024 * 1024
+
+# Chunk size used when streaming downloads out of Minio
+DOWNLOAD_CHUNK_SIZE = 32 * 1024
+
+# S3 error codes meaning the requested file does not exist
+_NOT_FOUND_CODES = ("NoSuchKey", "NoSuchBucket")
+
+
+def _file_metadata_from_headers(
+    file_id: str,
+    headers: Optional[Mapping[str, str]],
+    content_type: Optional[str],
+    size_bytes: Optional[int],
+    last_modified: Optional[datetime],
+) -> FileMetadata:
+    """Build FileMetadata from a Minio object's response headers."""
+    uploaded_at_str: Optional[str] = (
+        last_modified.isoformat() if last_modified else None
+    )
+    # Extract filename and metadata more explicitly
+    filename = headers.get("X-Amz-Meta-Filename") if headers else None
+    metadata = (
+        {k.replace("X-Amz-Meta-", ""): v for k, v in headers.items()}
+        if headers
+        else {}
+    )
+
+    return FileMetadata(
+        file_id=file_id,
+        filename=filename,  # Minio prepends X-Amz-Meta-
+        content_type=content_type,
+        size_bytes=size_bytes,
+        uploaded_at=uploaded_at_str or "",  # Provide empty string if None
+        metadata=metadata,
+    )
+
+
+class _ReleasingStream(Iterator[bytes]):
+    """Iterate a Minio response body in chunks, then release it.
+
+    The response is released once the body is exhausted, fails, or the
+    stream is closed. Unlike a generator's finally block, close() (and
+    garbage collection) also release a stream that was never iterated,
+    e.g. when the client disconnects before the body is sent.
+    """
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        # Set first, so close() (and __del__) never see it missing
+        self._chunks: Optional[Iterator[bytes]] = None
+        try:
+            self._chunks = response.stream(DOWNLOAD_CHUNK_SIZE)
+        except BaseException:
+            response.close()
+            response.release_conn()
+            raise
+
+    def __next__(self) -> bytes:
+        if self._chunks is None:
+            raise StopIteration
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Release the response's connection; safe to call repeatedly."""
+        if self._chunks is None:
+            return
+        self._chunks = None
+        self._response.close()
+        self._response.release_conn()
+
+    def __del__(self) -> None:
+        self.close()
+
 
 class MinioFileStorageRepository(FileStorageRepository):
     """
@@ -134,6 +217,51 @@ class MinioFileStorageRepository(FileStorageRepository):
             )
             raise
 
+    async def upload_file_stream(
+        self, args: FileStreamUploadArgs, stream: BinaryIO
+    ) -> FileMetadata:
+        """Upload a file to Minio storage by streaming it in parts."""
+        client = await self._get_client()
+        logger.info(
+            "Streaming file to Minio",
+            extra={
+                "file_id": args.file_id,
+                "filename": args.filename,
+                "content_type": args.content_type,
+                "size_bytes": args.size_bytes,
+            },
+        )
+        try:
+            # The parts are read and sent by blocking calls, so run the
+            # whole transfer off the event loop
+            await asyncio.to_thread(
+                client.put_object,
+                self._bucket_name,
+                args.file_id,
+                stream,
+                args.size_bytes,
+                content_type=args.content_type,
+                metadata=args.metadata,
+                part_size=UPLOAD_PART_SIZE,
+            )
+            logger.info(
+                "File streamed successfully to Minio",
+                extra={"file_id": args.file_id},
+            )
+            return FileMetadata(
+                file_id=args.file_id,
+                filename=args.filename,
+                content_type=args.content_type,
+                size_bytes=args.size_bytes,
+                metadata=args.metadata,
+            )
+        except S3Error as e:
+            logger.error(
+                f"Error streaming file to Minio: {e}",
+                extra={"file_id": args.file_id, "error_code": e.code},
+            )
+            raise
+
     async def download_file(self, file_id: str) -> Optional[bytes]:
         """Download a file from Minio storage by its ID."""
         client = await self._get_client()
@@ -152,7 +280,7 @@ class MinioFileStorageRepository(FileStorageRepository):
             )
             return file_data
         except S3Error as e:
-            if e.code == "NoSuchKey":
+            if e.code in _NOT_FOUND_CODES:
                 logger.warning(
                     "File not found in Minio", extra={"file_id": file_id}
                 )
@@ -163,6 +291,58 @@ class MinioFileStorageRepository(FileStorageRepository):
             )
             raise
 
+    async def download_file_stream(
+        self, file_id: str
+    ) -> Optional[Tuple[FileMetadata, Iterator[bytes]]]:
+        """Open a file in Minio, taking its metadata from the GET headers."""
+        client = await self._get_client()
+        logger.info(
+            "Attempting to stream file from Minio",
+            extra={"file_id": file_id},
+        )
+        try:
+            # The GET waits for the response headers, so keep it off the
+            # event loop like the upload
+            response = await asyncio.to_thread(
+                client.get_object, self._bucket_name, file_id
+            )
+        except S3Error as e:
+            if e.code in _NOT_FOUND_CODES:
+                logger.warning(
+                    "File not found in Minio", extra={"file_id": file_id}
+                )
+                return None
+            logger.error(
+                f"Error streaming file from Minio: {e}",
+                extra={"file_id": file_id, "error_code": e.code},
+            )
+            raise
+
+        chunks = _ReleasingStream(response)
+        headers = response.headers
+        content_length = headers.get("Content-Length")
+        last_modified = headers.get("Last-Modified")
+        try:
+            file_metadata = _file_metadata_from_headers(
+                file_id,
+                headers,
+                headers.get("Content-Type"),
+                int(content_length) if content_length is not None else None,
+                from_http_header(last_modified) if last_modified else None,
+            )
+        except Exception:
+            chunks.close()
+            raise
+        logger.info(
+            "File stream opened from Minio",
+            extra={
+                "file_id": file_id,
+                "size_bytes": file_metadata.size_bytes,
+                "content_type": file_metadata.content_type,
+            },
+        )
+        return file_metadata, chunks
+
     async def get_file_metadata(self, file_id: str) -> Optional[FileMetadata]:
         """Retrieve metadata for a stored file from Minio."""
         client = await self._get_client()
@@ -180,35 +360,15 @@ class MinioFileStorageRepository(FileStorageRepository):
                     "content_type": stat.content_type,
                 },
             )
-            uploaded_at_str: Optional[str] = (
-                stat.last_modified.isoformat() if stat.last_modified else None
-            )
-            # Extract filename and metadata more explicitly
-            filename = (
-                stat.metadata.get("X-Amz-Meta-Filename")
-                if stat.metadata
-                else None
-            )
-            metadata = (
-                {
-                    k.replace("X-Amz-Meta-", ""): v
-                    for k, v in stat.metadata.items()
-                }
-                if stat.metadata
-                else {}
-            )
-
-            return FileMetadata(
-                file_id=file_id,
-                filename=filename,  # Minio prepends X-Amz-Meta-
-                content_type=stat.content_type,
-                size_bytes=stat.size,
-                uploaded_at=uploaded_at_str
-                or "",  # Provide empty string if None
-                metadata=metadata,
+            return _file_metadata_from_headers(
+                file_id,
+                stat.metadata,
+                stat.content_type,
+                stat.size,
+                stat.last_modified,
             )
         except S3Error as e:
-            if e.code == "NoSuchKey":
+            if e.code in _NOT_FOUND_CODES:
                 logger.warning(
                     "File metadata not found in Minio",
                     extra={"file_id": file_id},
@@ -0,0 +1,41 @@
+"""
+Connection pool for Minio clients shared by many concurrent callers.
+"""
+
+import os
+
+import certifi
+import urllib3
+
+# Floor for the number of pooled connections kept per Minio host
+MIN_HTTP_POOL_SIZE = 64
+
+
+def create_minio_http_client(max_concurrency: int) -> urllib3.PoolManager:
+    """Build the urllib3 pool for a Minio client shared by many callers.
+
+    The Minio default keeps only 10 connections per host, so a worker
+    running many activities at once keeps dropping and re-opening them.
+    This pool keeps twice the expected concurrency (at least
+    MIN_HTTP_POOL_SIZE). Timeouts, retries and certificate handling match
+    the Minio defaults; only the pool size differs.
+
+    Args:
+        max_concurrency: Most calls expected to use the client at once
+
+    Returns:
+        PoolManager to pass as Minio(..., http_client=...)
+    """
+    timeout = 300  # Minio's default connect and read timeout
+    return urllib3.PoolManager(
+        maxsize=max(MIN_HTTP_POOL_SIZE, max_concurrency * 2),
+        block=False,
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
@@ -7,6 +7,7 @@ This allows domain models to implement context-aware validation that can
 be more permissive during Temporal serialization/deserialization.
 """
 
+import functools
 from typing import Any, Optional, Type
 
 from pydantic import TypeAdapter
@@ -22,6 +23,23 @@ from temporalio.converter import (
 )
 import temporalio.api.common.v1
 
+# Most distinct type hints whose type adapters are kept
+TYPE_ADAPTER_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def _cached_type_adapter(type_hint: Any) -> TypeAdapter[Any]:
+    """Build the type adapter for a hint once and reuse it."""
+    return TypeAdapter(type_hint)
+
+
+def _type_adapter(type_hint: Any) -> TypeAdapter[Any]:
+    """Type adapter for a hint, cached unless the hint is unhashable."""
+    try:
+        return _cached_type_adapter(type_hint)
+    except TypeError:
+        return TypeAdapter(type_hint)
+
 
 class TemporalValidationPydanticConverter(PydanticJSONPlainPayloadConverter):
     """Custom Pydantic JSON converter that adds temporal_validation context.
@@ -53,10 +71,12 @@ class TemporalValidationPydanticConverter(PydanticJSONPlainPayloadConverter):
             Deserialized object with temporal validation context applied
         """
         # Convert Optional[Type] to Type, defaulting to Any (same as original)
-        _type_hint = type_hint if type_hint is not None else Any
+        _type_hint: Any = type_hint if type_hint is not None else Any
 
-        # Always add temporal_validation context for Pydantic model validation
-        return TypeAdapter(_type_hint).validate_json(
+        # Adapters are cached per type hint so the validation schema is not
+        # rebuilt for every payload. Always add temporal_validation context
+        # for Pydantic model validation
+        return _type_adapter(_type_hint).validate_json(
             payload.data, context={"temporal_validation": True}
         )
 
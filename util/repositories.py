@@ -1,5 +1,12 @@
-from typing import Protocol, Optional, runtime_checkable
-from util.domain import FileMetadata, FileUploadArgs
+from typing import (
+    BinaryIO,
+    Iterator,
+    Protocol,
+    Optional,
+    Tuple,
+    runtime_checkable,
+)
+from util.domain import FileMetadata, FileStreamUploadArgs, FileUploadArgs
 
 
 @runtime_checkable
@@ -53,3 +60,51 @@ class FileStorageRepository(Protocol):
             FileMetadata object if found, None otherwise.
         """
         ...
+
+
+@runtime_checkable
+class StreamingFileStorageRepository(FileStorageRepository, Protocol):
+    """File storage that can also move file content as a stream.
+
+    Only implemented by repositories that talk to storage directly; the
+    Temporal proxies cannot pass a file object through an activity and
+    only offer upload_file.
+    """
+
+    async def upload_file_stream(
+        self, args: FileStreamUploadArgs, stream: BinaryIO
+    ) -> FileMetadata:
+        """Upload a file to storage by reading it from a stream.
+
+        Args:
+            args: FileStreamUploadArgs with file_id, size and metadata.
+            stream: Binary file object positioned at the start of the
+                content; exactly args.size_bytes bytes are read.
+
+        Returns:
+            FileMetadata object with details about the uploaded file.
+
+        Implementation Notes:
+        - Must not buffer the whole file in memory.
+        - Same idempotency guarantees as upload_file.
+        """
+        ...
+
+    async def download_file_stream(
+        self, file_id: str
+    ) -> Optional[Tuple[FileMetadata, Iterator[bytes]]]:
+        """Open a file for download, returning its metadata and content.
+
+        Args:
+            file_id: Unique identifier of the file.
+
+        Returns:
+            Tuple of FileMetadata and an iterator over the content in
+            chunks if found, None otherwise. Metadata and content come
+            from a single storage request.
+
+        Implementation Notes:
+        - The iterator must release the underlying connection once it is
+          exhausted or closed.
+        """
+        ...
@@ -12,6 +12,10 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Class attribute where @temporal_activity_registration records the names
+# of the methods it wrapped as activities
+TEMPORAL_ACTIVITIES_ATTR = "__temporal_activities__"
+
 
 def discover_protocol_methods(
     cls_hierarchy: tuple[type, ...],
@@ -107,10 +111,15 @@ def collect_activities_from_instances(*instances: Any) -> list[Any]:
     activities = []
 
     for instance in instances:
-        # Use the same discovery logic as the decorator
-        methods_to_collect = discover_protocol_methods(
-            instance.__class__.__mro__
+        # Decorated classes record their activity names; fall back to the
+        # decorator's discovery logic for anything else
+        methods_to_collect = getattr(
+            type(instance), TEMPORAL_ACTIVITIES_ATTR, None
         )
+        if methods_to_collect is None:
+            methods_to_collect = discover_protocol_methods(
+                instance.__class__.__mro__
+            )
 
         # Get the actual bound methods from the instance
         for method_name in methods_to_collect:
@@ -26,7 +26,7 @@ from temporalio.common import RetryPolicy
 from pydantic import BaseModel
 
 from julee_example.domain.repositories.base import BaseRepository
-from .activities import discover_protocol_methods
+from .activities import TEMPORAL_ACTIVITIES_ATTR, discover_protocol_methods
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +199,10 @@ def temporal_activity_registration(
 
             wrapped_methods.append(name)
 
+        # Record the wrapped names so workers can collect the activities
+        # without repeating protocol discovery
+        setattr(cls, TEMPORAL_ACTIVITIES_ATTR, tuple(wrapped_methods))
+
         logger.info(
             f"Temporal activity registration decorator applied to "
             f"{cls.__name__}",
@@ -312,12 +316,14 @@ def temporal_workflow_proxy(
                 if is_optional
                 else return_annotation
             )
+            dict_value_type = _get_dict_value_model(return_annotation)
 
             def create_workflow_method(
                 method_name: str,
                 needs_validation: bool,
                 is_optional: bool,
                 inner_type: Any,
+                dict_value_type: Optional[Type[BaseModel]],
                 original_method: Any,
             ) -> Callable[..., Any]:
                 @functools.wraps(original_method)
@@ -394,6 +400,20 @@ def temporal_workflow_proxy(
                         result = inner_type.model_validate(
                             raw_result, context={"temporal_validation": True}
                         )
+                    elif dict_value_type is not None and raw_result:
+                        # Batch lookups such as get_many return a dict of
+                        # serialized models, with None for missing entries
+                        result = {
+                            key: (
+                                None
+                                if value is None
+                                else dict_value_type.model_validate(
+                                    value,
+                                    context={"temporal_validation": True},
+                                )
+                            )
+                            for key, value in raw_result.items()
+                        }
 
                     # Log completion
                     logger.debug(
@@ -414,6 +434,7 @@ def temporal_workflow_proxy(
                 needs_validation,
                 is_optional,
                 inner_type,
+                dict_value_type,
                 original_method,
             )
             setattr(cls, method_name, workflow_method)
@@ -462,6 +483,25 @@ def _needs_pydantic_validation(annotation: Any) -> bool:
     return _is_pydantic_model(annotation)
 
 
+def _get_dict_value_model(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Get the Pydantic model from Dict[K, Model] or Dict[K, Optional[Model]].
+
+    Returns None if the annotation isn't a dict of Pydantic models.
+    """
+    if get_origin(annotation) is not dict:
+        return None
+
+    args = get_args(annotation)
+    if len(args) != 2:
+        return None
+
+    value_type = args[1]
+    if _is_optional_type(value_type):
+        value_type = _get_optional_inner_type(value_type)
+
+    return value_type if _is_pydantic_model(value_type) else None
+
+
 def _is_pydantic_model(type_hint: Any) -> bool:
     """Check if a type is a Pydantic model."""
     if inspect.isclass(type_hint) and issubclass(type_hint, BaseModel):
@@ -0,0 +1,50 @@
+from typing import Annotated, Any, Dict, List
+
+from pydantic import BaseModel, ValidationInfo, field_validator
+
+from util.repos.temporal.data_converter import (
+    TemporalValidationPydanticConverter,
+    _cached_type_adapter,
+)
+
+
+class _ContextProbe(BaseModel):
+    name: str
+    seen_temporal_context: bool = False
+
+    @field_validator("seen_temporal_context", mode="before")
+    @classmethod
+    def record_context(cls, v: Any, info: ValidationInfo) -> bool:
+        return bool(info.context and info.context.get("temporal_validation"))
+
+
+def test_from_payload_reuses_type_adapters() -> None:
+    """Test that decoding caches one type adapter per type hint."""
+    converter = TemporalValidationPydanticConverter()
+    _cached_type_adapter.cache_clear()
+    payload = converter.to_payload(
+        [_ContextProbe(name="a", seen_temporal_context=False)]
+    )
+    assert payload is not None
+
+    for _ in range(3):
+        decoded = converter.from_payload(payload, List[_ContextProbe])
+
+    assert decoded[0].name == "a"
+    assert decoded[0].seen_temporal_context is True
+    cache_info = _cached_type_adapter.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+
+
+def test_from_payload_accepts_unhashable_type_hints() -> None:
+    """Test that unhashable type hints bypass the adapter cache."""
+    converter = TemporalValidationPydanticConverter()
+    payload = converter.to_payload({"name": "a"})
+    assert payload is not None
+
+    # Annotated metadata that is a dict makes the hint unhashable
+    hint = Annotated[Dict[str, str], {"unhashable": True}]
+    decoded = converter.from_payload(payload, hint)  # type: ignore[arg-type]
+
+    assert decoded == {"name": "a"}
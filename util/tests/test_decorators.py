@@ -16,6 +16,7 @@ from typing import (
     runtime_checkable,
     get_origin,
     get_args,
+    Dict,
     List,
 )
 from unittest.mock import patch
@@ -26,14 +27,20 @@ from pydantic import BaseModel
 from temporalio import activity
 
 # Project imports
+import util.temporal.activities as activities_module
 import util.temporal.decorators as decorators_module
 
+from util.temporal.activities import (
+    TEMPORAL_ACTIVITIES_ATTR,
+    collect_activities_from_instances,
+)
 from util.temporal.decorators import (
     temporal_activity_registration,
     temporal_workflow_proxy,
     _extract_concrete_type_from_base,
     _substitute_typevar_with_concrete,
     _needs_pydantic_validation,
+    _get_dict_value_model,
 )
 
 
@@ -441,6 +448,31 @@ def test_multiple_decorations() -> None:
     )
 
 
+def test_decorator_records_activity_names_for_collection() -> None:
+    """Test decorated classes record their activities for workers."""
+
+    @temporal_activity_registration("test.collect")
+    class DecoratedRepository(MockRepository):
+        pass
+
+    recorded = getattr(DecoratedRepository, TEMPORAL_ACTIVITIES_ATTR)
+    assert set(recorded) == {
+        "base_async_method",
+        "process_payment",
+        "get_payment",
+        "refund_payment",
+    }
+
+    repo = DecoratedRepository()
+    with patch.object(
+        activities_module, "discover_protocol_methods"
+    ) as mock_discover:
+        activities = collect_activities_from_instances(repo)
+
+    mock_discover.assert_not_called()
+    assert [a.__name__ for a in activities] == list(recorded)
+
+
 # Test domain models for type substitution tests
 class MockAssemblySpecification(BaseModel):
     """Mock domain model for type substitution tests."""
@@ -684,6 +716,30 @@ class TestPydanticValidationDetection:
         assert not _needs_pydantic_validation(inspect.Signature.empty)
 
 
+class TestDictValueModelDetection:
+    """Tests for _get_dict_value_model function."""
+
+    def test_detects_dict_of_pydantic_models(self) -> None:
+        """Test detection of Dict[str, Model] values."""
+        assert _get_dict_value_model(Dict[str, MockDocument]) is MockDocument
+
+    def test_detects_dict_of_optional_pydantic_models(self) -> None:
+        """Test detection of Dict[str, Optional[Model]] (get_many)."""
+        dict_of_optional_t = Dict[str, Optional[T]]
+        annotation = _substitute_typevar_with_concrete(
+            dict_of_optional_t, MockDocument
+        )
+        assert _get_dict_value_model(annotation) is MockDocument
+
+    def test_rejects_other_types(self) -> None:
+        """Test that non-dict and non-model dict types are ignored."""
+        dict_of_optional_t = Dict[str, Optional[T]]
+        assert _get_dict_value_model(Dict[str, int]) is None
+        assert _get_dict_value_model(dict_of_optional_t) is None
+        assert _get_dict_value_model(List[MockDocument]) is None
+        assert _get_dict_value_model(MockDocument) is None
+
+
 class TestWorkflowProxyIntegration:
     """Integration tests for temporal_workflow_proxy with substitution."""
 
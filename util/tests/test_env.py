@@ -0,0 +1,51 @@
+"""
+Tests for reading numeric settings from the environment.
+"""
+
+import logging
+
+import pytest
+
+from util.env import env_float, env_positive_int
+
+
+def test_env_positive_int_reads_value(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a valid positive integer is returned as is."""
+    monkeypatch.setenv("TEST_LIMIT", "8")
+
+    assert env_positive_int("TEST_LIMIT", 16) == 8
+
+
+def test_env_positive_int_uses_default_when_unset(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an unset variable yields the default."""
+    monkeypatch.delenv("TEST_LIMIT", raising=False)
+
+    assert env_positive_int("TEST_LIMIT", 16) == 16
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-3", "1.5"])
+def test_env_positive_int_rejects_invalid_values(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    value: str,
+) -> None:
+    """Test that invalid values are logged and replaced by the default."""
+    monkeypatch.setenv("TEST_LIMIT", value)
+
+    with caplog.at_level(logging.WARNING, logger="util.env"):
+        assert env_positive_int("TEST_LIMIT", 16) == 16
+
+    assert caplog.records[0].variable == "TEST_LIMIT"  # type: ignore[attr-defined]
+
+
+def test_env_float_uses_default_for_invalid_value(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a malformed float falls back to the default."""
+    monkeypatch.setenv("TEST_DELAY", "soon")
+
+    assert env_float("TEST_DELAY", 2.5) == 2.5
@@ -0,0 +1,40 @@
+"""
+Tests for the shared logging configuration.
+"""
+
+import logging
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+import util.logging_config as logging_config
+from util.logging_config import setup_logging
+
+
+@pytest.fixture(autouse=True)
+def unconfigured() -> Iterator[None]:
+    """Reset the once-per-process guard around each test."""
+    with patch.object(logging_config, "_configured", False):
+        yield
+
+
+def test_setup_logging_configures_only_once() -> None:
+    """Test that repeated calls do not rebuild the root handlers."""
+    with patch.object(logging, "basicConfig") as mock_basic_config:
+        setup_logging()
+        setup_logging()
+
+    mock_basic_config.assert_called_once()
+
+
+def test_setup_logging_defaults_invalid_level_to_info(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that an unknown LOG_LEVEL falls back to INFO."""
+    monkeypatch.setenv("LOG_LEVEL", "LOUD")
+
+    with patch.object(logging, "basicConfig") as mock_basic_config:
+        setup_logging()
+
+    assert mock_basic_config.call_args.kwargs["level"] == logging.INFO
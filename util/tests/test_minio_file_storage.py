@@ -0,0 +1,110 @@
+"""
+Tests for streamed downloads from MinioFileStorageRepository.
+"""
+
+import threading
+from typing import Any, Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from util.repos.minio.file_storage import MinioFileStorageRepository
+
+
+def _repository(response: MagicMock) -> MinioFileStorageRepository:
+    repo = MinioFileStorageRepository(endpoint="test-endpoint")
+    client = MagicMock()
+    client.get_object.return_value = response
+    repo._client = client
+    return repo
+
+
+def _response(chunks: list) -> MagicMock:
+    response = MagicMock()
+    response.headers = {
+        "Content-Length": str(sum(len(chunk) for chunk in chunks)),
+        "Content-Type": "text/plain",
+    }
+    response.stream.side_effect = lambda size: iter(chunks)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_download_file_stream_gets_object_off_the_event_loop() -> None:
+    """Test that the blocking GET runs in a worker thread."""
+    response = _response([b"data"])
+    repo = _repository(response)
+    get_threads = []
+
+    def get_object(*args: Any) -> MagicMock:
+        get_threads.append(threading.current_thread())
+        return response
+
+    repo._client.get_object.side_effect = get_object  # type: ignore[union-attr]
+
+    opened = await repo.download_file_stream("file-1")
+
+    assert opened is not None
+    assert get_threads and get_threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_download_file_stream_releases_after_exhaustion() -> None:
+    """Test that reading the whole body releases the connection."""
+    response = _response([b"ab", b"cd"])
+    repo = _repository(response)
+
+    opened = await repo.download_file_stream("file-1")
+    assert opened is not None
+    metadata, chunks = opened
+
+    assert list(chunks) == [b"ab", b"cd"]
+    assert metadata.size_bytes == 4
+    response.release_conn.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_file_stream_releases_unread_stream_on_close() -> None:
+    """Test that a stream closed before it is iterated, e.g. when the
+    client disconnects first, still releases the connection."""
+    response = _response([b"data"])
+    repo = _repository(response)
+
+    opened = await repo.download_file_stream("file-1")
+    assert opened is not None
+    _, chunks = opened
+    chunks.close()  # type: ignore[attr-defined]
+    chunks.close()  # type: ignore[attr-defined]
+
+    response.close.assert_called_once()
+    response.release_conn.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_file_stream_releases_discarded_stream() -> None:
+    """Test that a stream dropped without being read or closed releases
+    the connection."""
+    response = _response([b"data"])
+    repo = _repository(response)
+
+    opened = await repo.download_file_stream("file-1")
+    assert opened is not None
+    chunks: Iterator[bytes] = opened[1]
+    del opened, chunks
+
+    response.release_conn.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_download_file_stream_releases_when_streaming_fails() -> None:
+    """Test that a response whose body cannot be streamed is released
+    and the error propagates."""
+    response = _response([b"data"])
+    response.stream.side_effect = OSError("connection reset")
+    repo = _repository(response)
+
+    with pytest.raises(OSError, match="connection reset"):
+        await repo.download_file_stream("file-1")
+
+    response.close.assert_called_once()
+    response.release_conn.assert_called_once()
@@ -0,0 +1,24 @@
+"""
+Tests for the connection pool built for shared Minio clients.
+"""
+
+from util.repos.minio.http_client import create_minio_http_client
+
+
+def test_pool_is_sized_from_concurrency() -> None:
+    """Test the pool keeps twice the concurrency, with a floor."""
+    small = create_minio_http_client(max_concurrency=4)
+    large = create_minio_http_client(max_concurrency=100)
+
+    assert small.connection_pool_kw["maxsize"] == 64
+    assert large.connection_pool_kw["maxsize"] == 200
+    assert large.connection_pool_kw["block"] is False
+
+
+def test_pool_uses_minio_default_retries() -> None:
+    """Test transient 5xx responses are retried as Minio does by default."""
+    pool = create_minio_http_client(max_concurrency=8)
+
+    retries = pool.connection_pool_kw["retries"]
+    assert retries.total == 5
+    assert 503 in retries.status_forcelist